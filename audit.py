@@ -17,23 +17,21 @@ try:
 except Exception:
     pass
 
-from engine.credit_engine import process_transcript
-from engine.cgpa_engine import process_cgpa
-from engine.audit_engine import run_audit, build_graduation_roadmap
-from engine.course_db import ALL_COURSES
-
 # ─── Color helpers (graceful fallback) ───────────────────
-try:
-    from colorama import init as colorama_init, Fore, Style
-    colorama_init(autoreset=True)
-    GREEN = Fore.GREEN
-    RED = Fore.RED
-    YELLOW = Fore.YELLOW
-    CYAN = Fore.CYAN
-    BOLD = Style.BRIGHT
-    RESET = Style.RESET_ALL
-except ImportError:
-    GREEN = RED = YELLOW = CYAN = BOLD = RESET = ""
+# colorama is only loaded for a terminal; piped or redirected output is plain
+GREEN = RED = YELLOW = CYAN = BOLD = RESET = ""
+if sys.stdout.isatty():
+    try:
+        from colorama import init as colorama_init, Fore, Style
+        colorama_init(autoreset=True)
+        GREEN = Fore.GREEN
+        RED = Fore.RED
+        YELLOW = Fore.YELLOW
+        CYAN = Fore.CYAN
+        BOLD = Style.BRIGHT
+        RESET = Style.RESET_ALL
+    except ImportError:
+        pass
 
 
 # ─── Formatting helpers ──────────────────────────────────
@@ -157,7 +155,10 @@ def print_prerequisite_violations(violations):
         sem = v["semester"]
         missing = ", ".join(v["missing"])
         print(f"    {color('!', RED)} {color(course, BOLD)} (taken in {sem})")
-        print(f"       Missing: {color(missing, YELLOW)}")
+        if missing:
+            print(f"       Missing: {color(missing, YELLOW)}")
+        if v.get("transitive"):
+            print(f"       Also not yet passed (earlier in chain): {color(', '.join(v['transitive']), YELLOW)}")
     print()
 
 def print_full_report(filepath, program, records, credits_attempted, credits_earned, cgpa_data, audit_result):
@@ -231,12 +232,13 @@ def print_graduation_roadmap(roadmap):
     gap = roadmap["credit_gap"]
     est_sem = roadmap["estimated_semesters"]
     est_courses = roadmap["estimated_courses_left"]
+    plan = roadmap["semester_plan"]
     print(f"\n  {color('Summary:', BOLD)}")
     if gap > 0:
         print(f"    Credits still needed  : {color(str(gap), RED)}")
     if est_courses > 0:
         print(f"    Courses to complete   : {est_courses}")
-    print(f"    Estimated semesters   : ~{est_sem} (at 15 credits/semester)")
+    print(f"    Estimated semesters   : {est_sem} (prerequisite-aware, up to {plan['max_credits']} credits/semester)")
 
     # Priority legend
     priority_colors = {
@@ -277,9 +279,265 @@ def print_graduation_roadmap(roadmap):
             else:
                 print(f"       {color(detail, YELLOW)}")
 
+    if plan["semesters"]:
+        print(f"\n  {color('Semester Plan:', BOLD)}")
+        for n, term in enumerate(plan["semesters"], 1):
+            load = sum(credits for _, credits in term)
+            print(f"    {n:>2}. {load:>2}cr  {', '.join(code for code, _ in term)}")
+
+    print()
+
+
+def print_concentration_comparison(comparison):
+    """Print the CONCENTRATION COMPARISON section (every BBA concentration, best first)."""
+    print(section_bar("CONCENTRATION COMPARISON"))
+    print(f"  {'#':>2}  {'Conc':<5}{'Major Area':<32}{'Left':>5}  {'CGPA':>5}  {'Sem':>3}  Eligible")
+    for n, row in enumerate(comparison["ranking"], 1):
+        cgpa = color(f"{row['concentration_cgpa']:5.2f}", GREEN if row["meets_cgpa"] else RED)
+        eligible = color("YES", GREEN) if row["eligible"] else color("NO", RED)
+        print(f"  {n:>2}. {row['concentration']:<5}{row['label']:<32}{row['remaining_credits']:>3}cr  "
+              f"{cgpa}  {row['projected_semesters']:>3}  {eligible}")
+    print(f"\n  Left: credits of the courses still required with that concentration.")
+    print(f"  CGPA: concentration CGPA (2.50 needed). Sem: projected semesters at 15 credits.")
     print()
 
 
+# ─── Pipeline ────────────────────────────────────────────
+
+def detect_program(filepath):
+    """Guess the program (CSE/BBA) from a transcript filename, or None."""
+    basename = os.path.basename(filepath)
+    for part in basename.replace(".csv", "").split("_"):
+        if part.upper() in ("CSE", "BBA"):
+            return part.upper()
+    return None
+
+
+def detect_concentration(filepath):
+    """Guess the BBA concentration from a transcript filename, or None."""
+    from engine.catalog import CONC_LABELS as VALID_CONCENTRATIONS
+    basename = os.path.basename(filepath)
+    parts = basename.replace(".csv", "").split("_")
+    for part in parts:
+        if part.upper() in VALID_CONCENTRATIONS:
+            return part.upper()
+    return None
+
+
+def run_pipeline(filepath, program, concentration=None, cache=None, all_concentrations=False):
+    """
+    Run Level 1 → Level 2 → Level 3 → roadmap on a single transcript.
+    Returns dict with: records, credits_attempted, credits_earned, cgpa_data,
+    audit_result, unrecognized. If the transcript contains unknown course codes,
+    cgpa_data and audit_result are None and unrecognized lists the codes.
+    See engine.pipeline.audit_transcript (one fused scan over the records).
+    With an engine.result_cache.ResultCache, unchanged transcripts are served from it.
+    all_concentrations adds the BBA concentration comparison ("concentrations").
+    """
+    if cache is not None:
+        return cache.audit(filepath, program, concentration)[0]
+    from engine.pipeline import audit_transcript
+    return audit_transcript(filepath, program, concentration, all_concentrations=all_concentrations)
+
+
+def print_fake_transcript(filepath, program, unrecognized):
+    """Print the abort notice for a transcript with unknown course codes."""
+    print(header_bar(f"NSU AUDIT REPORT - {program}"))
+    print(f"  Student Transcript : {os.path.basename(filepath)}")
+    print(f"\n  {color('!!! FAKE TRANSCRIPT DETECTED !!!', RED)}")
+    print(f"  Unrecognized Course Codes: {color(', '.join(unrecognized), RED)}")
+    print(f"  This transcript contains courses that do not exist in the NSU database.")
+    print(f"  {color('AUDIT ABORTED', RED)}")
+    print(f"  {'-' * 46}\n")
+
+
+def print_report(filepath, program, result, full_report=False):
+    """Print the normal or full report for a run_pipeline() result."""
+    report = print_full_report if full_report else print_normal_report
+    report(filepath, program, result["records"], result["credits_attempted"],
+           result["credits_earned"], result["cgpa_data"], result["audit_result"])
+
+
+# ─── Batch Mode ──────────────────────────────────────────
+
+def collect_batch_files(pattern):
+    """
+    Expand a directory or glob pattern into a sorted list of transcript paths.
+    A .zip / .tar(.gz) archive expands to its transcript members, in archive
+    order, addressed as "<archive>/<member>" (see engine.archive).
+    """
+    import glob
+    if os.path.isfile(pattern):
+        from engine.archive import is_archive, member_paths
+        if is_archive(pattern):
+            return member_paths(pattern)
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, "*.csv")
+    return sorted(p for p in glob.glob(pattern) if os.path.isfile(p))
+
+
+def _batch_worker(job):
+    """
+    Audit one transcript inside a pool worker and render its report to text.
+    The transcript is a file path, or a (student_id, rows, program, concentration)
+    tuple from a combined export (see engine.combined); the command-line program
+    and concentration take precedence over the export's columns.
+    Returns (filepath, report_text, elapsed_seconds, ok, cache_hit, summary) —
+    cache_hit is None when no cache is in use or the transcript was not audited;
+    summary is the engine.result_store row data when store_summary is set.
+    """
+    import io
+    import time
+    from contextlib import redirect_stdout
+
+    source, program, concentration, full_report, cache, store_summary = job
+    if isinstance(source, tuple):
+        filepath, transcript, source_program, source_concentration = source
+        program = program or source_program
+        concentration = concentration or source_concentration
+    else:
+        filepath = transcript = source
+    start = time.perf_counter()
+    buf = io.StringIO()
+    ok = True
+    hit = None
+    summary = None
+    with redirect_stdout(buf):
+        prog = program or detect_program(filepath)
+        if prog is None:
+            ok = False
+            print(color(f"Error: Cannot detect program for '{filepath}'.", RED))
+        else:
+            conc = concentration
+            if prog == "BBA" and conc is None:
+                conc = detect_concentration(filepath)
+            try:
+                if cache is None:
+                    result = run_pipeline(transcript, prog, conc)
+                else:
+                    result, hit = cache.audit(transcript, prog, conc)
+            except Exception as e:
+                ok = False
+                print(color(f"Error: Failed to audit '{filepath}': {e}", RED))
+            else:
+                if result["unrecognized"]:
+                    ok = False
+                    print_fake_transcript(filepath, prog, result["unrecognized"])
+                else:
+                    print_report(filepath, prog, result, full_report)
+                    if store_summary:
+                        from engine.result_store import summarise_result
+                        summary = summarise_result(filepath, prog, conc, result)
+    return filepath, buf.getvalue(), time.perf_counter() - start, ok, hit, summary
+
+
+def _percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    k = max(0, min(len(sorted_values) - 1, -(-len(sorted_values) * pct // 100) - 1))
+    return sorted_values[int(k)]
+
+
+def _bounded_imap(pool, fn, jobs, window):
+    """pool.imap() that keeps at most window jobs in flight, so a streamed job source is read lazily."""
+    from collections import deque
+    pending = deque()
+    for job in jobs:
+        pending.append(pool.apply_async(fn, (job,)))
+        if len(pending) >= window:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def run_batch(files, program, concentration, full_report, workers, cache=None, cache_stats=False,
+              store=None):
+    """
+    Audit many transcripts, printing each report in input order, then a throughput summary.
+    files is a list of paths, or any iterable of _batch_worker() transcripts (e.g.
+    students streamed from a combined export), which is consumed lazily.
+    With a ResultCache only changed transcripts are re-audited; the cache is trimmed
+    to its size cap afterwards. With a ResultStore every audited transcript's summary
+    is saved to it.
+    Returns the number of transcripts that could not be audited.
+    """
+    import time
+
+    jobs = ((f, program, concentration, full_report, cache, store is not None) for f in files)
+    latencies = []
+    failed = 0
+    hits = misses = 0
+
+    start = time.perf_counter()
+    if workers <= 1:
+        results = map(_batch_worker, jobs)
+        pool = None
+    else:
+        import multiprocessing
+        pool = multiprocessing.Pool(processes=workers)
+        if isinstance(files, list):
+            chunksize = max(1, len(files) // (workers * 8))
+            results = pool.imap(_batch_worker, jobs, chunksize=chunksize)
+        else:
+            results = _bounded_imap(pool, _batch_worker, jobs, workers * 16)
+
+    try:
+        for filepath, text, elapsed, ok, hit, summary in results:
+            sys.stdout.write(text)
+            if store is not None:
+                store.add(summary)
+            latencies.append(elapsed)
+            if not ok:
+                failed += 1
+            if hit:
+                hits += 1
+            elif hit is not None:
+                misses += 1
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        if store is not None:
+            store.flush()
+    wall = time.perf_counter() - start
+
+    latencies.sort()
+    print(header_bar("BATCH SUMMARY"))
+    print(f"  Transcripts        : {len(latencies)}")
+    print(f"  Audited            : {len(latencies) - failed}")
+    if failed:
+        print(f"  Failed / Aborted   : {color(str(failed), RED)}")
+    print(f"  Workers            : {workers}")
+    print(f"  Wall Time          : {wall:.2f}s")
+    print(f"  Throughput         : {len(latencies) / wall if wall > 0 else 0.0:.1f} transcripts/sec")
+    print(f"  Latency p50        : {_percentile(latencies, 50) * 1000:.2f} ms")
+    print(f"  Latency p95        : {_percentile(latencies, 95) * 1000:.2f} ms")
+    if store is not None:
+        print(f"  Stored             : {store.stored} → {store.path}")
+    print("=" * 50)
+    if cache is not None:
+        evicted = cache.trim()
+        if cache_stats:
+            print_cache_stats(cache, hits, misses, evicted)
+    return failed
+
+
+def print_cache_stats(cache, hits, misses, evicted):
+    """Print the --cache-stats hit/miss and size report."""
+    usage = cache.usage()
+    lookups = hits + misses
+    print(header_bar("CACHE STATS"))
+    print(f"  Directory          : {cache.directory}")
+    print(f"  Hits               : {hits}")
+    print(f"  Misses             : {misses}")
+    print(f"  Hit Rate           : {hits / lookups * 100 if lookups else 0.0:.1f}%")
+    print(f"  Evicted (LRU)      : {evicted}")
+    print(f"  Entries            : {usage['entries']}")
+    print(f"  Size               : {usage['bytes'] / 1048576:.1f} / {usage['max_bytes'] / 1048576:.1f} MB")
+    print("=" * 50)
+
+
 # ─── Main CLI ────────────────────────────────────────────
 
 def main():
@@ -290,15 +548,46 @@ def main():
 Examples:
   python audit.py transcript.csv CSE --normal-report
   python audit.py transcript.csv BBA --concentration FIN --full-report
+  python audit.py transcript.csv BBA --all-concentrations
+  python audit.py --batch transcripts/ --workers 8
+  python audit.py --batch "transcripts/*_BBA_*.csv" BBA --workers 4
+  python audit.py --batch transcripts/ --cache --cache-stats
+  python audit.py --batch transcripts/ --store results.db
+  python audit.py --combined registrar_export.csv --sorted --workers 8
+  python audit.py --batch transcripts_drop.tar.gz --workers 8
         """
     )
-    parser.add_argument("transcript", help="Path to transcript CSV file")
-    parser.add_argument("program", choices=["CSE", "BBA", "cse", "bba"],
-                        help="Program: CSE or BBA")
+    parser.add_argument("transcript", nargs="?", help="Path to transcript CSV file")
+    parser.add_argument("program", nargs="?", choices=["CSE", "BBA", "cse", "bba"],
+                        help="Program: CSE or BBA (auto-detected from filenames in batch mode)")
     parser.add_argument("--concentration", "-c",
                         choices=["ACT", "FIN", "MKT", "MGT", "HRM", "MIS", "SCM", "ECO", "INB",
                                  "act", "fin", "mkt", "mgt", "hrm", "mis", "scm", "eco", "inb"],
                         help="BBA concentration/major area")
+    parser.add_argument("--all-concentrations", action="store_true",
+                        help="BBA: also audit every concentration and rank them (single transcript)")
+    parser.add_argument("--batch", metavar="DIR|GLOB|ARCHIVE",
+                        help="Audit every transcript in a directory, matching a glob pattern, "
+                             "or inside a .zip / .tar.gz archive")
+    parser.add_argument("--combined", metavar="CSV",
+                        help="Audit every student in a combined export (one CSV with a student_id column)")
+    parser.add_argument("--sorted", action="store_true",
+                        help="The --combined export already has each student's rows together, e.g. sorted "
+                             "by student_id (stream it without sorting)")
+    parser.add_argument("--sort-buffer", type=int, default=200000, metavar="ROWS",
+                        help="Rows sorted in memory per run when sorting a --combined export (default: 200000)")
+    parser.add_argument("--workers", "-w", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes for --batch / --combined (default: CPU count)")
+    parser.add_argument("--cache", action="store_true",
+                        help="Reuse the audit results of unchanged transcripts from an on-disk cache")
+    parser.add_argument("--cache-dir", default=".audit_cache", metavar="DIR",
+                        help="Cache directory (default: .audit_cache)")
+    parser.add_argument("--cache-size", type=float, default=64, metavar="MB",
+                        help="Cache size cap; least-recently-used results are evicted (default: 64)")
+    parser.add_argument("--cache-stats", action="store_true",
+                        help="Print cache hit/miss statistics (implies --cache)")
+    parser.add_argument("--store", metavar="DB",
+                        help="Save each student's audit summary to an SQLite database")
     report_group = parser.add_mutually_exclusive_group(required=False)
     report_group.add_argument("--normal-report", action="store_true",
                               help="Show summary report only (default)")
@@ -306,77 +595,92 @@ Examples:
                               help="Show full course history + remaining courses")
 
     args = parser.parse_args()
-
-    # Validate file exists
-    if not os.path.isfile(args.transcript):
-        print(color(f"Error: File '{args.transcript}' not found.", RED))
-        sys.exit(1)
-
-    program = args.program.upper()
     concentration = args.concentration.upper() if args.concentration else None
 
-    # Auto-detect concentration from filename if not specified
-    if program == "BBA" and concentration is None:
-        from engine.audit_engine import VALID_CONCENTRATIONS
-        basename = os.path.basename(args.transcript)
-        parts = basename.replace(".csv", "").split("_")
-        for part in parts:
-            if part.upper() in VALID_CONCENTRATIONS:
-                concentration = part.upper()
-                break
-
-    # Level 1: Credit tallying
-    records, credits_attempted, credits_earned = process_transcript(args.transcript)
-
-    from engine.course_db import ALL_COURSES
-    unrecognized = set(r.course_code for r in records if r.course_code not in ALL_COURSES and r.grade not in ("W", "I"))
-    if unrecognized:
-        print(header_bar(f"NSU AUDIT REPORT - {program}"))
-        print(f"  Student Transcript : {os.path.basename(args.transcript)}")
-        print(f"\n  {color('!!! FAKE TRANSCRIPT DETECTED !!!', RED)}")
-        print(f"  Unrecognized Course Codes: {color(', '.join(unrecognized), RED)}")
-        print(f"  This transcript contains courses that do not exist in the NSU database.")
-        print(f"  {color('AUDIT ABORTED', RED)}")
-        print(f"  {'-' * 46}\n")
-        sys.exit(1)
-
-    # Level 2: CGPA calculation
-    cgpa_data = process_cgpa(records, program)
-
-    # Level 3: Audit / deficiency check
-    audit_result = run_audit(
-        records,
-        program,
-        cgpa_data["waivers"],
-        credits_earned,
-        cgpa_data["cgpa"],
-        cgpa_data.get("credit_reduction", 0),
-        concentration=concentration,
-    )
-
-    # Build graduation roadmap
-    major_cgpa_for_roadmap = 0.0
-    if program == "CSE":
-        major_cgpa_for_roadmap = audit_result.get("major_core_cgpa", 0.0)
-    else:
-        major_cgpa_for_roadmap = audit_result.get("core_cgpa", 0.0)
-
-    roadmap = build_graduation_roadmap(
-        program, records, credits_earned,
-        cgpa_data["cgpa"],
-        major_cgpa_for_roadmap,
-        audit_result,
-        cgpa_data["standing"],
-    )
-    audit_result["roadmap"] = roadmap
-
-    # Output
-    if args.full_report:
-        print_full_report(args.transcript, program, records, credits_attempted,
-                          credits_earned, cgpa_data, audit_result)
-    else:
-        print_normal_report(args.transcript, program, records, credits_attempted,
-                            credits_earned, cgpa_data, audit_result)
+    cache = None
+    if args.cache or args.cache_stats:
+        from engine.result_cache import ResultCache
+        cache = ResultCache(args.cache_dir, int(args.cache_size * 1024 * 1024))
+
+    store = None
+    if args.store:
+        from engine.result_store import ResultStore
+        store = ResultStore(args.store)
+
+    if args.batch or args.combined:
+        # In batch mode the only positional is the (optional) program
+        program = args.program or args.transcript
+        if program is not None and program.upper() not in ("CSE", "BBA"):
+            parser.error(f"invalid program for batch mode: '{program}' (choose CSE or BBA)")
+        if args.batch and args.combined:
+            parser.error("--batch and --combined cannot be used together")
+        if args.all_concentrations:
+            parser.error("--all-concentrations applies to a single transcript")
+        if args.batch:
+            files = collect_batch_files(args.batch)
+            if not files:
+                print(color(f"Error: No transcripts match '{args.batch}'.", RED))
+                sys.exit(1)
+        else:
+            if not os.path.isfile(args.combined):
+                print(color(f"Error: File '{args.combined}' not found.", RED))
+                sys.exit(1)
+            from engine.combined import iter_students
+            files = ((student_id, rows, prog, conc) for student_id, prog, conc, rows
+                     in iter_students(args.combined, args.sorted, args.sort_buffer))
+        try:
+            failed = run_batch(files, program.upper() if program else None, concentration,
+                               args.full_report, max(1, args.workers), cache, args.cache_stats, store)
+        except ValueError as e:
+            print(color(f"Error: {e}", RED))
+            sys.exit(1)
+        finally:
+            if store is not None:
+                store.close()
+        sys.exit(1 if failed else 0)
+
+    try:
+        if args.transcript is None or args.program is None:
+            parser.error("the following arguments are required: transcript, program")
+        if args.all_concentrations and (args.program.upper() != "BBA" or cache is not None):
+            parser.error("--all-concentrations needs a BBA transcript and cannot be used with --cache")
+
+        # Validate file exists (or is a transcript inside an archive)
+        from engine.archive import transcript_exists
+        if not transcript_exists(args.transcript):
+            print(color(f"Error: File '{args.transcript}' not found.", RED))
+            sys.exit(1)
+
+        program = args.program.upper()
+
+        # Auto-detect concentration from filename if not specified
+        if program == "BBA" and concentration is None:
+            concentration = detect_concentration(args.transcript)
+
+        if cache is None:
+            result = run_pipeline(args.transcript, program, concentration,
+                                  all_concentrations=args.all_concentrations)
+        else:
+            result, hit = cache.audit(args.transcript, program, concentration)
+            evicted = cache.trim()
+
+        if result["unrecognized"]:
+            print_fake_transcript(args.transcript, program, result["unrecognized"])
+        else:
+            # Output
+            print_report(args.transcript, program, result, args.full_report)
+            if "concentrations" in result:
+                print_concentration_comparison(result["concentrations"])
+            if store is not None:
+                from engine.result_store import summarise_result
+                store.add(summarise_result(args.transcript, program, concentration, result))
+        if args.cache_stats:
+            print_cache_stats(cache, int(hit), int(not hit), evicted)
+        if result["unrecognized"]:
+            sys.exit(1)
+    finally:
+        if store is not None:
+            store.close()
 
 
 if __name__ == "__main__":
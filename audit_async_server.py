@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+NSU Audit Server (asyncio) — event-loop front end with a process pool
+Same endpoints as audit_server.py, but connections live on one asyncio event
+loop (HTTP/1.1 keep-alive), so thousands of idle advisor connections cost a
+coroutine each rather than a thread, and the CPU-bound audit runs in a
+ProcessPoolExecutor:
+
+  POST /audit?program=CSE[&concentration=FIN][&report=normal|full][&format=json|text]
+  GET  /stats    request counts, coalescing, queue depth and latency percentiles
+  GET  /health
+
+  - Back-pressure: at most --pending audits are handed to the pool at once;
+    up to --queue more wait for a slot, beyond that requests get 503.
+  - Timeouts: a request still waiting after --timeout seconds gets 504. When
+    no request is waiting for an audit any more it is cancelled (if the pool
+    has not started it yet); a started audit keeps its pool slot until the
+    worker finishes it.
+  - Coalescing: identical in-flight requests (same query and transcript body)
+    share one audit, so a burst of refreshes for one student costs one run.
+  - ?path= is only served from inside --transcript-root (see audit_server.py);
+    without it transcripts must be sent as the request body.
+
+Usage:
+    python audit_async_server.py [--port 8766 | --socket /tmp/nsu_audit_async.sock]
+                                 [--processes N] [--pending N] [--queue N] [--timeout S]
+                                 [--transcript-root DIR]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import os
+import signal
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from urllib.parse import urlsplit
+
+from audit_server import ServerStats, RequestError, handle_audit
+
+_MAX_BODY = 1024 * 1024
+_MAX_HEADER = 16 * 1024
+
+
+def _audit_job(query, body, transcript_root=None):
+    """Pool worker: one POST /audit → (status, content_type, payload_bytes)."""
+    try:
+        return handle_audit(query, body, transcript_root)
+    except RequestError as e:
+        # RequestError does not survive pickling back to the parent; answer here
+        return e.status, "application/json", json.dumps({"error": str(e)}).encode("utf-8")
+    except Exception as e:
+        return 500, "application/json", json.dumps({"error": f"audit failed: {e}"}).encode("utf-8")
+
+
+def _warm_worker():
+    """Pool initializer: make sure the engine and catalog are loaded before the first job."""
+    import engine.pipeline  # noqa: F401
+
+
+def _json(status, doc):
+    return status, "application/json", json.dumps(doc).encode("utf-8")
+
+
+class AsyncAuditServer:
+    """asyncio HTTP front end that runs audits in a ProcessPoolExecutor."""
+
+    def __init__(self, processes=2, pending=None, queue_size=256, timeout=10.0,
+                 idle_timeout=300.0, verbose=False, transcript_root=None):
+        self.processes = processes
+        # Spawned, not forked: a worker forked from the event loop would inherit open
+        # client sockets and keep those connections from closing.
+        self.pool = ProcessPoolExecutor(max_workers=processes, initializer=_warm_worker,
+                                        mp_context=multiprocessing.get_context("spawn"))
+        self.slots = asyncio.Semaphore(pending or processes * 2)
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.verbose = verbose
+        self.transcript_root = transcript_root
+        self.stats = ServerStats()
+        self.inflight = {}  # request key → {"task": asyncio.Task, "waiters": int}
+        self.waiting = 0
+        self.connections = 0
+        self.coalesced = 0
+        self.timeouts = 0
+        self.cancelled = 0
+
+    # ── Audits ──
+
+    async def _run(self, query, body):
+        """Wait for a pool slot (back-pressure), then audit in a worker process."""
+        self.waiting += 1
+        try:
+            await self.slots.acquire()
+        finally:
+            self.waiting -= 1
+        loop = asyncio.get_running_loop()
+        try:
+            future = self.pool.submit(_audit_job, query, body, self.transcript_root)
+        except BaseException:
+            self.slots.release()
+            raise
+
+        # Cancelling this task cannot stop a job a worker has started, so the
+        # slot is held until the pool is done with it, keeping back-pressure.
+        def release(_, loop=loop):
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self.slots.release)
+        future.add_done_callback(release)
+        return await asyncio.wrap_future(future)
+
+    async def audit(self, query, body):
+        """
+        Audit one request, sharing the run with identical in-flight requests.
+        Returns (status, content_type, payload_bytes).
+        """
+        key = hashlib.sha256(query.encode() + b"\0" + body).digest()
+        job = self.inflight.get(key)
+        if job is None:
+            if self.waiting >= self.queue_size:
+                self.stats.reject()
+                return _json(503, {"error": "server overloaded"})
+            job = {"task": asyncio.ensure_future(self._run(query, body)), "waiters": 0}
+            self.inflight[key] = job
+
+            def forget(task, key=key, job=job):
+                if self.inflight.get(key) is job:
+                    del self.inflight[key]
+            job["task"].add_done_callback(forget)
+        else:
+            self.coalesced += 1
+
+        job["waiters"] += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(job["task"]), self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            return _json(504, {"error": f"audit timed out after {self.timeout:g}s"})
+        except BrokenProcessPool:
+            return _json(500, {"error": "audit worker pool is broken"})
+        finally:
+            job["waiters"] -= 1
+            if job["waiters"] == 0 and not job["task"].done():
+                # Nobody is waiting for this audit any more
+                job["task"].cancel()
+                self.cancelled += 1
+
+    def snapshot(self):
+        snap = self.stats.snapshot(self.waiting)
+        snap.update({
+            "connections": self.connections,
+            "in_flight_audits": len(self.inflight),
+            "coalesced": self.coalesced,
+            "timeouts": self.timeouts,
+            "cancelled": self.cancelled,
+        })
+        return snap
+
+    # ── HTTP ──
+
+    async def read_request(self, reader):
+        """Return (method, target, headers, body), or None when the client goes away."""
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.idle_timeout)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                asyncio.TimeoutError, ConnectionError):
+            return None
+        lines = head.decode("latin-1").split("\r\n")
+        parts = lines[0].split(" ")
+        if len(parts) != 3:
+            raise RequestError(400, "malformed request line")
+        headers = {}
+        for line in lines[1:]:
+            name, sep, value = line.partition(":")
+            if sep:
+                headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get("content-length") or 0)
+        except ValueError:
+            raise RequestError(400, "bad Content-Length")
+        if length < 0:
+            raise RequestError(400, "bad Content-Length")
+        if length > _MAX_BODY:
+            raise RequestError(413, "transcript too large")
+        try:
+            body = await asyncio.wait_for(reader.readexactly(length), self.idle_timeout) if length else b""
+        except asyncio.TimeoutError:
+            raise RequestError(408, "timed out reading the request body")
+        return parts[0], parts[1], headers, body
+
+    async def dispatch(self, method, target):
+        url = urlsplit(target)
+        if method == "GET" and url.path == "/stats":
+            return _json(200, self.snapshot())
+        if method == "GET" and url.path == "/health":
+            return _json(200, {"status": "ok"})
+        if url.path != "/audit":
+            return _json(404, {"error": f"no such endpoint '{url.path}'"})
+        if method != "POST":
+            return _json(405, {"error": "use POST /audit"})
+        return None
+
+    async def handle_connection(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    request = await self.read_request(reader)
+                except RequestError as e:
+                    await self.respond(writer, *_json(e.status, {"error": str(e)}), keep_alive=False)
+                    break
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                if request is None:
+                    break
+                method, target, headers, body = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+
+                response = await self.dispatch(method, target)
+                if response is None:
+                    self.stats.begin()
+                    start = time.perf_counter()
+                    status = 500
+                    try:
+                        response = await self.audit(urlsplit(target).query, body)
+                        status = response[0]
+                    finally:
+                        self.stats.end(status, time.perf_counter() - start)
+                if self.verbose:
+                    print(f"{method} {target} {response[0]}", file=sys.stderr)
+                await self.respond(writer, *response, keep_alive=keep_alive)
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def respond(self, writer, status, content_type, payload, keep_alive=True):
+        head = (f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + payload)
+        await writer.drain()
+
+    async def start_workers(self):
+        """Start every pool process (and load the engine in it) before accepting connections."""
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*[loop.run_in_executor(self.pool, _warm_worker)
+                               for _ in range(self.processes)])
+
+    async def serve(self, host="127.0.0.1", port=8766, socket_path=None):
+        await self.start_workers()
+        if socket_path:
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+            server = await asyncio.start_unix_server(self.handle_connection, socket_path,
+                                                     limit=_MAX_HEADER)
+            where = f"unix:{socket_path}"
+        else:
+            server = await asyncio.start_server(self.handle_connection, host, port,
+                                                limit=_MAX_HEADER, backlog=1024)
+            where = f"http://{host}:{server.sockets[0].getsockname()[1]}"
+        print(f"NSU async audit server listening on {where} "
+              f"({self.processes} processes)", flush=True)
+        stop = asyncio.get_running_loop().create_future()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            asyncio.get_running_loop().add_signal_handler(sig, stop.set_result, None)
+        async with server:
+            await stop
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        if socket_path and os.path.exists(socket_path):
+            os.remove(socket_path)
+
+
+# ─── Main CLI ────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="NSU Audit Server — asyncio front end with a process pool")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8766, help="TCP port (default: 8766)")
+    parser.add_argument("--socket", metavar="PATH", help="Serve on a Unix socket instead of TCP")
+    parser.add_argument("--processes", "-p", type=int, default=os.cpu_count() or 1,
+                        help="Audit worker processes (default: CPU count)")
+    parser.add_argument("--pending", type=int,
+                        help="Audits handed to the pool at once (default: 2 x processes)")
+    parser.add_argument("--queue", type=int, default=256,
+                        help="Audits allowed to wait for the pool before answering 503 (default: 256)")
+    parser.add_argument("--timeout", type=float, default=10.0,
+                        help="Seconds before a waiting request gets 504 (default: 10)")
+    parser.add_argument("--transcript-root", metavar="DIR",
+                        help="Allow ?path= requests for transcripts under DIR (default: body uploads only)")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Log every request")
+    args = parser.parse_args()
+    if args.transcript_root and not os.path.isdir(args.transcript_root):
+        parser.error(f"--transcript-root '{args.transcript_root}' is not a directory")
+
+    async def run():
+        server = AsyncAuditServer(max(1, args.processes), args.pending, max(0, args.queue),
+                                  args.timeout, verbose=args.verbose,
+                                  transcript_root=args.transcript_root)
+        await server.serve(args.host, args.port, args.socket)
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+NSU Audit Server — long-running audit daemon
+Keeps the engine and course catalog loaded and serves audits over localhost
+HTTP or a Unix socket, so callers no longer pay interpreter start-up and
+engine import per transcript.
+
+Endpoints:
+  POST /audit?program=CSE[&concentration=FIN][&report=normal|full][&format=json|text]
+       Body: the transcript CSV (?name= labels it in text reports). Or, when
+       the server runs with --transcript-root DIR, pass ?path=<file> to audit
+       a CSV under DIR (program/concentration are then detected from the
+       filename when omitted); paths resolving outside DIR are refused.
+  GET  /stats    request counts, queue depth and latency percentiles (JSON)
+  GET  /health   liveness check
+
+Requests are handled by a bounded worker pool; at most --queue further
+requests wait for a worker, beyond that the server answers 503.
+
+Usage:
+    python audit_server.py [--port 8765 | --socket /tmp/nsu_audit.sock]
+                           [--workers N] [--queue N] [--transcript-root DIR]
+
+    curl --data-binary @transcript.csv "http://127.0.0.1:8765/audit?program=CSE&format=text"
+    curl --unix-socket /tmp/nsu_audit.sock http://localhost/stats
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import re
+import signal
+import socketserver
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+import audit
+from engine.pipeline import audit_transcript
+from engine.catalog import CONC_LABELS
+
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+_LATENCY_WINDOW = 10000  # most recent requests kept for percentiles
+_MAX_BODY = 1024 * 1024
+
+
+# ─── Statistics ──────────────────────────────────────────
+
+class ServerStats:
+    """Thread-safe request counters and a sliding window of audit latencies."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.requests = 0
+        self.by_status = {}
+        self.rejected = 0
+        self.in_flight = 0
+        self.latencies = deque(maxlen=_LATENCY_WINDOW)
+
+    def begin(self):
+        with self.lock:
+            self.in_flight += 1
+
+    def end(self, status, elapsed):
+        with self.lock:
+            self.in_flight -= 1
+            self.requests += 1
+            self.by_status[status] = self.by_status.get(status, 0) + 1
+            self.latencies.append(elapsed)
+
+    def reject(self):
+        with self.lock:
+            self.rejected += 1
+
+    def snapshot(self, queued=0):
+        """Return dict with: uptime_s, requests, by_status, rejected, in_flight, queued, latency_ms."""
+        with self.lock:
+            latencies = sorted(self.latencies)
+            snap = {
+                "uptime_s": round(time.time() - self.started, 1),
+                "requests": self.requests,
+                "by_status": {str(k): v for k, v in sorted(self.by_status.items())},
+                "rejected": self.rejected,
+                "in_flight": self.in_flight,
+                "queued": queued,
+            }
+        snap["latency_ms"] = {
+            "p50": round(audit._percentile(latencies, 50) * 1000, 3),
+            "p95": round(audit._percentile(latencies, 95) * 1000, 3),
+            "p99": round(audit._percentile(latencies, 99) * 1000, 3),
+            "max": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+            "window": len(latencies),
+        }
+        return snap
+
+
+# ─── Audit Requests ──────────────────────────────────────
+
+class RequestError(Exception):
+    """A request the server refuses, with the HTTP status to answer."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# print_report() writes to sys.stdout, which redirect_stdout swaps process-wide
+_render_lock = threading.Lock()
+
+
+def render_text(filepath, program, result, full_report):
+    """The CLI report for a run_pipeline() result, without colour codes."""
+    buf = io.StringIO()
+    with _render_lock, redirect_stdout(buf):
+        if result["unrecognized"]:
+            audit.print_fake_transcript(filepath, program, sorted(result["unrecognized"]))
+        else:
+            audit.print_report(filepath, program, result, full_report)
+    return _ANSI_RE.sub("", buf.getvalue())
+
+
+def result_to_json(program, concentration, result, full_report):
+    """JSON-ready dict of a run_pipeline() result; the full report adds the course records."""
+    doc = {
+        "program": program,
+        "concentration": concentration,
+        "credits_attempted": result["credits_attempted"],
+        "credits_earned": result["credits_earned"],
+        "cgpa_data": result["cgpa_data"],
+        "audit_result": result["audit_result"],
+        "unrecognized": sorted(result["unrecognized"]),
+    }
+    if full_report:
+        doc["records"] = [
+            {"course_code": r.course_code, "course_name": r.course_name, "credits": r.credits,
+             "grade": r.grade, "semester": r.semester, "status": r.status}
+            for r in result["records"]
+        ]
+    return doc
+
+
+def parse_audit_params(query):
+    """Validate /audit query parameters. Returns dict with: path, name, program, concentration, full_report, fmt."""
+    params = {k: v[-1] for k, v in parse_qs(query).items()}
+    path = params.get("path")
+    program = (params.get("program") or "").upper() or None
+    if program is None and path:
+        program = audit.detect_program(path)
+    if program not in ("CSE", "BBA"):
+        raise RequestError(400, "program must be CSE or BBA")
+    concentration = (params.get("concentration") or "").upper() or None
+    if concentration is not None and concentration not in CONC_LABELS:
+        raise RequestError(400, f"unknown concentration '{concentration}'")
+    if program == "BBA" and concentration is None and path:
+        concentration = audit.detect_concentration(path)
+    report = params.get("report", "normal")
+    if report not in ("normal", "full"):
+        raise RequestError(400, "report must be normal or full")
+    fmt = params.get("format", "json")
+    if fmt not in ("json", "text"):
+        raise RequestError(400, "format must be json or text")
+    return {"path": path, "name": params.get("name") or "transcript.csv", "program": program, "concentration": concentration,
+            "full_report": report == "full", "fmt": fmt}
+
+
+def resolve_transcript_path(path, transcript_root):
+    """
+    Real path of a ?path= transcript, relative to transcript_root (absolute
+    paths must lie inside it). Raises RequestError when ?path= is disabled
+    (transcript_root is None), the path escapes the root or is not a file.
+    """
+    if transcript_root is None:
+        raise RequestError(403, "?path= is disabled on this server; send the transcript CSV as the request body")
+    root = os.path.realpath(transcript_root)
+    real = os.path.realpath(os.path.join(root, path))
+    if os.path.commonpath([root, real]) != root:
+        raise RequestError(403, "?path= must stay inside the server's transcript root")
+    if not os.path.isfile(real):
+        raise RequestError(404, f"file '{path}' not found")
+    return real
+
+
+def handle_audit(query, body, transcript_root=None):
+    """
+    Audit one transcript for POST /audit. ?path= is only served from inside
+    transcript_root (None: disabled, the body is the only source).
+    Returns (status, content_type, payload_bytes); raises RequestError for bad requests.
+    """
+    req = parse_audit_params(query)
+    if not req["path"]:
+        if not body:
+            raise RequestError(400, "send the transcript CSV as the request body")
+        try:
+            text = body.decode("utf-8-sig")
+        except UnicodeDecodeError:
+            raise RequestError(400, "transcript body must be UTF-8")
+
+    try:
+        if req["path"]:
+            filepath = req["path"]
+            source = resolve_transcript_path(req["path"], transcript_root)
+        else:
+            filepath = req["name"]
+            source = csv.reader(io.StringIO(text))
+        result = audit_transcript(source, req["program"], req["concentration"])
+    except (ValueError, IndexError, OverflowError) as e:
+        raise RequestError(400, f"malformed transcript: {e}")
+
+    status = 422 if result["unrecognized"] else 200
+    if req["fmt"] == "text":
+        text = render_text(filepath, req["program"], result, req["full_report"])
+        return status, "text/plain; charset=utf-8", text.encode("utf-8")
+    doc = result_to_json(req["program"], req["concentration"], result, req["full_report"])
+    return status, "application/json", json.dumps(doc).encode("utf-8")
+
+
+# ─── HTTP Server ─────────────────────────────────────────
+
+class AuditRequestHandler(BaseHTTPRequestHandler):
+    server_version = "NSUAudit/1.0"
+    timeout = 30  # one connection per request (HTTP/1.0); never let a slow client pin a worker
+
+    def address_string(self):
+        # Unix-socket peers have no (host, port) address
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def send_payload(self, status, content_type, payload):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def send_json(self, status, doc):
+        self.send_payload(status, "application/json", json.dumps(doc).encode("utf-8"))
+
+    def do_GET(self):
+        route = urlsplit(self.path).path
+        if route == "/stats":
+            self.send_json(200, self.server.stats.snapshot(self.server.queued()))
+        elif route == "/health":
+            self.send_json(200, {"status": "ok"})
+        else:
+            self.send_json(404, {"error": f"no such endpoint '{route}'"})
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != "/audit":
+            self.send_json(404, {"error": f"no such endpoint '{url.path}'"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.send_json(400, {"error": "bad Content-Length"})
+            self.close_connection = True
+            return
+        if length > _MAX_BODY:
+            self.send_json(413, {"error": "transcript too large"})
+            self.close_connection = True
+            return
+        body = self.rfile.read(length) if length else b""
+
+        stats = self.server.stats
+        stats.begin()
+        start = time.perf_counter()
+        try:
+            status, content_type, payload = handle_audit(url.query, body, self.server.transcript_root)
+        except RequestError as e:
+            status, content_type = e.status, "application/json"
+            payload = json.dumps({"error": str(e)}).encode("utf-8")
+        except Exception as e:
+            status, content_type = 500, "application/json"
+            payload = json.dumps({"error": f"audit failed: {e}"}).encode("utf-8")
+        stats.end(status, time.perf_counter() - start)
+        self.send_payload(status, content_type, payload)
+
+
+_BUSY_RESPONSE = (b"HTTP/1.0 503 Service Unavailable\r\nContent-Type: application/json\r\n"
+                  b"Retry-After: 1\r\nConnection: close\r\nContent-Length: 29\r\n\r\n"
+                  b'{"error": "server overloaded"}')
+
+
+class PooledServerMixin:
+    """
+    Hand each accepted connection to a fixed ThreadPoolExecutor instead of a new
+    thread. At most workers + queue_size connections are admitted; the rest get 503.
+    """
+
+    request_queue_size = 128  # listen() backlog, so bursts reach the admission check
+
+    def init_pool(self, workers, queue_size, verbose=False, transcript_root=None):
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="audit")
+        self.capacity = workers + queue_size
+        self.workers = workers
+        self.slots = threading.BoundedSemaphore(self.capacity)
+        self.admitted = 0
+        self.admitted_lock = threading.Lock()
+        self.stats = ServerStats()
+        self.verbose = verbose
+        self.transcript_root = transcript_root
+
+    def queued(self):
+        """Connections admitted but still waiting for a worker."""
+        with self.admitted_lock:
+            return max(0, self.admitted - self.workers)
+
+    def process_request(self, request, client_address):
+        if not self.slots.acquire(blocking=False):
+            self.stats.reject()
+            try:
+                request.sendall(_BUSY_RESPONSE)
+            except OSError:
+                pass
+            self.shutdown_request(request)
+            return
+        with self.admitted_lock:
+            self.admitted += 1
+        self.pool.submit(self._process_pooled, request, client_address)
+
+    def _process_pooled(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            with self.admitted_lock:
+                self.admitted -= 1
+            self.slots.release()
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown(wait=True)
+
+
+class AuditHTTPServer(PooledServerMixin, HTTPServer):
+    pass
+
+
+class AuditUnixServer(PooledServerMixin, socketserver.UnixStreamServer):
+    pass
+
+
+def make_server(port=8765, host="127.0.0.1", socket_path=None, workers=4, queue_size=64, verbose=False,
+                transcript_root=None):
+    """
+    Bind an audit server on host:port, or on a Unix socket when socket_path is given.
+    ?path= requests are served only from inside transcript_root (None: disabled).
+    """
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        server = AuditUnixServer(socket_path, AuditRequestHandler)
+    else:
+        server = AuditHTTPServer((host, port), AuditRequestHandler)
+    server.init_pool(workers, queue_size, verbose, transcript_root)
+    return server
+
+
+# ─── Main CLI ────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="NSU Audit Server — long-running audit daemon")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port (default: 8765)")
+    parser.add_argument("--socket", metavar="PATH", help="Serve on a Unix socket instead of TCP")
+    parser.add_argument("--workers", "-w", type=int, default=os.cpu_count() or 1,
+                        help="Worker threads (default: CPU count)")
+    parser.add_argument("--queue", type=int, default=64,
+                        help="Requests allowed to wait for a worker before answering 503 (default: 64)")
+    parser.add_argument("--transcript-root", metavar="DIR",
+                        help="Allow ?path= requests for transcripts under DIR (default: body uploads only)")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Log every request")
+    args = parser.parse_args()
+    if args.transcript_root and not os.path.isdir(args.transcript_root):
+        parser.error(f"--transcript-root '{args.transcript_root}' is not a directory")
+
+    server = make_server(args.port, args.host, args.socket, max(1, args.workers),
+                         max(0, args.queue), args.verbose, args.transcript_root)
+    where = f"unix:{args.socket}" if args.socket else f"http://{args.host}:{server.server_address[1]}"
+    print(f"NSU audit server listening on {where} ({max(1, args.workers)} workers)", flush=True)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if args.socket and os.path.exists(args.socket):
+            os.remove(args.socket)
+
+
+if __name__ == "__main__":
+    main()
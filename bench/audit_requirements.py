@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Requirement Evaluation Benchmark
+Times run_audit() with the compiled requirement bitmasks against the legacy
+set-based evaluation (bench/legacy_audit.py), per 10,000 transcripts, and
+checks that both produce identical results. Parsing and CGPA computation are
+done up front so only requirement evaluation is measured.
+
+Usage:
+    python bench/audit_requirements.py [transcripts_dir] [n_audits]
+"""
+
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.credit_engine import process_transcript
+from engine.cgpa_engine import process_cgpa
+from engine.audit_engine import run_audit, VALID_CONCENTRATIONS
+import legacy_audit
+
+
+def load_jobs(directory):
+    """Parse every transcript into the positional arguments run_audit() takes."""
+    jobs = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.csv"))):
+        base = os.path.basename(path).replace(".csv", "")
+        program = "CSE" if "_CSE" in base or base.lower().startswith("cse") else "BBA"
+        concentration = None
+        if program == "BBA":
+            for part in base.split("_"):
+                if part.upper() in VALID_CONCENTRATIONS:
+                    concentration = part.upper()
+                    break
+        records, _, earned = process_transcript(path)
+        cgpa_data = process_cgpa(records, program)
+        jobs.append((records, program, cgpa_data["waivers"], earned, cgpa_data["cgpa"],
+                     cgpa_data.get("credit_reduction", 0), concentration))
+    return jobs
+
+
+def time_audits(audit, jobs, n_audits):
+    """Run `audit` over the corpus (cycling) n_audits times; return elapsed seconds."""
+    n_jobs = len(jobs)
+    start = time.perf_counter()
+    for i in range(n_audits):
+        records, program, waivers, earned, cgpa, reduction, conc = jobs[i % n_jobs]
+        audit(records, program, waivers, earned, cgpa, reduction, concentration=conc)
+    return time.perf_counter() - start
+
+
+def main():
+    directory = sys.argv[1] if len(sys.argv) > 1 else "transcripts"
+    n_audits = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    jobs = load_jobs(directory)
+    if not jobs:
+        print(f"No transcripts found in '{directory}'.")
+        sys.exit(1)
+
+    mismatches = 0
+    for records, program, waivers, earned, cgpa, reduction, conc in jobs:
+        new = run_audit(records, program, waivers, earned, cgpa, reduction, concentration=conc)
+        old = legacy_audit.run_audit(records, program, waivers, earned, cgpa, reduction, concentration=conc)
+        if new != old:
+            mismatches += 1
+
+    legacy_s = time_audits(legacy_audit.run_audit, jobs, n_audits)
+    bitset_s = time_audits(run_audit, jobs, n_audits)
+    per_10k = 10000 / n_audits
+
+    print("=" * 60)
+    print("  REQUIREMENT EVALUATION BENCHMARK")
+    print("=" * 60)
+    print(f"  Corpus              : {directory} ({len(jobs)} transcripts)")
+    print(f"  Audits timed        : {n_audits:,}")
+    print(f"  Legacy (sets)       : {legacy_s * per_10k:8.3f} s / 10k transcripts")
+    print(f"  Bitmask             : {bitset_s * per_10k:8.3f} s / 10k transcripts"
+          f"  ({legacy_s / bitset_s:.2f}x)")
+    print(f"  Result mismatches   : {mismatches}")
+    print("=" * 60)
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
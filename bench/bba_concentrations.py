@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+BBA Concentration Comparison Benchmark
+Evaluates every concentration of each BBA transcript with
+engine.audit_engine.evaluate_bba_all_concentrations() and checks it against
+nine separate evaluate_bba() audits: every per-concentration result must be
+identical, remaining_credits must match the scheduler's course list and
+projected_semesters the roadmap's "Estimated semesters" for that
+concentration. Reports the per-student latency of the one-pass comparison,
+of the nine separate audits (with their roadmaps) and of a single audit;
+exits 1 on any mismatch.
+
+Usage:
+    python bench/bba_concentrations.py [dirs ...] [--repeat 3]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.audit_engine import (scan_records, evaluate_bba, evaluate_bba_all_concentrations,
+                                 build_graduation_roadmap, BBA_CONC_GROUPS)
+from engine.catalog import SENIOR_CREDITS
+from engine.pipeline import load_records, cgpa_from_scan
+from engine.scheduler import schedule_courses, _solve
+
+
+def audit_one(scan, cgpa_data, concentration):
+    """evaluate_bba() plus its roadmap, as audit_transcript() runs them."""
+    result = evaluate_bba(scan, cgpa_data["waivers"], scan["credits_earned"], cgpa_data["cgpa"],
+                          cgpa_data["credit_reduction"], concentration)
+    result["roadmap"] = build_graduation_roadmap("BBA", scan["gpa_records"], scan["credits_earned"],
+                                                 cgpa_data["cgpa"], result["core_cgpa"], result,
+                                                 cgpa_data["standing"])
+    return result
+
+
+def compare_all(scan, cgpa_data):
+    return evaluate_bba_all_concentrations(scan, cgpa_data["waivers"], scan["credits_earned"],
+                                           cgpa_data["cgpa"], cgpa_data["credit_reduction"])
+
+
+def best_of(fn, repeat):
+    """Fastest of repeat runs of fn(), each on a cold schedule cache."""
+    best = None
+    for _ in range(repeat):
+        _solve.cache_clear()
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="All BBA concentrations in one pass vs nine audits")
+    parser.add_argument("dirs", nargs="*", default=["transcripts", "test_scenarios"])
+    parser.add_argument("--repeat", type=int, default=3, help="Timing runs per student (best is kept)")
+    args = parser.parse_args()
+
+    paths = [p for d in args.dirs for p in sorted(glob.glob(os.path.join(d, "*.csv")))
+             if "BBA" in os.path.basename(p).upper()]
+    if not paths:
+        print(f"No BBA transcripts found in {args.dirs}.")
+        sys.exit(1)
+
+    students = []
+    for path in paths:
+        scan = scan_records(load_records(path), "BBA")
+        if not scan["unrecognized"]:
+            students.append((path, scan, cgpa_from_scan(scan, "BBA")))
+
+    bad = []
+    for path, scan, cgpa_data in students:
+        comparison = compare_all(scan, cgpa_data)
+        rows = {row["concentration"]: row for row in comparison["ranking"]}
+        for conc in BBA_CONC_GROUPS:
+            single = audit_one(scan, cgpa_data, conc)
+            roadmap = single.pop("roadmap")
+            row = rows[conc]
+            if comparison["results"][conc] != single:
+                bad.append((path, conc, "result"))
+            courses = schedule_courses("BBA", single["remaining"], SENIOR_CREDITS)
+            if row["remaining_credits"] != sum(credits for _, credits in courses):
+                bad.append((path, conc, "remaining_credits"))
+            if row["projected_semesters"] != roadmap["estimated_semesters"]:
+                bad.append((path, conc, "projected_semesters"))
+            if row["concentration_cgpa"] != single["concentration_cgpa"]:
+                bad.append((path, conc, "concentration_cgpa"))
+
+    timings = {"one pass (9 concentrations)": [], "9 separate audits": [], "1 audit": []}
+    for path, scan, cgpa_data in students:
+        timings["one pass (9 concentrations)"].append(
+            best_of(lambda: compare_all(scan, cgpa_data), args.repeat))
+        timings["9 separate audits"].append(
+            best_of(lambda: [audit_one(scan, cgpa_data, conc) for conc in BBA_CONC_GROUPS], args.repeat))
+        timings["1 audit"].append(best_of(lambda: audit_one(scan, cgpa_data, None), args.repeat))
+
+    print("=" * 80)
+    print(f"  BBA students: {len(students)}   concentrations checked: {len(students) * len(BBA_CONC_GROUPS)}"
+          f"   mismatches: {len(bad)}")
+    for label, times in timings.items():
+        times.sort()
+        n = len(times)
+        print(f"    {label:28s} mean {sum(times) / n * 1e3:.3f} ms   p50 {times[n // 2] * 1e3:.3f} ms   "
+              f"p99 {times[int(n * 0.99)] * 1e3:.3f} ms")
+    for case in bad[:10]:
+        print(f"    MISMATCH {case}")
+    print("=" * 80)
+    sys.exit(1 if bad else 0)
+
+
+if __name__ == "__main__":
+    main()
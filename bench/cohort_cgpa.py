@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Cohort CGPA / Credits Benchmark
+Checks engine.cohort's vectorised batch_calculate_credits(),
+batch_compute_cgpa() and batch_compute_major_cgpa() against the per-student
+engine (calculate_credits, compute_cgpa, compute_major_cgpa) for every
+transcript, then times both on the real corpus and on a synthetic cohort of
+--synthetic students resampled (with replacement) from it. Parsing and retake
+resolution are done up front, so only the totals are timed.
+
+Usage:
+    python bench/cohort_cgpa.py [dirs ...] [--synthetic 200000] [--seed 7]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from engine.catalog import GROUPS
+from engine.credit_engine import parse_transcript, resolve_retakes, calculate_credits, Transcript
+from engine.cgpa_engine import compute_cgpa, compute_major_cgpa
+from engine.cohort import (build_cohort, batch_calculate_credits, batch_compute_cgpa,
+                           batch_compute_major_cgpa)
+
+CSE_MAJOR = list(GROUPS["CSE_MAJOR_CORE"])
+BBA_CORE = list(GROUPS["BBA_SCHOOL_CORE"]) + list(GROUPS["BBA_CORE"])
+
+
+def per_student(records_list):
+    """The per-student engine: [(attempted, earned, cgpa, qp, gpa_credits, cse_major, bba_core)]."""
+    out = []
+    for records in records_list:
+        attempted, earned = calculate_credits(records)
+        cgpa, qp, gpa_cr = compute_cgpa(records)
+        out.append((attempted, earned, cgpa, qp, gpa_cr,
+                    compute_major_cgpa(records, CSE_MAJOR), compute_major_cgpa(records, BBA_CORE)))
+    return out
+
+
+def vectorised(cohort):
+    """Same totals as per_student(), as arrays over the cohort."""
+    attempted, earned = batch_calculate_credits(cohort)
+    cgpa, qp, gpa_cr = batch_compute_cgpa(cohort)
+    return (attempted, earned, cgpa, qp, gpa_cr,
+            batch_compute_major_cgpa(cohort, CSE_MAJOR), batch_compute_major_cgpa(cohort, BBA_CORE))
+
+
+def mismatches(expected, columns):
+    """Indexes of students whose vectorised totals differ from the per-student engine."""
+    bad = []
+    for i, row in enumerate(expected):
+        if any(float(col[i]) != float(value) for col, value in zip(columns, row)):
+            bad.append(i)
+    return bad
+
+
+def best_time(fn, arg, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(label, n, t_engine, t_vector):
+    print(f"  {label:<24}{n:>8} students   engine {t_engine * 1000:9.1f} ms   "
+          f"vectorised {t_vector * 1000:8.1f} ms   speed-up {t_engine / t_vector:6.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vectorised cohort totals vs the per-student engine")
+    parser.add_argument("dirs", nargs="*", default=["transcripts", "test_scenarios"])
+    parser.add_argument("--synthetic", type=int, default=200000, help="Synthetic cohort size")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    paths = [p for d in args.dirs for p in sorted(glob.glob(os.path.join(d, "*.csv")))]
+    if not paths:
+        print(f"No transcripts found in {args.dirs}.")
+        sys.exit(1)
+    records_list = [resolve_retakes(parse_transcript(p)) for p in paths]
+    transcripts = [Transcript.from_records(records) for records in records_list]
+    cohort = build_cohort(transcripts)
+
+    bad = mismatches(per_student(records_list), vectorised(cohort))
+    print(f"  Verified {len(paths)} transcripts against the per-student engine: {len(bad)} mismatches")
+    for i in bad[:10]:
+        print(f"    MISMATCH {paths[i]}")
+
+    print("=" * 100)
+    report("corpus", len(paths), best_time(per_student, records_list, args.repeat),
+           best_time(vectorised, cohort, args.repeat))
+
+    if args.synthetic:
+        picks = np.random.default_rng(args.seed).integers(0, len(paths), args.synthetic)
+        synth_records = [records_list[i] for i in picks]
+        synth_cohort = build_cohort([transcripts[i] for i in picks])
+        t_engine = best_time(per_student, synth_records, 1)
+        t_vector = best_time(vectorised, synth_cohort, args.repeat)
+        report("synthetic (resampled)", args.synthetic, t_engine, t_vector)
+        sample = np.random.default_rng(args.seed + 1).integers(0, args.synthetic, 2000)
+        cols = vectorised(synth_cohort)
+        expected = per_student([synth_records[i] for i in sample])
+        synth_bad = mismatches(expected, [col[sample] for col in cols])
+        print(f"  Synthetic spot-check of {len(sample)} students: {len(synth_bad)} mismatches")
+        bad += synth_bad
+    print("=" * 100)
+    sys.exit(1 if bad else 0)
+
+
+if __name__ == "__main__":
+    main()
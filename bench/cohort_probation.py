@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Cohort Probation Timeline Benchmark
+Checks engine.cohort's vectorised batch_probation_timeline() against
+iter_probation_timeline() / calculate_probation_history() for every
+transcript — every (student, semester) CGPA, consecutive-probation count and
+standing — then times both on the real corpus and on a synthetic cohort of
+--synthetic students resampled (with replacement) from it. Parsing and retake
+resolution are done up front, so only the timelines are timed.
+
+Usage:
+    python bench/cohort_probation.py [dirs ...] [--synthetic 200000] [--seed 7]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from engine.credit_engine import parse_transcript, resolve_retakes, Transcript
+from engine.cgpa_engine import iter_probation_timeline, calculate_probation_history
+from engine.cohort import build_cohort, batch_probation_timeline
+
+
+def per_student(records_list):
+    """The per-student engine: final (standing, consecutive probation count) per student."""
+    return [calculate_probation_history(records) for records in records_list]
+
+
+def mismatches(records_list, timeline, indexes):
+    """Positions in indexes whose vectorised timeline differs from iter_probation_timeline()."""
+    column = {sem: c for c, sem in enumerate(timeline["semesters"])}
+    labels = timeline["standing_labels"]
+    bad = []
+    for pos, i in enumerate(indexes):
+        expected = {column[str(snap["semester"])]: snap for snap in iter_probation_timeline(records_list[pos])}
+        ok = sorted(expected) == list(np.flatnonzero(timeline["standing"][i] >= 0))
+        for c, snap in expected.items():
+            ok = ok and (timeline["cgpa"][i, c] == snap["cgpa"]
+                         and timeline["consecutive_p"][i, c] == min(snap["consecutive_p"], 127)
+                         and labels[timeline["standing"][i, c]] == snap["standing"])
+        standing, p_count = calculate_probation_history(records_list[pos])
+        ok = ok and (timeline["final_consecutive_p"][i] == p_count
+                     and labels[timeline["final_standing"][i]] == standing)
+        if not ok:
+            bad.append(pos)
+    return bad
+
+
+def best_time(fn, arg, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(label, n, t_engine, t_vector):
+    print(f"  {label:<24}{n:>8} students   engine {t_engine * 1000:9.1f} ms   "
+          f"vectorised {t_vector * 1000:8.1f} ms   speed-up {t_engine / t_vector:6.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vectorised probation timelines vs the per-student engine")
+    parser.add_argument("dirs", nargs="*", default=["transcripts", "test_scenarios"])
+    parser.add_argument("--synthetic", type=int, default=200000, help="Synthetic cohort size")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    paths = [p for d in args.dirs for p in sorted(glob.glob(os.path.join(d, "*.csv")))]
+    if not paths:
+        print(f"No transcripts found in {args.dirs}.")
+        sys.exit(1)
+    records_list = [resolve_retakes(parse_transcript(p)) for p in paths]
+    transcripts = [Transcript.from_records(records) for records in records_list]
+    cohort = build_cohort(transcripts)
+    timeline = batch_probation_timeline(cohort)
+
+    bad = mismatches(records_list, timeline, range(len(paths)))
+    print(f"  Verified {len(paths)} transcripts ({len(timeline['semesters'])} semesters) "
+          f"against the per-student engine: {len(bad)} mismatches")
+    for i in bad[:10]:
+        print(f"    MISMATCH {paths[i]}")
+
+    print("=" * 100)
+    report("corpus", len(paths), best_time(per_student, records_list, args.repeat),
+           best_time(batch_probation_timeline, cohort, args.repeat))
+
+    if args.synthetic:
+        picks = np.random.default_rng(args.seed).integers(0, len(paths), args.synthetic)
+        synth_records = [records_list[i] for i in picks]
+        synth_cohort = build_cohort([transcripts[i] for i in picks])
+        t_engine = best_time(per_student, synth_records, 1)
+        t_vector = best_time(batch_probation_timeline, synth_cohort, args.repeat)
+        report("synthetic (resampled)", args.synthetic, t_engine, t_vector)
+        sample = np.random.default_rng(args.seed + 1).integers(0, args.synthetic, 2000)
+        synth_bad = mismatches([synth_records[i] for i in sample],
+                               batch_probation_timeline(synth_cohort), sample)
+        print(f"  Synthetic spot-check of {len(sample)} students: {len(synth_bad)} mismatches")
+        bad += synth_bad
+    print("=" * 100)
+    sys.exit(1 if bad else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Graduation Scheduler Benchmark
+Plans the remaining courses of every non-eligible transcript with
+engine.scheduler.plan_semesters(), layered and exact, for each --caps credit
+cap, and checks every plan: each course scheduled exactly once, no term over
+the cap, every remaining prerequisite in an earlier term, _SENIOR_ courses
+only once SENIOR_CREDITS are earned, and the count no lower than the lower
+bound. Reports how often the layered plan is already minimal, the per-plan
+latency of both modes (cold cache) and the cache hit rate of a second pass;
+exits 1 on any invalid plan.
+
+Usage:
+    python bench/graduation_scheduler.py [dirs ...] [--caps 12 15 18]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import catalog
+from engine.catalog import SENIOR, SENIOR_CREDITS
+from engine.pipeline import audit_transcript
+from engine.scheduler import plan_semesters, schedule_courses, _solve
+
+
+def problems(program, plan, courses, credits_earned):
+    """Rule violations of a plan for the given courses (empty when valid)."""
+    prereqs = catalog.PREREQUISITES[program]
+    required = {code for code, _ in courses}
+    found = []
+    scheduled = sorted(course for term in plan["semesters"] for course in term)
+    if scheduled != sorted(courses):
+        found.append("courses scheduled do not match the courses left")
+    cap = max([plan["max_credits"]] + [credits for _, credits in courses])
+    done, earned = set(), credits_earned
+    for n, term in enumerate(plan["semesters"], 1):
+        load = sum(credits for _, credits in term)
+        if load > cap and len(term) > 1:
+            found.append(f"term {n}: {load} credits over the cap")
+        for code, _ in term:
+            for r in prereqs.get(code, ()):
+                if r == SENIOR and earned < SENIOR_CREDITS:
+                    found.append(f"term {n}: {code} before {SENIOR_CREDITS} credits")
+                elif r in required and r not in done:
+                    found.append(f"term {n}: {code} before {r}")
+        done.update(code for code, _ in term)
+        earned += load
+    if plan["count"] < plan["lower_bound"]:
+        found.append("count below the lower bound")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Graduation scheduler: validity, optimality and latency")
+    parser.add_argument("dirs", nargs="*", default=["transcripts", "test_scenarios"])
+    parser.add_argument("--caps", type=int, nargs="+", default=[12, 15, 18],
+                        help="Per-term credit caps to plan for")
+    args = parser.parse_args()
+
+    paths = [p for d in args.dirs for p in sorted(glob.glob(os.path.join(d, "*.csv")))]
+    if not paths:
+        print(f"No transcripts found in {args.dirs}.")
+        sys.exit(1)
+
+    cases = []
+    for path in paths:
+        program = "CSE" if "CSE" in os.path.basename(path).upper() else "BBA"
+        result = audit_transcript(path, program)
+        audit_result = result["audit_result"]
+        if not audit_result["eligible"]:
+            cases.append((path, program, audit_result["remaining"], result["credits_earned"],
+                          audit_result["roadmap"]["credit_gap"]))
+
+    print("=" * 80)
+    bad = []
+    for cap in args.caps:
+        latency = {False: [], True: []}
+        minimal = proven = shorter = 0
+        for path, program, remaining, earned, gap in cases:
+            plans = {}
+            for exact in (False, True):
+                _solve.cache_clear()
+                start = time.perf_counter()
+                plans[exact] = plan_semesters(program, remaining, earned, gap, cap, exact=exact)
+                latency[exact].append(time.perf_counter() - start)
+            courses = schedule_courses(program, remaining, earned, gap)
+            for plan in plans.values():
+                bad += [(path, cap, p) for p in problems(program, plan, courses, earned)]
+            minimal += plans[False]["count"] == plans[True]["count"]
+            proven += plans[True]["optimal"]
+            shorter += plans[True]["count"] < plans[False]["count"]
+
+        _solve.cache_clear()
+        for path, program, remaining, earned, gap in cases:
+            plan_semesters(program, remaining, earned, gap, cap)
+        first = _solve.cache_info()
+        for path, program, remaining, earned, gap in cases:
+            plan_semesters(program, remaining, earned, gap, cap)
+        second = _solve.cache_info()
+
+        print(f"  Cap {cap:2d} credits: {len(cases)} plans   layered minimal {minimal}   "
+              f"exact shorter {shorter}   proven optimal {proven}")
+        for exact, times in latency.items():
+            times.sort()
+            n = len(times)
+            print(f"    {'exact  ' if exact else 'layered'}  mean {sum(times) / n * 1e3:.3f} ms   "
+                  f"p50 {times[n // 2] * 1e3:.3f} ms   p99 {times[int(n * 0.99)] * 1e3:.3f} ms   "
+                  f"max {times[-1] * 1e3:.3f} ms")
+        print(f"    cache: {first.misses} distinct profiles, second pass "
+              f"{second.hits - first.hits}/{len(cases)} hits")
+    print(f"  Invalid plans: {len(bad)}")
+    for case in bad[:10]:
+        print(f"    INVALID {case}")
+    print("=" * 80)
+    sys.exit(1 if bad else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,379 @@
+"""
+Legacy set-based requirement evaluation (audit_cse / audit_bba as they were
+before the curriculum was compiled into bitmasks). Kept only as the baseline
+for bench/audit_requirements.py; it reads the live requirement tables so the
+two implementations always audit the same curriculum.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.cgpa_engine import compute_major_cgpa
+from engine.audit_engine import (
+    check_prerequisite_violations,
+    CSE_MAJOR_CORE, CSE_CAPSTONE, CSE_SEPS_CORE, CSE_GED_REQUIRED,
+    CSE_GED_CHOICE_1, CSE_GED_CHOICE_2, CSE_GED_CHOICE_3, CSE_GED_WAIVABLE,
+    CSE_TOTAL_CREDITS, CSE_MIN_CGPA, CSE_MAJOR_CORE_CGPA, CSE_MAJOR_ELECTIVE_CGPA,
+    CSE_ELECTIVE_CREDITS, CSE_OPEN_ELECTIVE_CREDITS, CSE_ALL_CORE,
+    BBA_SCHOOL_CORE, BBA_CORE, BBA_GED, BBA_GED_WAIVABLE,
+    BBA_GED_CHOICE_LANG, BBA_GED_CHOICE_HIS, BBA_GED_CHOICE_POL, BBA_GED_CHOICE_SOC,
+    BBA_GED_CHOICE_SCI, BBA_GED_CHOICE_LAB, BBA_INTERNSHIP,
+    BBA_TOTAL_CREDITS, BBA_MIN_CGPA, BBA_CORE_CGPA, BBA_CONCENTRATION_CGPA,
+    BBA_FREE_ELECTIVE_CREDITS, BBA_ALL_CORE, BBA_CONCENTRATIONS,
+)
+
+
+def _get_passed_courses(records):
+    """Return set of course codes that the student has passed (BEST or WAIVED status)."""
+    passed = set()
+    for r in records:
+        if r.status in ("BEST", "WAIVED") and r.grade not in ("F", "I", "W"):
+            passed.add(r.course_code)
+    return passed
+
+
+def _find_missing(required_dict, passed_set):
+    """Return dict of {course: credits} for courses not yet passed."""
+    return {c: cr for c, cr in required_dict.items() if c not in passed_set}
+
+
+def _check_choice_group(choice_dict, passed_set):
+    """Check if at least one course from a choice group is passed. Return missing info."""
+    for c in choice_dict:
+        if c in passed_set:
+            return {}  # satisfied
+    return choice_dict  # none passed — return all options
+
+
+def audit_cse(records, waivers, credits_earned, cgpa, credit_reduction=0):
+    """
+    Perform CSE program audit (130-credit curriculum).
+    Returns dict with: eligible, reasons, remaining_by_category, major_cgpa
+    """
+    passed = _get_passed_courses(records)
+    remaining = {}
+    reasons = []
+    total_required = CSE_TOTAL_CREDITS - credit_reduction
+
+    # CSE Major Core (42cr) — remove waived courses
+    core_to_check = dict(CSE_MAJOR_CORE)
+    missing_core = _find_missing(core_to_check, passed)
+    if missing_core:
+        remaining["CSE Major Core"] = missing_core
+
+    # Capstone + Engineering Economics (7cr)
+    missing_cap = _find_missing(CSE_CAPSTONE, passed)
+    if missing_cap:
+        remaining["Capstone"] = missing_cap
+
+    # SEPS Core (41cr)
+    seps_to_check = dict(CSE_SEPS_CORE)
+    missing_seps = _find_missing(seps_to_check, passed)
+    if missing_seps:
+        remaining["SEPS Core"] = missing_seps
+
+    # GED required (fixed courses)
+    missing_ged = _find_missing(CSE_GED_REQUIRED, passed)
+    if missing_ged:
+        remaining["GED Required"] = missing_ged
+
+    # GED choice groups
+    missing_c1 = _check_choice_group(CSE_GED_CHOICE_1, passed)
+    if missing_c1:
+        remaining["GED Choice (ECO101 or ECO104)"] = missing_c1
+
+    missing_c2 = _check_choice_group(CSE_GED_CHOICE_2, passed)
+    if missing_c2:
+        remaining["GED Choice (POL101 or POL104)"] = missing_c2
+
+    missing_c3 = _check_choice_group(CSE_GED_CHOICE_3, passed)
+    if missing_c3:
+        remaining["GED Choice (SOC101/ANT101/ENV203/GEO205)"] = missing_c3
+
+    # Waivable courses (ENG102, MAT112)
+    waivable_remaining = {}
+    for course, cr in CSE_GED_WAIVABLE.items():
+        if not waivers.get(course, False) and course not in passed:
+            waivable_remaining[course] = cr
+    if waivable_remaining:
+        remaining["Waivable Courses"] = waivable_remaining
+
+    # Electives (CSE 400-level) — count passed CSE 4xx courses not in core
+    cse_400_electives = [c for c in passed
+                         if c.startswith("CSE4") and c not in CSE_MAJOR_CORE and c not in CSE_CAPSTONE]
+    elective_credits = sum(3 for _ in cse_400_electives)  # assume 3 each
+    if elective_credits < CSE_ELECTIVE_CREDITS:
+        needed = (CSE_ELECTIVE_CREDITS - elective_credits) // 3
+        remaining["CSE Electives (400-level)"] = {f"Any CSE 4xx ({needed} needed)": CSE_ELECTIVE_CREDITS - elective_credits}
+
+    # Open electives — any courses not already counted
+    all_required_codes = (set(CSE_ALL_CORE.keys()) |
+                          set(CSE_CAPSTONE.keys()) |
+                          set(CSE_GED_REQUIRED.keys()) |
+                          set(CSE_GED_CHOICE_1.keys()) |
+                          set(CSE_GED_CHOICE_2.keys()) |
+                          set(CSE_GED_CHOICE_3.keys()) |
+                          set(CSE_GED_WAIVABLE.keys()))
+    counted_open = set()
+    open_elec_credits = 0
+    for r in records:
+        if (r.course_code not in all_required_codes and
+            r.course_code not in counted_open and
+            not (r.course_code.startswith("CSE4") and r.course_code not in CSE_MAJOR_CORE and r.course_code not in CSE_CAPSTONE) and
+            r.status in ("BEST", "WAIVED") and r.credits > 0 and
+            r.grade not in ("F", "I", "W")):
+            open_elec_credits += r.credits
+            counted_open.add(r.course_code)
+
+    if open_elec_credits < CSE_OPEN_ELECTIVE_CREDITS:
+        needed_cr = CSE_OPEN_ELECTIVE_CREDITS - open_elec_credits
+        remaining["Open Electives"] = {f"Any courses ({needed_cr} credits needed)": needed_cr}
+
+    # Major Core CGPA — based on CSE Major Core courses
+    major_core_codes = list(CSE_MAJOR_CORE.keys())
+    major_core_cgpa = compute_major_cgpa(records, major_core_codes)
+
+    # Major Elective CGPA — based on CSE 400-level electives
+    elective_codes = [c for c in passed
+                      if c.startswith("CSE4") and c not in CSE_MAJOR_CORE and c not in CSE_CAPSTONE]
+    major_elective_cgpa = compute_major_cgpa(records, elective_codes) if elective_codes else 0.0
+
+    # Graduation eligibility checks
+    eligible = True
+
+    if credits_earned < total_required:
+        eligible = False
+        reasons.append(f"Credits earned ({credits_earned}) < {total_required} required")
+
+    if cgpa < CSE_MIN_CGPA:
+        eligible = False
+        reasons.append(f"Overall CGPA ({cgpa:.2f}) < {CSE_MIN_CGPA:.2f}")
+
+    if major_core_cgpa < CSE_MAJOR_CORE_CGPA:
+        eligible = False
+        reasons.append(f"Major Core CGPA ({major_core_cgpa:.2f}) < {CSE_MAJOR_CORE_CGPA:.2f}")
+
+    if elective_codes and major_elective_cgpa < CSE_MAJOR_ELECTIVE_CGPA:
+        eligible = False
+        reasons.append(f"Major Elective CGPA ({major_elective_cgpa:.2f}) < {CSE_MAJOR_ELECTIVE_CGPA:.2f}")
+
+    # Check for unauthorized retakes
+    for r in records:
+        if r.status == "UNAUTHORIZED-RETAKE":
+            eligible = False
+            reasons.append(f"Invalid course: Unauthorized retake of {r.course_code} ({r.grade} in {r.semester})")
+
+    if remaining:
+        eligible = False
+        total_missing = sum(len(v) for v in remaining.values())
+        reasons.append(f"{total_missing} required course(s) still missing")
+
+    result = {
+        "eligible": eligible,
+        "reasons": reasons,
+        "remaining": remaining,
+        "major_core_cgpa": major_core_cgpa,
+        "major_elective_cgpa": major_elective_cgpa,
+        "total_credits_required": total_required,
+    }
+    
+    # ── Prerequisites ──
+    result["prereq_violations"] = check_prerequisite_violations("CSE", records, waivers)
+
+    return result
+
+
+def audit_bba(records, waivers, credits_earned, cgpa, credit_reduction=0, concentration=None):
+    """
+    Perform BBA program audit — Curriculum 143 and Onwards.
+    concentration: one of ACT/FIN/MKT/MGT/HRM/MIS/SCM/ECO/INB (or None)
+    Returns dict with: eligible, reasons, remaining_by_category, cgpa info
+    """
+    passed = _get_passed_courses(records)
+    remaining = {}
+    reasons = []
+    total_required = BBA_TOTAL_CREDITS - credit_reduction
+
+    if not concentration:
+        reasons.append("Major/Concentration not yet declared")
+    
+    # School Core (7 courses / 21 credits)
+    missing_school = _find_missing(BBA_SCHOOL_CORE, passed)
+    if missing_school:
+        remaining["School Core"] = missing_school
+
+    # BBA Core (12 courses / 36 credits)
+    missing_core = _find_missing(BBA_CORE, passed)
+    if missing_core:
+        remaining["BBA Core"] = missing_core
+
+    # GED fixed courses (ENG103, ENG105, PHI401)
+    missing_ged = _find_missing(BBA_GED, passed)
+    if missing_ged:
+        remaining["GED"] = missing_ged
+
+    # GED Choice: Language (BEN205/ENG115/CHN101 — pick 1)
+    missing_lang = _check_choice_group(BBA_GED_CHOICE_LANG, passed)
+    if missing_lang:
+        remaining["GED Choice (Language)"] = missing_lang
+
+    # GED Choice: History (HIS101/102/103/HIS205 — pick 2)
+    his_passed = [c for c in BBA_GED_CHOICE_HIS if c in passed]
+    his_needed = 2 - len(his_passed)
+    if his_needed > 0:
+        his_options = {c: cr for c, cr in BBA_GED_CHOICE_HIS.items() if c not in passed}
+        remaining[f"GED Choice (History, pick {his_needed})"] = his_options
+
+    # GED Choice: Political Science (POL101/POL104/PAD201 — pick 1)
+    missing_pol = _check_choice_group(BBA_GED_CHOICE_POL, passed)
+    if missing_pol:
+        remaining["GED Choice (Political Science)"] = missing_pol
+
+    # GED Choice: Social Science (SOC101/GEO205/ANT101 — pick 1)
+    missing_soc = _check_choice_group(BBA_GED_CHOICE_SOC, passed)
+    if missing_soc:
+        remaining["GED Choice (Social Science)"] = missing_soc
+
+    # GED Choice: Science (BIO103/ENV107/PBH101/PSY101/PHY107/CHE101 — pick 3)
+    sci_passed = [c for c in BBA_GED_CHOICE_SCI if c in passed]
+    sci_needed = 3 - len(sci_passed)
+    if sci_needed > 0:
+        sci_options = {c: cr for c, cr in BBA_GED_CHOICE_SCI.items() if c not in passed}
+        remaining[f"GED Choice (Science, pick {sci_needed})"] = sci_options
+
+    # GED Choice: Lab (pick 1 matching lab or 3cr alternative)
+    lab_passed = [c for c in BBA_GED_CHOICE_LAB if c in passed]
+    if len(lab_passed) == 0:
+        remaining["GED Choice (Lab)"] = dict(BBA_GED_CHOICE_LAB)
+
+    # Waivable courses (ENG102 3cr, BUS112 3cr)
+    waivable_remaining = {}
+    for course, cr in BBA_GED_WAIVABLE.items():
+        if not waivers.get(course, False) and course not in passed:
+            waivable_remaining[course] = cr
+    if waivable_remaining:
+        remaining["GED Waivable"] = waivable_remaining
+
+    # Internship
+    missing_intern = _find_missing(BBA_INTERNSHIP, passed)
+    if missing_intern:
+        remaining["Internship"] = missing_intern
+
+    # ── Concentration courses (18cr: 4 required + 2 elective) ──
+    conc_label = "Undeclared"
+    conc_all_codes = []
+    if concentration and concentration.upper() in BBA_CONCENTRATIONS:
+        conc_key = concentration.upper()
+        conc_req, conc_elec, conc_label = BBA_CONCENTRATIONS[conc_key]
+
+        # Required concentration courses
+        missing_conc_req = _find_missing(conc_req, passed)
+        if missing_conc_req:
+            remaining[f"{conc_label} Required"] = missing_conc_req
+
+        # Elective concentration courses (need 2 from pool)
+        elec_passed = [c for c in conc_elec if c in passed]
+        elec_needed = 2 - len(elec_passed)
+        if elec_needed > 0:
+            elec_options = {c: cr for c, cr in conc_elec.items() if c not in passed}
+            remaining[f"{conc_label} Elective (pick {elec_needed})"] = elec_options
+
+        # All concentration course codes for CGPA computation
+        conc_all_codes = list(conc_req.keys()) + [c for c in conc_elec if c in passed]
+    else:
+        conc_all_codes = []
+
+    # Free Electives (3 courses / 9 credits)
+    conc_code_set = set(conc_all_codes)
+    all_required_codes = (set(BBA_SCHOOL_CORE.keys()) |
+                          set(BBA_CORE.keys()) |
+                          set(BBA_GED.keys()) |
+                          set(BBA_GED_CHOICE_LANG.keys()) |
+                          set(BBA_GED_CHOICE_HIS.keys()) |
+                          set(BBA_GED_CHOICE_POL.keys()) |
+                          set(BBA_GED_CHOICE_SOC.keys()) |
+                          set(BBA_GED_CHOICE_SCI.keys()) |
+                          set(BBA_GED_CHOICE_LAB.keys()) |
+                          set(BBA_GED_WAIVABLE.keys()) |
+                          set(BBA_INTERNSHIP.keys()) |
+                          conc_code_set)
+    counted_open = set()
+    free_elec_credits = 0
+    for r in records:
+        if (r.course_code not in all_required_codes and
+            r.course_code not in counted_open and
+            r.status in ("BEST", "WAIVED") and r.credits > 0 and
+            r.grade not in ("F", "I", "W")):
+            free_elec_credits += r.credits
+            counted_open.add(r.course_code)
+
+
+
+
+    if free_elec_credits < BBA_FREE_ELECTIVE_CREDITS:
+        needed_cr = BBA_FREE_ELECTIVE_CREDITS - free_elec_credits
+        remaining["Free Electives"] = {f"Any courses ({needed_cr} credits needed)": needed_cr}
+
+    # School & BBA Core CGPA (combined 19 courses / 57 credits)
+    core_codes = list(BBA_ALL_CORE.keys())
+    core_cgpa = compute_major_cgpa(records, core_codes)
+
+    # Concentration/Major Area CGPA
+    if conc_all_codes:
+        concentration_cgpa = compute_major_cgpa(records, conc_all_codes)
+    else:
+        concentration_cgpa = core_cgpa  # fallback if no concentration specified
+
+    # Eligibility checks
+    eligible = True
+
+    if credits_earned < total_required:
+        eligible = False
+        reasons.append(f"Credits earned ({credits_earned}) < {total_required} required")
+
+    if cgpa < BBA_MIN_CGPA:
+        eligible = False
+        reasons.append(f"Overall CGPA ({cgpa:.2f}) < {BBA_MIN_CGPA:.2f}")
+
+    if core_cgpa < BBA_CORE_CGPA:
+        eligible = False
+        reasons.append(f"School & BBA Core CGPA ({core_cgpa:.2f}) < {BBA_CORE_CGPA:.2f}")
+
+    if concentration_cgpa < BBA_CONCENTRATION_CGPA:
+        eligible = False
+        reasons.append(f"Concentration CGPA ({concentration_cgpa:.2f}) < {BBA_CONCENTRATION_CGPA:.2f}")
+
+    # Check for unauthorized retakes
+    for r in records:
+        if r.status == "UNAUTHORIZED-RETAKE":
+            eligible = False
+            reasons.append(f"Invalid course: Unauthorized retake of {r.course_code} ({r.grade} in {r.semester})")
+
+    if remaining:
+        eligible = False
+        total_missing = sum(len(v) for v in remaining.values())
+        reasons.append(f"{total_missing} required course(s) still missing")
+
+    result = {
+        "eligible": eligible,
+        "reasons": reasons,
+        "remaining": remaining,
+        "core_cgpa": core_cgpa,
+        "concentration_cgpa": concentration_cgpa,
+        "concentration_label": conc_label,
+        "total_credits_required": total_required,
+    }
+    
+    # ── Prerequisites ──
+    result["prereq_violations"] = check_prerequisite_violations("BBA", records, waivers)
+
+    return result
+
+
+def run_audit(records, program, waivers, credits_earned, cgpa, credit_reduction=0, concentration=None):
+    """Dispatch to the legacy program audit."""
+    if program.upper() == "CSE":
+        return audit_cse(records, waivers, credits_earned, cgpa, credit_reduction)
+    return audit_bba(records, waivers, credits_earned, cgpa, credit_reduction, concentration)
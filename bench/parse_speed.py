@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Parse Throughput Micro-Benchmark
+Reports records/sec for parse_transcript (and the full process_transcript,
+which adds the sort) over a transcript corpus, alongside the legacy
+uncompiled-regex normalisation and the hit rates of the normalisation LRUs.
+
+Usage:
+    python bench/parse_speed.py [transcripts_dir] [repeats]
+"""
+
+import csv
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.credit_engine import (parse_transcript, process_transcript,
+                                  normalize_semester, normalize_course_code)
+from record_memory import LegacyCourseRecord
+
+
+def legacy_parse_transcript(filepath):
+    """parse_transcript() as it was before the memoised normalisation layer."""
+    records = []
+    with open(filepath, "r", encoding="utf-8-sig") as f:
+        for row in csv.reader(f):
+            if not row or len(row) < 5:
+                continue
+            if row[0].strip().lower() == "course_code":
+                continue
+            records.append(LegacyCourseRecord(row[0], row[1], row[2], row[3], row[4]))
+    return records
+
+
+def best_of(fn, files, repeats):
+    """Run fn over every file `repeats` times; return (best seconds, records per pass)."""
+    best = None
+    n_records = 0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        n_records = 0
+        for path in files:
+            result = fn(path)
+            n_records += len(result[0] if isinstance(result, tuple) else result)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, n_records
+
+
+def main():
+    directory = sys.argv[1] if len(sys.argv) > 1 else "transcripts"
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    files = sorted(glob.glob(os.path.join(directory, "*.csv")))
+    if not files:
+        print(f"No transcripts found in '{directory}'.")
+        sys.exit(1)
+
+    normalize_semester.cache_clear()
+    normalize_course_code.cache_clear()
+
+    legacy_s, n = best_of(legacy_parse_transcript, files, repeats)
+    parse_s, _ = best_of(parse_transcript, files, repeats)
+    process_s, _ = best_of(process_transcript, files, repeats)
+
+    sem_info = normalize_semester.cache_info()
+    code_info = normalize_course_code.cache_info()
+
+    print("=" * 60)
+    print("  PARSE THROUGHPUT BENCHMARK")
+    print("=" * 60)
+    print(f"  Corpus                 : {directory} ({len(files)} files, {n} records)")
+    print(f"  Legacy parse           : {n / legacy_s:10,.0f} records/sec")
+    print(f"  parse_transcript       : {n / parse_s:10,.0f} records/sec  ({legacy_s / parse_s:.2f}x)")
+    print(f"  process_transcript     : {n / process_s:10,.0f} records/sec")
+    print(f"  Semester LRU           : {sem_info.hits} hits / {sem_info.misses} misses"
+          f" ({sem_info.currsize}/{sem_info.maxsize} entries)")
+    print(f"  Course code LRU        : {code_info.hits} hits / {code_info.misses} misses"
+          f" ({code_info.currsize}/{code_info.maxsize} entries)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
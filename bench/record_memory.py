@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Record Memory Benchmark
+Measures bytes per course attempt over a transcript corpus for:
+  - the legacy CourseRecord (per-instance __dict__, no string interning)
+  - the current __slots__ CourseRecord with interned strings
+  - the columnar Transcript container
+
+Usage:
+    python bench/record_memory.py [transcripts_dir]
+"""
+
+import csv
+import glob
+import gc
+import os
+import re
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.catalog import ALL_COURSES
+from engine.credit_engine import CourseRecord, Transcript, resolve_retakes
+
+
+class LegacyCourseRecord:
+    """The CourseRecord layout before __slots__/interning, kept as the baseline."""
+
+    def __init__(self, course_code, course_name, credits, grade, semester):
+        raw_code = course_code.strip().upper()
+        self.course_code = re.sub(r'\s+', '', raw_code)
+        self.course_name = course_name.strip()
+        raw_sem = semester.strip()
+        sem_match = re.match(r'(Spring|Summer|Fall|Spr|Sum|Fal)[\s\'-]*(\d{2,4})', raw_sem, re.IGNORECASE)
+        if sem_match:
+            term = sem_match.group(1).capitalize()
+            if term == 'Spr': term = 'Spring'
+            elif term == 'Sum': term = 'Summer'
+            elif term == 'Fal': term = 'Fall'
+            year_str = sem_match.group(2)
+            if len(year_str) == 2:
+                year_str = "20" + year_str
+            self.semester = f"{term}{year_str}"
+        else:
+            self.semester = raw_sem
+        parsed_credits = int(float(credits.strip()))
+        if self.course_code in ALL_COURSES:
+            self.credits = ALL_COURSES[self.course_code][1]
+        else:
+            self.credits = parsed_credits
+        self.grade = grade.strip().upper()
+        self.status = ""
+
+
+def load_rows(directory):
+    """Read every transcript's raw CSV rows (outside the measured region)."""
+    transcripts = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.csv"))):
+        with open(path, "r", encoding="utf-8-sig") as f:
+            rows = [row for row in csv.reader(f)
+                    if row and len(row) >= 5 and row[0].strip().lower() != "course_code"]
+        transcripts.append(rows)
+    return transcripts
+
+
+def measure(build):
+    """Return (result, bytes still allocated by build()) using tracemalloc."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def main():
+    directory = sys.argv[1] if len(sys.argv) > 1 else "transcripts"
+    transcripts = load_rows(directory)
+    n_rows = sum(len(rows) for rows in transcripts)
+    if n_rows == 0:
+        print(f"No transcript rows found in '{directory}'.")
+        sys.exit(1)
+
+    def build(cls):
+        return [[cls(*row[:5]) for row in rows] for rows in transcripts]
+
+    _, legacy_bytes = measure(lambda: build(LegacyCourseRecord))
+    slotted, slotted_bytes = measure(lambda: build(CourseRecord))
+    for records in slotted:
+        resolve_retakes(records)
+    _, columnar_bytes = measure(lambda: [Transcript.from_records(r) for r in slotted])
+
+    print("=" * 60)
+    print("  COURSE RECORD MEMORY BENCHMARK")
+    print("=" * 60)
+    print(f"  Corpus              : {directory} ({len(transcripts)} transcripts, {n_rows} rows)")
+    print(f"  Legacy (__dict__)   : {legacy_bytes / n_rows:8.1f} bytes/record")
+    print(f"  __slots__ + intern  : {slotted_bytes / n_rows:8.1f} bytes/record"
+          f"  ({legacy_bytes / slotted_bytes:.1f}x smaller)")
+    print(f"  Columnar Transcript : {columnar_bytes / n_rows:8.1f} bytes/record"
+          f"  ({legacy_bytes / columnar_bytes:.1f}x smaller)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Retake Planner Benchmark
+Times engine.retake_planner.plan_retakes() over transcript corpora for every
+objective and a range of budgets (courses and/or credits), and checks the
+plans of every --check-every'th transcript, for several target grades,
+against brute-force enumeration of all retake sets (when there are at most
+--max-brute candidates). Reports mismatches, candidate counts and per-plan
+latency; exits 1 on any mismatch.
+
+Usage:
+    python bench/retake_planner.py [dirs ...] [--check-every 20] [--max-brute 10]
+"""
+
+import argparse
+import glob
+import itertools
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.pipeline import load_records
+from engine.retake_planner import (plan_retakes, retake_candidates, major_codes_for, _scores,
+                                   OBJECTIVES)
+
+COURSE_BUDGETS = (None, 1, 3, 5)
+CREDIT_BUDGETS = (None, 6, 12)
+TARGET_GRADES = ("A", "B", "C+")
+
+
+def subsets(candidates, scores):
+    """(courses, credits, score) of every subset of the candidates."""
+    out = [(0, 0, 0)]
+    for (_, _, credits, _, _), score in zip(candidates, scores):
+        out += [(k + 1, c + credits, s + score) for k, c, s in out]
+    return out
+
+
+def brute_force(all_subsets, max_courses, max_credits):
+    """Best packed score over every subset within the budget."""
+    return max(s for k, c, s in all_subsets
+               if (max_courses is None or k <= max_courses) and (max_credits is None or c <= max_credits))
+
+
+def packed_score(plan, candidates, scores):
+    chosen = set(plan["courses"])
+    return sum(s for c, s in zip(candidates, scores) if c[:3] in chosen)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Retake planner: exactness and latency")
+    parser.add_argument("dirs", nargs="*", default=["transcripts", "test_scenarios"])
+    parser.add_argument("--check-every", type=int, default=20,
+                        help="Brute-force check every Nth transcript (0: none)")
+    parser.add_argument("--max-brute", type=int, default=10,
+                        help="Brute-force check plans with at most this many candidates")
+    args = parser.parse_args()
+
+    paths = [p for d in args.dirs for p in sorted(glob.glob(os.path.join(d, "*.csv")))]
+    if not paths:
+        print(f"No transcripts found in {args.dirs}.")
+        sys.exit(1)
+
+    budgets = list(itertools.product(COURSE_BUDGETS, CREDIT_BUDGETS))
+    latencies, bad, checked, most = [], [], 0, 0
+    for n, path in enumerate(paths):
+        program = "CSE" if "CSE" in os.path.basename(path).upper() else "BBA"
+        records = load_records(path)
+        for objective in OBJECTIVES:
+            for max_courses, max_credits in budgets:
+                start = time.perf_counter()
+                plan_retakes(records, program, max_courses, max_credits, "B", objective)
+                latencies.append(time.perf_counter() - start)
+
+        if not args.check_every or n % args.check_every:
+            continue
+        major_codes = major_codes_for(program)
+        for target in TARGET_GRADES:
+            candidates, totals = retake_candidates(records, target, major_codes)
+            most = max(most, len(candidates))
+            if len(candidates) > args.max_brute:
+                continue
+            for objective in OBJECTIVES:
+                scores = _scores(candidates, objective, totals["gpa_credits"], totals["major_gpa_credits"])
+                all_subsets = subsets(candidates, scores)
+                for max_courses, max_credits in budgets:
+                    plan = plan_retakes(records, program, max_courses, max_credits, target, objective)
+                    checked += 1
+                    if packed_score(plan, candidates, scores) != brute_force(all_subsets, max_courses, max_credits):
+                        bad.append((path, target, objective, max_courses, max_credits))
+
+    latencies.sort()
+    n = len(latencies)
+    print("=" * 80)
+    print(f"  Plans timed        : {n} over {len(paths)} transcripts")
+    print(f"  Brute-force checked: {checked} plans (up to {most} candidates seen)   mismatches: {len(bad)}")
+    print(f"  Latency per plan   : mean {sum(latencies) / n * 1e3:.3f} ms   "
+          f"p50 {latencies[n // 2] * 1e3:.3f} ms   p99 {latencies[int(n * 0.99)] * 1e3:.3f} ms   "
+          f"max {latencies[-1] * 1e3:.3f} ms")
+    for case in bad[:10]:
+        print(f"    MISMATCH {case}")
+    print("=" * 80)
+    sys.exit(1 if bad else 0)
+
+
+if __name__ == "__main__":
+    main()
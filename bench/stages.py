@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Per-Stage Pipeline Benchmark
+Times every stage of an audit over transcript corpora (default: transcripts/
+and test_scenarios/):
+
+  parse_transcript → resolve_retakes → sort_records → calculate_credits →
+  process_cgpa → calculate_probation_history → run_audit →
+  build_graduation_roadmap → report rendering
+
+plus the fused engine.pipeline.audit_transcript for comparison.
+process_cgpa already runs calculate_probation_history, so that stage is also
+timed on its own but left out of the per-transcript totals and shares. Each
+transcript is run --repeat times and the fastest run of every stage is kept.
+Reports per-stage totals, per-transcript percentiles and peak traced memory,
+and writes the results as JSON.
+
+With --baseline, compares against an earlier JSON result and exits 1 when any
+stage's total is more than --threshold (fractional) slower.
+
+Usage:
+    python bench/stages.py [dirs ...] [--repeat N] [--out results.json]
+                           [--baseline old.json] [--threshold 0.20]
+"""
+
+import argparse
+import glob
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from timeit import default_timer as timer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import audit
+from engine.credit_engine import parse_transcript, resolve_retakes, sort_records, calculate_credits
+from engine.cgpa_engine import process_cgpa, calculate_probation_history
+from engine.audit_engine import run_audit, build_graduation_roadmap
+from engine.pipeline import audit_transcript
+
+STAGES = [
+    "parse_transcript", "resolve_retakes", "sort_records", "calculate_credits",
+    "process_cgpa", "calculate_probation_history", "run_audit",
+    "build_graduation_roadmap", "render_report",
+]
+FUSED = "audit_transcript (fused)"
+# Stages that also run inside an earlier stage: timed, but not summed
+NESTED = {"calculate_probation_history": "process_cgpa"}
+SUMMED = [name for name in STAGES if name not in NESTED]
+
+
+def collect_jobs(dirs):
+    """[(path, program, concentration)] for every transcript whose program can be detected."""
+    jobs = []
+    for directory in dirs:
+        for path in sorted(glob.glob(os.path.join(directory, "*.csv"))):
+            program = audit.detect_program(path)
+            if program is None:
+                continue
+            conc = audit.detect_concentration(path) if program == "BBA" else None
+            jobs.append((path, program, conc))
+    return jobs
+
+
+def run_stages(path, program, conc, times):
+    """Run the staged audit once, storing each stage's seconds in times."""
+    t = timer()
+    records = parse_transcript(path)
+    times["parse_transcript"] = timer() - t
+
+    t = timer()
+    resolve_retakes(records)
+    times["resolve_retakes"] = timer() - t
+
+    t = timer()
+    sort_records(records)
+    times["sort_records"] = timer() - t
+
+    t = timer()
+    credits_attempted, credits_earned = calculate_credits(records)
+    times["calculate_credits"] = timer() - t
+
+    t = timer()
+    cgpa_data = process_cgpa(records, program)
+    times["process_cgpa"] = timer() - t
+
+    t = timer()
+    calculate_probation_history(records)
+    times["calculate_probation_history"] = timer() - t
+
+    t = timer()
+    audit_result = run_audit(records, program, cgpa_data["waivers"], credits_earned,
+                             cgpa_data["cgpa"], cgpa_data.get("credit_reduction", 0),
+                             concentration=conc)
+    times["run_audit"] = timer() - t
+
+    major_cgpa = audit_result.get("major_core_cgpa" if program == "CSE" else "core_cgpa", 0.0)
+    t = timer()
+    audit_result["roadmap"] = build_graduation_roadmap(
+        program, records, credits_earned, cgpa_data["cgpa"], major_cgpa,
+        audit_result, cgpa_data["standing"])
+    times["build_graduation_roadmap"] = timer() - t
+
+    result = {
+        "records": records,
+        "credits_attempted": credits_attempted,
+        "credits_earned": credits_earned,
+        "cgpa_data": cgpa_data,
+        "audit_result": audit_result,
+        "unrecognized": set(),
+    }
+    t = timer()
+    with redirect_stdout(io.StringIO()):
+        audit.print_report(path, program, result, full_report=True)
+    times["render_report"] = timer() - t
+
+    t = timer()
+    audit_transcript(path, program, conc)
+    times[FUSED] = timer() - t
+
+
+def time_corpus(jobs, repeat):
+    """{stage: [best seconds per transcript]} over the corpus."""
+    best = {name: [float("inf")] * len(jobs) for name in STAGES + [FUSED]}
+    times = {}
+    for _ in range(repeat):
+        for i, job in enumerate(jobs):
+            run_stages(*job, times)
+            for name, seconds in times.items():
+                if seconds < best[name][i]:
+                    best[name][i] = seconds
+    return best
+
+
+class _PeakRecorder(dict):
+    """
+    Stand-in for the times dict passed to run_stages(): as each stage stores
+    its time, record that stage's tracemalloc peak and reset it for the next.
+    """
+
+    def __init__(self, peaks):
+        super().__init__()
+        self.peaks = peaks
+        self.start()
+
+    def start(self):
+        tracemalloc.reset_peak()
+        self.base = tracemalloc.get_traced_memory()[0]
+
+    def __setitem__(self, name, seconds):
+        peak = tracemalloc.get_traced_memory()[1] - self.base
+        self.peaks[name] = max(self.peaks[name], peak)
+        super().__setitem__(name, seconds)
+        self.start()
+
+
+def peak_memory(jobs):
+    """({stage: peak traced KiB of one call}, whole-run peak KiB) from one traced pass."""
+    peaks = {name: 0 for name in STAGES + [FUSED]}
+    tracemalloc.start()
+    overall = 0
+    recorder = _PeakRecorder(peaks)
+    for job in jobs:
+        recorder.start()
+        run_stages(*job, recorder)
+        overall = max(overall, tracemalloc.get_traced_memory()[0])
+    overall = max(overall, max(peaks.values()))
+    tracemalloc.stop()
+    return {name: b / 1024 for name, b in peaks.items()}, overall / 1024
+
+
+def summarise(jobs, best, peaks, overall_peak, repeat, dirs):
+    stages = {}
+    for name in STAGES + [FUSED]:
+        values = sorted(best[name])
+        total = sum(values)
+        stages[name] = {
+            "total_s": total,
+            "mean_ms": total / len(values) * 1000,
+            "p50_ms": audit._percentile(values, 50) * 1000,
+            "p95_ms": audit._percentile(values, 95) * 1000,
+            "p99_ms": audit._percentile(values, 99) * 1000,
+            "peak_kib": peaks[name],
+        }
+    per_transcript = sorted(sum(best[name][i] for name in SUMMED) for i in range(len(jobs)))
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "corpus": dirs,
+            "transcripts": len(jobs),
+            "repeat": repeat,
+        },
+        "stages": stages,
+        "per_transcript": {
+            "total_s": sum(per_transcript),
+            "p50_ms": audit._percentile(per_transcript, 50) * 1000,
+            "p95_ms": audit._percentile(per_transcript, 95) * 1000,
+            "p99_ms": audit._percentile(per_transcript, 99) * 1000,
+            "max_ms": per_transcript[-1] * 1000,
+        },
+        "peak_memory_kib": overall_peak,
+    }
+
+
+def print_summary(results):
+    meta = results["meta"]
+    staged_total = results["per_transcript"]["total_s"]
+    print("=" * 86)
+    print("  PIPELINE STAGE BENCHMARK")
+    print("=" * 86)
+    print(f"  Corpus : {', '.join(meta['corpus'])} ({meta['transcripts']} transcripts,"
+          f" best of {meta['repeat']})")
+    print(f"  {'Stage':<28}{'Total s':>9}{'Share':>8}{'Mean ms':>9}{'p50 ms':>9}"
+          f"{'p95 ms':>9}{'p99 ms':>9}{'Peak KiB':>10}")
+    print("  " + "-" * 84)
+    for name, s in results["stages"].items():
+        share = f"{s['total_s'] / staged_total * 100:6.1f}%" if name in SUMMED else "      -"
+        print(f"  {name:<28}{s['total_s']:>9.3f}{share:>8}{s['mean_ms']:>9.3f}{s['p50_ms']:>9.3f}"
+              f"{s['p95_ms']:>9.3f}{s['p99_ms']:>9.3f}{s['peak_kib']:>10.1f}")
+    pt = results["per_transcript"]
+    print("  " + "-" * 84)
+    for name, parent in NESTED.items():
+        print(f"  {name} runs inside {parent}: shown on its own, not in the shares or totals")
+    print(f"  Per transcript (all stages): p50 {pt['p50_ms']:.3f} ms | p95 {pt['p95_ms']:.3f} ms"
+          f" | p99 {pt['p99_ms']:.3f} ms | max {pt['max_ms']:.3f} ms")
+    print(f"  Peak traced memory         : {results['peak_memory_kib']:.1f} KiB")
+    print("=" * 86)
+
+
+def find_regressions(results, baseline, threshold):
+    """[(stage, old_s, new_s)] for stages more than threshold slower than the baseline."""
+    regressions = []
+    for name, s in results["stages"].items():
+        old = baseline.get("stages", {}).get(name)
+        if old and s["total_s"] > old["total_s"] * (1 + threshold):
+            regressions.append((name, old["total_s"], s["total_s"]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-stage audit pipeline benchmark.")
+    parser.add_argument("dirs", nargs="*", default=["transcripts", "test_scenarios"],
+                        help="Transcript directories (default: transcripts test_scenarios)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per transcript; fastest is kept")
+    parser.add_argument("--out", default="bench_results.json", help="Where to write the JSON results")
+    parser.add_argument("--baseline", help="Earlier JSON result to compare against")
+    parser.add_argument("--threshold", type=float, default=0.20,
+                        help="Allowed fractional slow-down per stage before failing (default 0.20)")
+    args = parser.parse_args()
+
+    jobs = collect_jobs(args.dirs)
+    if not jobs:
+        print(f"No transcripts found in {args.dirs}.")
+        sys.exit(1)
+
+    best = time_corpus(jobs, args.repeat)
+    peaks, overall_peak = peak_memory(jobs)
+    results = summarise(jobs, best, peaks, overall_peak, args.repeat, args.dirs)
+    print_summary(results)
+
+    with open(args.out, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"  Results written to {args.out}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = find_regressions(results, baseline, args.threshold)
+        if regressions:
+            print(f"  REGRESSION (> {args.threshold:.0%} slower than {args.baseline}):")
+            for name, old, new in regressions:
+                print(f"    {name:<28} {old:.3f}s -> {new:.3f}s ({new / old - 1:+.0%})")
+            sys.exit(1)
+        print(f"  No stage regressed more than {args.threshold:.0%} against {args.baseline}.")
+
+
+if __name__ == "__main__":
+    main()
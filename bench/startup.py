@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+CLI Start-up Budget
+Runs every command-line entry point once under `python -X importtime` on a
+real transcript (stdout redirected, so not a TTY) and checks two things:
+
+  - modules the level does not need are never imported: colorama without a
+    terminal, zipfile / tarfile for a plain transcript file, and the engines
+    of higher levels (level_1 must not load the audit engine, ...);
+  - the import time the entry point adds on top of a bare interpreter
+    (`python -c pass`) stays within its budget, best of --repeat runs. Budgets
+    are multiples of the bare interpreter's own start-up imports (best of
+    --repeat), so they follow the speed of the machine, with about 2x
+    headroom over typical runs; they catch eager heavy imports, not noise.
+
+Exits 1 when any entry point imports a forbidden module or is over budget.
+PYTHONDONTWRITEBYTECODE is dropped for the child processes and a warm-up run
+is made first, so the numbers are for cached bytecode as in a normal install.
+
+Usage:
+    python bench/startup.py [transcript.csv] [--repeat 7] [--scale 1.0]
+"""
+
+import argparse
+import glob
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ALWAYS_FORBIDDEN = ("colorama", "zipfile", "tarfile")
+
+# name → (argv after the script, import budget in bare-interpreter start-ups, forbidden modules)
+ENTRY_POINTS = {
+    "level_1.py": ([], 3.5, ("argparse", "engine.audit_engine", "engine.pipeline")),
+    "level_2.py": (["CSE"], 5.0, ("engine.audit_engine", "engine.pipeline")),
+    "level_3.py": (["CSE"], 6.0, ("engine.pipeline",)),
+    "audit.py": (["CSE"], 6.5, ()),
+}
+
+
+def import_times(argv):
+    """{module: cumulative µs} for the top-level imports of one `python -X importtime` run, plus all module names."""
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    proc = subprocess.run([sys.executable, "-X", "importtime"] + argv, cwd=ROOT, env=env,
+                          input="n\n" * 8, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                          text=True)
+    top, names = {}, set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        names.add(name.strip())
+        if not name[1:].startswith(" "):  # nested imports are indented
+            top[name.strip()] = top.get(name.strip(), 0) + int(cumulative)
+    return top, names
+
+
+def added_ms(top, interpreter):
+    """Milliseconds of top-level imports that a bare interpreter does not make."""
+    return sum(us for name, us in top.items() if name not in interpreter) / 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time budget for the CLI entry points")
+    parser.add_argument("transcript", nargs="?", help="Transcript CSV (default: first in transcripts/)")
+    parser.add_argument("--repeat", type=int, default=7, help="Runs per entry point (best is kept)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every budget (slow machines)")
+    args = parser.parse_args()
+
+    transcript = args.transcript or next(iter(sorted(glob.glob(os.path.join(ROOT, "transcripts", "*.csv")))), None)
+    if transcript is None:
+        print("No transcript given and none found in transcripts/.")
+        sys.exit(1)
+    transcript = os.path.abspath(transcript)
+
+    import_times(["-c", "pass"])  # warm-up
+    baseline = float("inf")
+    for _ in range(args.repeat):
+        top = import_times(["-c", "pass"])[0]
+        baseline = min(baseline, sum(top.values()) / 1000)
+    interpreter = set(top)
+    failures = 0
+    print("=" * 80)
+    print(f"  bare interpreter imports {baseline:.1f} ms (budgets are multiples of this)")
+    for script, (extra, factor, forbidden) in ENTRY_POINTS.items():
+        argv = [script, transcript] + extra
+        import_times(argv)  # warm-up: writes bytecode caches
+        best, names, slowest = float("inf"), set(), {}
+        for _ in range(args.repeat):
+            top, names = import_times(argv)
+            ms = added_ms(top, interpreter)
+            if ms < best:
+                best = ms
+                slowest = {n: us for n, us in top.items() if n not in interpreter}
+        budget = factor * baseline * args.scale
+        leaked = [m for m in ALWAYS_FORBIDDEN + forbidden if m in names]
+        ok = best <= budget and not leaked
+        failures += not ok
+        heaviest = ", ".join(f"{n} {us / 1000:.1f}" for n, us in
+                             sorted(slowest.items(), key=lambda kv: -kv[1])[:3])
+        print(f"  {script:<12} imports {best:6.1f} ms  (budget {budget:5.1f} ms = {factor * args.scale:.1f}x)  "
+              f"{'OK' if ok else 'FAIL'}   heaviest: {heaviest}")
+        if leaked:
+            print(f"    imported unneeded module(s): {', '.join(leaked)}")
+    print("=" * 80)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Catalog Snapshot Builder
+Usage:
+    python build_catalog.py            # (re)write engine/catalog.snapshot
+    python build_catalog.py --check    # exit 1 if the snapshot is missing or stale
+
+Validates engine.course_db and engine.prerequisites, derives every catalog
+table and marshals them to a snapshot the engines load at start-up instead of
+compiling the catalog again; see engine.catalog. Re-run it after editing the
+curriculum — until then the engines fall back to compiling from source.
+"""
+
+import argparse
+import sys
+import time
+
+from engine.catalog import SNAPSHOT_PATH, read_snapshot, write_snapshot
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the precompiled course catalog snapshot")
+    parser.add_argument("--check", action="store_true",
+                        help="Only report whether the snapshot matches the catalog sources")
+    args = parser.parse_args()
+
+    if args.check:
+        if read_snapshot() is None:
+            print(f"Snapshot {SNAPSHOT_PATH} is missing or stale — run: python build_catalog.py")
+            sys.exit(1)
+        print(f"Snapshot {SNAPSHOT_PATH} is up to date.")
+        return
+
+    start = time.perf_counter()
+    try:
+        size = write_snapshot()
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    print(f"Wrote {SNAPSHOT_PATH} ({size / 1024:.1f} KiB) in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
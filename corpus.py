@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Corpus Tools — packed columnar transcript corpora
+Usage:
+    python corpus.py pack [dirs ...] [--out transcripts.corpus]
+    python corpus.py info <corpus file>
+
+pack parses every transcript CSV once (program and BBA concentration come
+from the filenames, as in audit.py --batch) and writes a memory-mappable
+columnar file; see engine.corpus for the layout and loader.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import audit
+from engine.corpus import pack_corpus, open_corpus
+
+
+def collect_jobs(dirs):
+    """[(path, program, concentration)] for every transcript CSV whose program can be detected."""
+    jobs, skipped = [], []
+    for directory in dirs:
+        for path in audit.collect_batch_files(directory):
+            program = audit.detect_program(path)
+            if program is None:
+                skipped.append(path)
+                continue
+            concentration = audit.detect_concentration(path) if program == "BBA" else None
+            jobs.append((path, program, concentration))
+    return jobs, skipped
+
+
+def cmd_pack(args):
+    jobs, skipped = collect_jobs(args.dirs)
+    for path in skipped:
+        print(f"  skipped (no CSE/BBA in filename): {path}", file=sys.stderr)
+    if not jobs:
+        print(f"Error: No transcripts found in {args.dirs}.")
+        sys.exit(1)
+    start = time.perf_counter()
+    info = pack_corpus(jobs, args.out)
+    elapsed = time.perf_counter() - start
+    print(f"Packed {info['students']} transcripts ({info['rows']} course rows) into {args.out}"
+          f" — {info['bytes'] / 1024:.1f} KiB in {elapsed:.2f}s")
+
+
+def cmd_info(args):
+    if not os.path.isfile(args.corpus):
+        print(f"Error: File '{args.corpus}' not found.")
+        sys.exit(1)
+    with open_corpus(args.corpus, use_numpy=False) as corpus:
+        programs = {}
+        for _, _, program, concentration, _, _ in corpus.iter_students():
+            key = f"{program}/{concentration}" if concentration else program
+            programs[key] = programs.get(key, 0) + 1
+        print(f"  File        : {args.corpus} ({os.path.getsize(args.corpus) / 1024:.1f} KiB)")
+        print(f"  Transcripts : {len(corpus)}")
+        print(f"  Course rows : {corpus.n_rows}")
+        print(f"  Codes       : {len(corpus.codes)} distinct, grades: {' '.join(corpus.grades)}")
+        for key, count in sorted(programs.items()):
+            print(f"    {key:<10} {count}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack transcript corpora into a columnar file")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_pack = sub.add_parser("pack", help="Pack transcript CSVs into one memory-mappable file")
+    p_pack.add_argument("dirs", nargs="*", default=["transcripts"],
+                        help="Directories or glob patterns (default: transcripts)")
+    p_pack.add_argument("--out", "-o", default="transcripts.corpus", help="Output file")
+    p_info = sub.add_parser("info", help="Summarise a packed corpus")
+    p_info.add_argument("corpus", help="Packed corpus file")
+    args = parser.parse_args()
+    {"pack": cmd_pack, "info": cmd_info}[args.command](args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Transcript Archives — read transcript CSVs straight out of .zip / .tar(.gz) drops
+A transcript inside an archive is addressed like a file inside a directory,
+as zipimport does: "drops/fall.zip/transcripts/student_0001_CSE.csv" is the
+member "transcripts/student_0001_CSE.csv" of drops/fall.zip. Members are
+read in-process, nothing is extracted to disk.
+
+Every process keeps its own open handle per archive, so pool workers reading
+different slices of one archive never share a file offset. Members are
+listed in archive order: reading them in that order lets a compressed tar be
+decompressed front to back instead of rewound for every member.
+
+zipfile and tarfile are imported on first use: the CLIs check every
+transcript path with transcript_exists(), and a plain file never needs them.
+"""
+
+import io
+import os
+
+ZIP_SUFFIXES = (".zip",)
+TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+
+_handles = {}  # archive path -> (pid, mtime, kind, handle, tar member index)
+
+
+def is_archive(path):
+    """True for an existing file with a .zip or .tar(.gz/.bz2/.xz) suffix."""
+    return path.lower().endswith(ZIP_SUFFIXES + TAR_SUFFIXES) and os.path.isfile(path)
+
+
+def split_member_path(path):
+    """(archive path, member name) for "<archive>/<member>", or None if path does not point into an archive."""
+    path = os.fspath(path)
+    parts = path.replace("\\", "/").split("/")
+    for i in range(len(parts) - 1, 0, -1):
+        archive = "/".join(parts[:i])
+        if is_archive(archive):
+            return archive, "/".join(parts[i:])
+    return None
+
+
+def _is_transcript(name):
+    base = name.rsplit("/", 1)[-1]
+    return (name.lower().endswith(".csv") and not base.startswith(".")
+            and not name.startswith("__MACOSX/"))
+
+
+def list_members(archive):
+    """Names of the transcript CSVs in an archive, in archive order (hidden files and __MACOSX skipped)."""
+    if archive.lower().endswith(ZIP_SUFFIXES):
+        import zipfile
+        with zipfile.ZipFile(archive) as zf:
+            return [i.filename for i in zf.infolist() if not i.is_dir() and _is_transcript(i.filename)]
+    import tarfile
+    with tarfile.open(archive, "r|*") as tf:  # one streaming pass, no seeking
+        return [m.name for m in tf if m.isfile() and _is_transcript(m.name)]
+
+
+def _handle(archive):
+    """This process's open handle for archive (reopened after a fork or when the file changes)."""
+    mtime = os.path.getmtime(archive)
+    cached = _handles.get(archive)
+    if cached is not None and cached[0] == os.getpid() and cached[1] == mtime:
+        return cached
+    if archive.lower().endswith(ZIP_SUFFIXES):
+        import zipfile
+        cached = (os.getpid(), mtime, "zip", zipfile.ZipFile(archive), None)
+    else:
+        import tarfile
+        tf = tarfile.open(archive, "r:*")
+        cached = (os.getpid(), mtime, "tar", tf, None)
+    _handles[archive] = cached
+    return cached
+
+
+def open_member(path):
+    """
+    Open a transcript inside an archive ("<archive>/<member>") as a text stream,
+    decoded like a transcript file (UTF-8, BOM stripped). Raises
+    FileNotFoundError when path is not an archive member.
+    """
+    split = split_member_path(path)
+    if split is None:
+        raise FileNotFoundError(f"No such file or archive member: '{path}'")
+    archive, name = split
+    pid, mtime, kind, handle, index = _handle(archive)
+    try:
+        if kind == "zip":
+            raw = handle.open(name)
+        else:
+            if index is None:
+                index = {m.name: m for m in handle.getmembers()}
+                _handles[archive] = (pid, mtime, kind, handle, index)
+            raw = handle.extractfile(index[name])
+            if raw is None:
+                raise KeyError(name)
+    except KeyError:
+        raise FileNotFoundError(f"No member '{name}' in archive '{archive}'") from None
+    return io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+
+
+def transcript_exists(path):
+    """True for an existing transcript file or a transcript member of an archive."""
+    if os.path.isfile(path):
+        return True
+    split = split_member_path(path)
+    return split is not None and split[1] in list_members(split[0])
+
+
+def member_paths(archive):
+    """"<archive>/<member>" paths of every transcript in an archive, in archive order."""
+    return [f"{archive}/{name}" for name in list_members(archive)]
@@ -6,76 +6,28 @@ identifies remaining courses, and determines graduation eligibility.
 Current curriculum: Post-Fall 2014 (130 credits for both CSE and BBA)
 """
 
-from engine.cgpa_engine import compute_major_cgpa
-from engine.credit_engine import SEMESTERS
+from engine.catalog import (GROUPS, GROUP_MASKS, CONC_LABELS, COURSE_BITS, PREREQUISITES, PREREQ_BITS,
+                            PREREQ_MASKS, PREREQ_CLOSURE, SENIOR, SENIOR_BIT, SENIOR_CREDITS,
+                            prereq_codes)
+from engine.cgpa_engine import compute_major_cgpa, compute_major_cgpas, GRADE_POINTS
+from engine.credit_engine import semester_ordinal, PASSING_GRADES
+from engine.retake_planner import plan_retakes
+from engine.scheduler import plan_semesters, schedule_courses, pick_count, SLOT_CREDITS
 
 # ─────────────────────────────────────────────────────
 # CSE PROGRAM REQUIREMENTS (130 credits)
+# Requirement groups are {code: credits} views of the compiled catalog
+# (engine.course_db); only program policy lives here.
 # ─────────────────────────────────────────────────────
 
-# CSE Major Core (42 credits)
-CSE_MAJOR_CORE = {
-    "CSE173": 3,                              # Discrete Mathematics
-    "CSE215": 3, "CSE215L": 1,                # Programming Language II (OOP)
-    "CSE225": 3, "CSE225L": 1,                # Data Structures & Algorithms
-    "CSE231": 3, "CSE231L": 1,                # Digital Logic Design
-    "CSE299": 1,                              # Junior Design Project
-    "CSE311": 3, "CSE311L": 1,                # Database Management Systems
-    "CSE323": 3,                              # Operating Systems Design
-    "CSE327": 3,                              # Software Engineering
-    "CSE331": 3, "CSE331L": 1,                # Microprocessor Interfacing
-    "CSE332": 3,                              # Computer Organization & Architecture
-    "CSE373": 3,                              # Design & Analysis of Algorithms
-    "CSE425": 3,                              # Concepts of Programming Languages
-    "EEE141": 3, "EEE141L": 1,                # Electrical Circuits I
-    "EEE111": 3, "EEE111L": 1,                # Analog Electronics I
-}
-
-# CSE Capstone + Engineering Economics (7 credits)
-CSE_CAPSTONE = {
-    "CSE499A": 2,                              # Senior Capstone Design I
-    "CSE499B": 2,                              # Senior Capstone Design II
-    "EEE452": 3,                              # Engineering Economics
-}
-
-# SEPS Core — Math, Science, Programming (41 credits)
-CSE_SEPS_CORE = {
-    "CSE115": 3, "CSE115L": 1,                # Programming Language I
-    "MAT116": 3,                              # Pre-Calculus
-    "MAT120": 3,                              # Calculus I
-    "MAT130": 3,                              # Calculus II
-    "MAT250": 3,                              # Calculus III
-    "MAT125": 3,                              # Linear Algebra
-    "MAT350": 3,                              # Complex Variables
-    "MAT361": 3,                              # Discrete Mathematics II
-    "PHY107": 3, "PHY107L": 1,                # Physics I
-    "PHY108": 3, "PHY108L": 1,                # Physics II
-    "CHE101": 3, "CHE101L": 1,                # Chemistry I
-    "BIO103": 3, "BIO103L": 1,                # Biology I (Wait, checking if BIO is in SEPS)
-    "CEE110": 1,                              # Engineering Drawing (CAD)
-}
-
-# University Core / GED (34 credits)
-CSE_GED_REQUIRED = {
-    "ENG103": 3,                              # Intermediate Composition
-    "ENG105": 3,                              # Advanced Writing Skills
-    "ENG111": 3,                              # Public Speaking
-    "PHI104": 3,                              # Introduction to Ethics
-    "HIS101": 3,                              # Bangladesh History & Culture
-    "HIS102": 3,                              # World Civilization
-    "CSE101": 3,                              # Intro to Python Programming (GED)
-    "CSE145": 3,                              # Intro to AI (GED)
-    "CSE226": 3,                              # Fundamentals of Vibe Coding (GED)
-}
-
-CSE_GED_CHOICE_1 = {"ECO101": 3, "ECO104": 3}       # pick 1
-CSE_GED_CHOICE_2 = {"POL101": 3, "POL104": 3}       # pick 1
-CSE_GED_CHOICE_3 = {"SOC101": 3, "ANT101": 3, "ENV203": 3, "GEO205": 3}  # pick 1
-
-CSE_GED_WAIVABLE = {
-    "ENG102": 3,   # Waived if >=60% on English admission test
-    "MAT112": 0,   # College Algebra, waived if >=60% on Math admission test
-}
+CSE_MAJOR_CORE = GROUPS["CSE_MAJOR_CORE"]          # 42 credits
+CSE_CAPSTONE = GROUPS["CSE_CAPSTONE"]              # Capstone + Engineering Economics (7 credits)
+CSE_SEPS_CORE = GROUPS["CSE_SEPS_CORE"]            # Math, Science, Programming (41 credits)
+CSE_GED_REQUIRED = GROUPS["CSE_GED"]               # University Core / GED (34 credits)
+CSE_GED_CHOICE_1 = GROUPS["CSE_GED_CHOICE_1"]      # pick 1
+CSE_GED_CHOICE_2 = GROUPS["CSE_GED_CHOICE_2"]      # pick 1
+CSE_GED_CHOICE_3 = GROUPS["CSE_GED_CHOICE_3"]      # pick 1
+CSE_GED_WAIVABLE = GROUPS["CSE_GED_WAIVABLE"]      # ENG102 / MAT112, waived by admission tests
 
 CSE_TOTAL_CREDITS = 130
 CSE_MIN_CGPA = 2.0
@@ -94,71 +46,17 @@ CSE_ALL_CORE = {**CSE_MAJOR_CORE, **CSE_CAPSTONE, **CSE_SEPS_CORE}
 #   +2 courses if no waivers → 130cr
 # ─────────────────────────────────────────────────────
 
-# School Core (7 courses / 21 credits)
-BBA_SCHOOL_CORE = {
-    "ECO101": 3,                              # Intro to Microeconomics
-    "ECO104": 3,                              # Intro to Macroeconomics
-    "MIS107": 3,                              # Introduction to Computers
-    "BUS251": 3,                              # Business Communication
-    "BUS172": 3,                              # Introduction to Statistics
-    "BUS173": 3,                              # Applied Statistics
-    "BUS135": 3,                              # Business Mathematics
-}
-
-# BBA Core (12 courses / 36 credits)
-BBA_CORE = {
-    "ACT201": 3,                              # Intro to Financial Accounting
-    "ACT202": 3,                              # Intro to Managerial Accounting
-    "FIN254": 3,                              # Intro to Financial Management
-    "LAW200": 3,                              # Legal Environment of Business
-    "INB372": 3,                              # International Business
-    "MKT202": 3,                              # Introduction to Marketing
-    "MIS207": 3,                              # Management Information Systems
-    "MGT212": 3,                              # Principles of Management
-    "MGT351": 3,                              # Human Resource Management
-    "MGT314": 3,                              # Production Management
-    "MGT368": 3,                              # Entrepreneurship
-    "MGT489": 3,                              # Strategic Management
-}
-
-# GED — General Education Courses
-# 12/13/14 courses — 36/39/42 credits depending on waivers
-# Waivable:
-BBA_GED_WAIVABLE = {
-    "ENG102": 3,   # Mandatory if not waived (English admission test)
-    "BUS112": 3,   # Mandatory if not waived (Math admission test)
-}
-
-# Fixed GED (always required)
-BBA_GED = {
-    "ENG103": 3,                              # Intermediate Composition
-    "ENG105": 3,                              # Advanced Composition
-    "PHI401": 3,                              # Ethics / Philosophy
-}
-
-# GED Choice Groups
-BBA_GED_CHOICE_LANG = {"BEN205": 3, "ENG115": 3, "CHN101": 3}  # pick 1
-
-BBA_GED_CHOICE_HIS = {"HIS101": 3, "HIS102": 3, "HIS103": 3, "HIS205": 3}  # pick 2
-
-BBA_GED_CHOICE_POL = {"POL101": 3, "POL104": 3, "PAD201": 3}  # pick 1
-
-BBA_GED_CHOICE_SOC = {"SOC101": 3, "GEO205": 3, "ANT101": 3}  # pick 1
-
-# Science: pick 3 from (BIO103, ENV107, PBH101, PSY101, PHY107, CHE101)
-BBA_GED_CHOICE_SCI = {
-    "BIO103": 3, "ENV107": 3, "PBH101": 3,
-    "PSY101": 3, "PHY107": 3, "CHE101": 3,
-}  # pick 3
-
-# Science Lab: pick matching lab or any 3cr non-BBA course
-BBA_GED_CHOICE_LAB = {
-    "BIO103L": 1, "ENV107L": 1, "PBH101L": 1,
-    "PSY101L": 1, "PHY107L": 1, "CHE101L": 1,
-}  # pick 1 lab (or 3cr alternative — handled as open)
-
-# Internship / Research Project (4 credits)
-BBA_INTERNSHIP = {"BUS498": 4}  # or BUS499 if CGPA >= 3.30
+BBA_SCHOOL_CORE = GROUPS["BBA_SCHOOL_CORE"]        # 7 courses / 21 credits
+BBA_CORE = GROUPS["BBA_CORE"]                      # 12 courses / 36 credits
+BBA_GED_WAIVABLE = GROUPS["BBA_GED_WAIVABLE"]      # ENG102 / BUS112, mandatory unless waived
+BBA_GED = GROUPS["BBA_GED"]                        # Fixed GED (always required)
+BBA_GED_CHOICE_LANG = GROUPS["BBA_GED_CHOICE_LANG"]  # pick 1
+BBA_GED_CHOICE_HIS = GROUPS["BBA_GED_CHOICE_HIS"]    # pick 2
+BBA_GED_CHOICE_POL = GROUPS["BBA_GED_CHOICE_POL"]    # pick 1
+BBA_GED_CHOICE_SOC = GROUPS["BBA_GED_CHOICE_SOC"]    # pick 1
+BBA_GED_CHOICE_SCI = GROUPS["BBA_GED_CHOICE_SCI"]    # pick 3
+BBA_GED_CHOICE_LAB = GROUPS["BBA_GED_CHOICE_LAB"]    # pick 1 lab (or 3cr alternative — handled as open)
+BBA_INTERNSHIP = GROUPS["BBA_INTERNSHIP"]          # 4 credits (or BUS499 if CGPA >= 3.30)
 
 BBA_TOTAL_CREDITS = 130   # with no waivers (127 with 1, 124 with 2)
 BBA_MIN_CGPA = 2.0
@@ -170,70 +68,11 @@ BBA_FREE_ELECTIVE_CREDITS = 9   # 3 courses
 # Combined School+BBA Core for CGPA computation
 BBA_ALL_CORE = {**BBA_SCHOOL_CORE, **BBA_CORE}
 
-# ─────────────────────────────────────────────────────
-# BBA CONCENTRATION / MAJOR AREA COURSES (18 credits each)
-# Each: 4 required (12cr) + 2 electives from pool (6cr)
-# Source: NSU BBA Curriculum 143 Major Map
-# ─────────────────────────────────────────────────────
-
-# Accounting — Required: 310,320,360,370 | Elective: 380,460,430,410
-BBA_CONC_ACT_REQUIRED = {"ACT310": 3, "ACT320": 3, "ACT360": 3, "ACT370": 3}
-BBA_CONC_ACT_ELECTIVE = {"ACT380": 3, "ACT460": 3, "ACT430": 3, "ACT410": 3}
-
-# Finance — Required: 433,440,435,444 | Elective: 455,464,470,480,410
-BBA_CONC_FIN_REQUIRED = {"FIN433": 3, "FIN440": 3, "FIN435": 3, "FIN444": 3}
-BBA_CONC_FIN_ELECTIVE = {"FIN455": 3, "FIN464": 3, "FIN470": 3, "FIN480": 3, "FIN410": 3}
-
-# Marketing — Required: 337,344,460,470 | Elective: 412,465,382,417,330,450,355,445,475
-BBA_CONC_MKT_REQUIRED = {"MKT337": 3, "MKT344": 3, "MKT460": 3, "MKT470": 3}
-BBA_CONC_MKT_ELECTIVE = {"MKT412": 3, "MKT465": 3, "MKT382": 3, "MKT417": 3,
-                          "MKT330": 3, "MKT450": 3, "MKT355": 3, "MKT445": 3, "MKT475": 3}
-
-# Management — Required: MGT321,330, HRM370, MGT410 | Elective: MGT350,490, HRM470,450, MIS320
-BBA_CONC_MGT_REQUIRED = {"MGT321": 3, "MGT330": 3, "HRM370": 3, "MGT410": 3}
-BBA_CONC_MGT_ELECTIVE = {"MGT350": 3, "MGT490": 3, "HRM470": 3, "HRM450": 3, "MIS320": 3}
-
-# HRM — Required: 340,360,380,450 | Elective: 370,499,470
-BBA_CONC_HRM_REQUIRED = {"HRM340": 3, "HRM360": 3, "HRM380": 3, "HRM450": 3}
-BBA_CONC_HRM_ELECTIVE = {"HRM370": 3, "HRM499": 3, "HRM470": 3}
-
-# MIS — Required: 210,310,320,470 | Elective: 330/MKT330, 410, 450, MGT490, 499
-BBA_CONC_MIS_REQUIRED = {"MIS210": 3, "MIS310": 3, "MIS320": 3, "MIS470": 3}
-BBA_CONC_MIS_ELECTIVE = {"MIS330": 3, "MIS410": 3, "MIS450": 3, "MGT490": 3, "MIS499": 3}
-
-# SCM — Required: SCM310,320,450, MGT460 | Elective: MGT360,390,470,490
-BBA_CONC_SCM_REQUIRED = {"SCM310": 3, "SCM320": 3, "SCM450": 3, "MGT460": 3}
-BBA_CONC_SCM_ELECTIVE = {"MGT360": 3, "MGT390": 3, "MGT470": 3, "MGT490": 3}
-
-# Economics — Required: ECO201/203, ECO204, ECO348/349, ECO328/350/415
-# Simplified: use one code per slot for audit; alternatives accepted
-BBA_CONC_ECO_REQUIRED = {"ECO201": 3, "ECO204": 3, "ECO348": 3, "ECO328": 3}
-# Large elective pool — including most listed options
-BBA_CONC_ECO_ELECTIVE = {
-    "ECO244": 3, "ECO301": 3, "ECO304": 3, "ECO317": 3, "ECO329": 3,
-    "ECO343": 3, "ECO354": 3, "ECO360": 3, "ECO372": 3, "ECO380": 3,
-    "ECO406": 3, "ECO410": 3, "ECO414": 3, "ECO415": 3, "ECO417": 3,
-    "ECO430": 3, "ECO436": 3, "ECO441": 3, "ECO443": 3, "ECO450": 3,
-    "ECO451": 3, "ECO460": 3, "ECO465": 3, "ECO472": 3, "ECO474": 3,
-    "ECO475": 3, "ECO484": 3, "ECO485": 3, "ECO486": 3, "ECO492": 3,
-}
-
-# INB — Required: INB400,490,480, MKT382 | Elective: INB410,350,355,415,450,495, MKT417
-BBA_CONC_INB_REQUIRED = {"INB400": 3, "INB490": 3, "INB480": 3, "MKT382": 3}
-BBA_CONC_INB_ELECTIVE = {"INB410": 3, "INB350": 3, "INB355": 3, "INB415": 3,
-                          "INB450": 3, "INB495": 3, "MKT417": 3}
-
+# Concentration / Major Area (18 credits each: 4 required + 2 electives from pool)
 # Lookup dict: concentration code → (required_dict, elective_dict, label)
 BBA_CONCENTRATIONS = {
-    "ACT": (BBA_CONC_ACT_REQUIRED, BBA_CONC_ACT_ELECTIVE, "Accounting"),
-    "FIN": (BBA_CONC_FIN_REQUIRED, BBA_CONC_FIN_ELECTIVE, "Finance"),
-    "MKT": (BBA_CONC_MKT_REQUIRED, BBA_CONC_MKT_ELECTIVE, "Marketing"),
-    "MGT": (BBA_CONC_MGT_REQUIRED, BBA_CONC_MGT_ELECTIVE, "Management"),
-    "HRM": (BBA_CONC_HRM_REQUIRED, BBA_CONC_HRM_ELECTIVE, "Human Resource Management"),
-    "MIS": (BBA_CONC_MIS_REQUIRED, BBA_CONC_MIS_ELECTIVE, "Management Information Systems"),
-    "SCM": (BBA_CONC_SCM_REQUIRED, BBA_CONC_SCM_ELECTIVE, "Supply Chain Management"),
-    "ECO": (BBA_CONC_ECO_REQUIRED, BBA_CONC_ECO_ELECTIVE, "Economics"),
-    "INB": (BBA_CONC_INB_REQUIRED, BBA_CONC_INB_ELECTIVE, "International Business"),
+    conc: (GROUPS[f"BBA_CONC_{conc}_REQUIRED"], GROUPS[f"BBA_CONC_{conc}_ELECTIVE"], label)
+    for conc, label in CONC_LABELS.items()
 }
 
 VALID_CONCENTRATIONS = set(BBA_CONCENTRATIONS.keys())
@@ -242,92 +81,296 @@ VALID_CONCENTRATIONS = set(BBA_CONCENTRATIONS.keys())
 # PREREQUISITE MAPPING
 # ─────────────────────────────────────────────────────
 
-from engine.prerequisites import PREREQUISITES_CSE, PREREQUISITES_BBA
 import collections
 
+# Plain-dict copies of the catalog DAG used in the per-record loop:
+# program → {code: (direct prereq mask, direct | transitive mask)}
+_PREREQ_CHECKS = {
+    program: {code: (mask, mask | PREREQ_CLOSURE[program][code]) for code, mask in masks.items()}
+    for program, masks in PREREQ_MASKS.items()
+}
+_PREREQ_BIT_LOOKUP = {program: dict(bits) for program, bits in PREREQ_BITS.items()}
+_COURSE_BIT_LOOKUP = dict(COURSE_BITS)
+_WAIVER_MASK = COURSE_BITS["ENG102"] | COURSE_BITS["BUS112"]  # courses check_waivers_* read
+
 
 def check_prerequisite_violations(program, records, waivers):
     """
     Check if any courses in records were taken before their prerequisites were passed.
-    Returns a list of dicts: {"course": code, "missing": [missing_prereqs]}
+    Returns a list of dicts: {"course": code, "semester": sem, "missing": [direct prereqs],
+    "transitive": [earlier prerequisites in the chain not yet passed by that semester either]}
     """
-    # Group records by semester and sort semesters chronologically
-    sem_map = {sem: i for i, sem in enumerate(SEMESTERS)}
     records_by_sem = collections.defaultdict(list)
-    for r in records:
-        records_by_sem[r.semester].append(r)
-        
-    sorted_sems = sorted(records_by_sem.keys(), key=lambda s: sem_map.get(s, 9999))
-    
-    prereq_map = PREREQUISITES_CSE if program.upper() == "CSE" else PREREQUISITES_BBA
-    passed_so_far = set(k for k, v in waivers.items() if v)  # Only true waivers count
+    for i, r in enumerate(records):
+        records_by_sem[r.semester].append((i, r))
+    return _check_prerequisites_by_semester(program, records_by_sem, waivers)
+
+
+def _check_prerequisites_by_semester(program, records_by_sem, waivers):
+    """
+    check_prerequisite_violations() over records already grouped by semester
+    as {semester: [(index, record), ...]}.
+
+    Single chronological pass over the compiled prerequisite DAG: the student's
+    passed courses are one bitmask, and each course is checked by AND-ing it
+    against its direct and transitive prerequisite masks.
+    """
+    # Sort semesters chronologically (semesters off the timeline, e.g. 'waiver', go last)
+    def sem_key(sem):
+        ordinal = semester_ordinal(sem)
+        return ordinal if ordinal >= 0 else float("inf")
+
+    sorted_sems = sorted(records_by_sem.keys(), key=sem_key)
+
+    program = "CSE" if program.upper() == "CSE" else "BBA"
+    prereq_map = PREREQUISITES[program]
+    checks = _PREREQ_CHECKS[program]
+    bits = PREREQ_BITS[program]
+    bit_of = _PREREQ_BIT_LOOKUP[program].get
+
+    passed_mask = 0  # Only true waivers count
+    for code, waived in waivers.items():
+        if waived:
+            passed_mask |= bit_of(code, 0)
     violations = []
-    
+
     # Track credits earned at each step for senior status check
     credits_at_step = 0
     first_sem = sorted_sems[0] if sorted_sems else None
-    
+
     for current_sem in sorted_sems:
         sem_records = records_by_sem[current_sem]
-        
+
         # FIRST SEMESTER EXCEPTION: Allow concurrent enrollment of prerequisites.
         # We add passed courses to the pool BEFORE checking them.
         if current_sem == first_sem:
-            for r in sem_records:
+            for _, r in sem_records:
                 if r.grade not in ("F", "W", "I"):
-                    passed_so_far.add(r.course_code)
+                    passed_mask |= bit_of(r.course_code, 0)
                     credits_at_step += r.credits
-                    
-        # Verify prereqs for this semester's courses
-        for r in sem_records:
+
+        have = passed_mask | (SENIOR_BIT if credits_at_step >= SENIOR_CREDITS else 0)
+
+        # Verify prereqs for this semester's courses; NORMAL SEMESTERS add
+        # passed courses to the pool only after the whole semester is checked
+        sem_mask = 0
+        sem_credits = 0
+        for _, r in sem_records:
             code = r.course_code
-            if code in prereq_map:
-                required = prereq_map[code]
+            check = checks.get(code)
+            if check is not None and check[1] & ~have:
+                direct, chain = check
+                missing_mask = direct & ~have
                 missing = []
-                for req in required:
-                    if req == "_SENIOR_":
-                        if credits_at_step < 100:
-                            missing.append("Senior Status (100+ Credits)")
-                    elif req not in passed_so_far:
+                for req in prereq_map[code]:
+                    if req == SENIOR:
+                        if missing_mask & SENIOR_BIT:
+                            missing.append(f"Senior Status ({SENIOR_CREDITS}+ Credits)")
+                    elif missing_mask & bits[req]:
                         missing.append(req)
-                
-                if missing:
-                    violations.append({
-                        "course": code,
-                        "semester": current_sem,
-                        "missing": missing
-                    })
-        
-        # NORMAL SEMESTERS: Add passed courses to the pool AFTER checking prereqs
+                violations.append({
+                    "course": code,
+                    "semester": current_sem,
+                    "missing": missing,
+                    "transitive": prereq_codes(program, chain & ~direct & ~have),
+                })
+            if r.grade not in ("F", "W", "I"):
+                sem_mask |= bit_of(code, 0)
+                sem_credits += r.credits
+
         if current_sem != first_sem:
-            for r in sem_records:
-                if r.grade not in ("F", "W", "I"):
-                    passed_so_far.add(r.course_code)
-                    credits_at_step += r.credits
-            
+            passed_mask |= sem_mask
+            credits_at_step += sem_credits
+
     return violations
 
 
-def _get_passed_courses(records):
-    """Return set of course codes that the student has passed (BEST or WAIVED status)."""
+# ─────────────────────────────────────────────────────
+# COMPILED REQUIREMENT MASKS
+# Every catalog course has a bit; the catalog compiles each requirement group
+# once into (group_mask, members) (GROUP_MASKS, stored in its snapshot) so
+# audits reduce to AND/popcount on a per-student passed-mask.
+# ─────────────────────────────────────────────────────
+
+def _popcount(mask):
+    return bin(mask).count("1")
+
+
+CSE_GROUPS = {
+    "major_core": GROUP_MASKS["CSE_MAJOR_CORE"],
+    "capstone": GROUP_MASKS["CSE_CAPSTONE"],
+    "seps_core": GROUP_MASKS["CSE_SEPS_CORE"],
+    "ged_required": GROUP_MASKS["CSE_GED"],
+    "ged_choice_1": GROUP_MASKS["CSE_GED_CHOICE_1"],
+    "ged_choice_2": GROUP_MASKS["CSE_GED_CHOICE_2"],
+    "ged_choice_3": GROUP_MASKS["CSE_GED_CHOICE_3"],
+    "waivable": GROUP_MASKS["CSE_GED_WAIVABLE"],
+}
+# Courses that can never count as a CSE 400-level or open elective
+CSE_CORE_CAPSTONE_MASK = CSE_GROUPS["major_core"][0] | CSE_GROUPS["capstone"][0]
+CSE_REQUIRED_MASK = CSE_CORE_CAPSTONE_MASK | CSE_GROUPS["seps_core"][0] | \
+    CSE_GROUPS["ged_required"][0] | CSE_GROUPS["ged_choice_1"][0] | \
+    CSE_GROUPS["ged_choice_2"][0] | CSE_GROUPS["ged_choice_3"][0] | CSE_GROUPS["waivable"][0]
+
+BBA_GROUPS = {
+    "school_core": GROUP_MASKS["BBA_SCHOOL_CORE"],
+    "core": GROUP_MASKS["BBA_CORE"],
+    "ged": GROUP_MASKS["BBA_GED"],
+    "lang": GROUP_MASKS["BBA_GED_CHOICE_LANG"],
+    "his": GROUP_MASKS["BBA_GED_CHOICE_HIS"],
+    "pol": GROUP_MASKS["BBA_GED_CHOICE_POL"],
+    "soc": GROUP_MASKS["BBA_GED_CHOICE_SOC"],
+    "sci": GROUP_MASKS["BBA_GED_CHOICE_SCI"],
+    "lab": GROUP_MASKS["BBA_GED_CHOICE_LAB"],
+    "waivable": GROUP_MASKS["BBA_GED_WAIVABLE"],
+    "internship": GROUP_MASKS["BBA_INTERNSHIP"],
+}
+BBA_REQUIRED_MASK = 0
+for _mask, _ in BBA_GROUPS.values():
+    BBA_REQUIRED_MASK |= _mask
+
+# concentration code -> (required group, elective group, label)
+BBA_CONC_GROUPS = {
+    conc: (GROUP_MASKS[f"BBA_CONC_{conc}_REQUIRED"], GROUP_MASKS[f"BBA_CONC_{conc}_ELECTIVE"], label)
+    for conc, label in CONC_LABELS.items()
+}
+
+
+# ─────────────────────────────────────────────────────
+# FUSED RECORD SCAN
+# One pass over the resolved records collects everything the credit, CGPA,
+# audit, prerequisite and roadmap stages need; evaluation then works on these
+# aggregates and small pre-filtered subsets instead of re-walking the transcript.
+# ─────────────────────────────────────────────────────
+
+def scan_records(records, program):
+    """
+    Single pass over resolved records. Returns a dict with:
+      credits_attempted, credits_earned   — as calculate_credits()
+      quality_points, gpa_credits         — compute_cgpa() totals, summed in record order
+      passed, passed_mask                 — courses passed (BEST or WAIVED status)
+      gpa_records      — BEST/FAILED credit-bearing attempts (input for compute_major_cgpa
+                         and the roadmap's retake planner)
+      waiver_records   — ENG102/BUS112 attempts (input for check_waivers_*)
+      open_candidates  — [(code, credits, bit)] passed, credit-bearing, outside the
+                         program's fixed requirements (open/free elective candidates)
+      unauthorized     — UNAUTHORIZED-RETAKE records
+      unrecognized     — codes not in the catalog (ignoring W/I attempts)
+      by_semester      — {semester: [(index, record), ...]} in transcript order
+    """
+    if program.upper() == "CSE":
+        required_mask = CSE_REQUIRED_MASK
+        exclude_cse4 = True  # CSE 4xx courses count as major electives instead
+    else:
+        required_mask = BBA_REQUIRED_MASK
+        exclude_cse4 = False
+    bit_of = _COURSE_BIT_LOOKUP.get
+    points_of = GRADE_POINTS.get
+
+    credits_attempted = 0
+    credits_earned = 0
+    quality_points = 0.0
+    gpa_credits = 0
     passed = set()
-    for r in records:
-        if r.status in ("BEST", "WAIVED") and r.grade not in ("F", "I", "W"):
-            passed.add(r.course_code)
-    return passed
+    passed_mask = 0
+    gpa_records = []
+    waiver_records = []
+    open_candidates = []
+    unauthorized = []
+    unrecognized = set()
+    by_semester = {}
+
+    for i, r in enumerate(records):
+        code = r.course_code
+        grade = r.grade
+        status = r.status
+        cr = r.credits
+        sem_list = by_semester.get(r.semester)
+        if sem_list is None:
+            sem_list = by_semester[r.semester] = []
+        sem_list.append((i, r))
+        bit = bit_of(code, 0)
+
+        if not bit:  # every catalog course has a bit
+            if grade not in ("W", "I"):
+                unrecognized.add(code)
+        elif bit & _WAIVER_MASK:
+            waiver_records.append(r)
+
+        if cr > 0 and grade != "W" and grade != "T":
+            credits_attempted += cr
+
+        if status == "BEST" or status == "WAIVED":
+            if cr > 0 and grade in PASSING_GRADES:
+                credits_earned += cr
+            if grade not in ("F", "I", "W"):
+                passed.add(code)
+                passed_mask |= bit
+                if cr > 0 and not bit & required_mask and \
+                        not (exclude_cse4 and code.startswith("CSE4")):
+                    open_candidates.append((code, cr, bit))
+            if status == "WAIVED":
+                continue
+        elif status == "UNAUTHORIZED-RETAKE":
+            unauthorized.append(r)
+            continue
+        elif status != "FAILED":
+            continue
+
+        # BEST or FAILED attempt: counts toward CGPA
+        if cr != 0:
+            points = points_of(grade)  # None for W/T, as grade_to_points()
+            if points is not None:
+                quality_points += points * cr
+                gpa_credits += cr
+                gpa_records.append(r)
+
+    return {
+        "credits_attempted": credits_attempted,
+        "credits_earned": credits_earned,
+        "quality_points": quality_points,
+        "gpa_credits": gpa_credits,
+        "passed": passed,
+        "passed_mask": passed_mask,
+        "gpa_records": gpa_records,
+        "waiver_records": waiver_records,
+        "open_candidates": open_candidates,
+        "unauthorized": unauthorized,
+        "unrecognized": unrecognized,
+        "by_semester": by_semester,
+    }
 
 
-def _find_missing(required_dict, passed_set):
-    """Return dict of {course: credits} for courses not yet passed."""
-    return {c: cr for c, cr in required_dict.items() if c not in passed_set}
+def _open_elective_credits(candidates, exclude_mask=0):
+    """Credits of distinct open/free elective candidates, skipping codes in exclude_mask."""
+    counted_open = set()
+    total = 0
+    for code, cr, bit in candidates:
+        if not bit & exclude_mask and code not in counted_open:
+            total += cr
+            counted_open.add(code)
+    return total
+
 
+def _find_missing(group, passed_mask):
+    """Return dict of {course: credits} for the compiled group's courses not yet passed."""
+    mask, members = group
+    if not mask & ~passed_mask:
+        return {}
+    return {c: cr for c, cr, bit in members if not passed_mask & bit}
 
-def _check_choice_group(choice_dict, passed_set):
-    """Check if at least one course from a choice group is passed. Return missing info."""
-    for c in choice_dict:
-        if c in passed_set:
-            return {}  # satisfied
-    return choice_dict  # none passed — return all options
+
+def _check_choice_group(group, passed_mask):
+    """Check if at least one course from a compiled choice group is passed. Return missing info."""
+    mask, members = group
+    if mask & passed_mask:
+        return {}  # satisfied
+    return {c: cr for c, cr, _ in members}  # none passed — return all options
+
+
+def _is_cse_elective(code):
+    """CSE 400-level course outside the major core and capstone."""
+    return code.startswith("CSE4") and not COURSE_BITS.get(code, 0) & CSE_CORE_CAPSTONE_MASK
 
 
 def audit_cse(records, waivers, credits_earned, cgpa, credit_reduction=0):
@@ -335,80 +378,64 @@ def audit_cse(records, waivers, credits_earned, cgpa, credit_reduction=0):
     Perform CSE program audit (130-credit curriculum).
     Returns dict with: eligible, reasons, remaining_by_category, major_cgpa
     """
-    passed = _get_passed_courses(records)
+    return evaluate_cse(scan_records(records, "CSE"), waivers, credits_earned, cgpa, credit_reduction)
+
+
+def evaluate_cse(scan, waivers, credits_earned, cgpa, credit_reduction=0):
+    """audit_cse() on the aggregates of scan_records(records, "CSE")."""
+    passed, passed_mask = scan["passed"], scan["passed_mask"]
     remaining = {}
     reasons = []
     total_required = CSE_TOTAL_CREDITS - credit_reduction
 
-    # CSE Major Core (42cr) — remove waived courses
-    core_to_check = dict(CSE_MAJOR_CORE)
-    missing_core = _find_missing(core_to_check, passed)
+    # CSE Major Core (42cr)
+    missing_core = _find_missing(CSE_GROUPS["major_core"], passed_mask)
     if missing_core:
         remaining["CSE Major Core"] = missing_core
 
     # Capstone + Engineering Economics (7cr)
-    missing_cap = _find_missing(CSE_CAPSTONE, passed)
+    missing_cap = _find_missing(CSE_GROUPS["capstone"], passed_mask)
     if missing_cap:
         remaining["Capstone"] = missing_cap
 
     # SEPS Core (41cr)
-    seps_to_check = dict(CSE_SEPS_CORE)
-    missing_seps = _find_missing(seps_to_check, passed)
+    missing_seps = _find_missing(CSE_GROUPS["seps_core"], passed_mask)
     if missing_seps:
         remaining["SEPS Core"] = missing_seps
 
     # GED required (fixed courses)
-    missing_ged = _find_missing(CSE_GED_REQUIRED, passed)
+    missing_ged = _find_missing(CSE_GROUPS["ged_required"], passed_mask)
     if missing_ged:
         remaining["GED Required"] = missing_ged
 
     # GED choice groups
-    missing_c1 = _check_choice_group(CSE_GED_CHOICE_1, passed)
+    missing_c1 = _check_choice_group(CSE_GROUPS["ged_choice_1"], passed_mask)
     if missing_c1:
         remaining["GED Choice (ECO101 or ECO104)"] = missing_c1
 
-    missing_c2 = _check_choice_group(CSE_GED_CHOICE_2, passed)
+    missing_c2 = _check_choice_group(CSE_GROUPS["ged_choice_2"], passed_mask)
     if missing_c2:
         remaining["GED Choice (POL101 or POL104)"] = missing_c2
 
-    missing_c3 = _check_choice_group(CSE_GED_CHOICE_3, passed)
+    missing_c3 = _check_choice_group(CSE_GROUPS["ged_choice_3"], passed_mask)
     if missing_c3:
         remaining["GED Choice (SOC101/ANT101/ENV203/GEO205)"] = missing_c3
 
     # Waivable courses (ENG102, MAT112)
-    waivable_remaining = {}
-    for course, cr in CSE_GED_WAIVABLE.items():
-        if not waivers.get(course, False) and course not in passed:
-            waivable_remaining[course] = cr
+    waivable_remaining = {c: cr for c, cr in _find_missing(CSE_GROUPS["waivable"], passed_mask).items()
+                          if not waivers.get(c, False)}
     if waivable_remaining:
         remaining["Waivable Courses"] = waivable_remaining
 
     # Electives (CSE 400-level) — count passed CSE 4xx courses not in core
-    cse_400_electives = [c for c in passed
-                         if c.startswith("CSE4") and c not in CSE_MAJOR_CORE and c not in CSE_CAPSTONE]
-    elective_credits = sum(3 for _ in cse_400_electives)  # assume 3 each
+    elective_codes = [c for c in passed if _is_cse_elective(c)]
+    elective_credits = 3 * len(elective_codes)  # assume 3 each
     if elective_credits < CSE_ELECTIVE_CREDITS:
         needed = (CSE_ELECTIVE_CREDITS - elective_credits) // 3
         remaining["CSE Electives (400-level)"] = {f"Any CSE 4xx ({needed} needed)": CSE_ELECTIVE_CREDITS - elective_credits}
 
     # Open electives — any courses not already counted
-    all_required_codes = (set(CSE_ALL_CORE.keys()) |
-                          set(CSE_CAPSTONE.keys()) |
-                          set(CSE_GED_REQUIRED.keys()) |
-                          set(CSE_GED_CHOICE_1.keys()) |
-                          set(CSE_GED_CHOICE_2.keys()) |
-                          set(CSE_GED_CHOICE_3.keys()) |
-                          set(CSE_GED_WAIVABLE.keys()))
-    counted_open = set()
-    open_elec_credits = 0
-    for r in records:
-        if (r.course_code not in all_required_codes and
-            r.course_code not in counted_open and
-            not (r.course_code.startswith("CSE4") and r.course_code not in CSE_MAJOR_CORE and r.course_code not in CSE_CAPSTONE) and
-            r.status in ("BEST", "WAIVED") and r.credits > 0 and
-            r.grade not in ("F", "I", "W")):
-            open_elec_credits += r.credits
-            counted_open.add(r.course_code)
+    open_elec_credits = _open_elective_credits(scan["open_candidates"])
 
     if open_elec_credits < CSE_OPEN_ELECTIVE_CREDITS:
         needed_cr = CSE_OPEN_ELECTIVE_CREDITS - open_elec_credits
@@ -416,12 +443,10 @@ def audit_cse(records, waivers, credits_earned, cgpa, credit_reduction=0):
 
     # Major Core CGPA — based on CSE Major Core courses
     major_core_codes = list(CSE_MAJOR_CORE.keys())
-    major_core_cgpa = compute_major_cgpa(records, major_core_codes)
+    major_core_cgpa = compute_major_cgpa(scan["gpa_records"], major_core_codes)
 
     # Major Elective CGPA — based on CSE 400-level electives
-    elective_codes = [c for c in passed
-                      if c.startswith("CSE4") and c not in CSE_MAJOR_CORE and c not in CSE_CAPSTONE]
-    major_elective_cgpa = compute_major_cgpa(records, elective_codes) if elective_codes else 0.0
+    major_elective_cgpa = compute_major_cgpa(scan["gpa_records"], elective_codes) if elective_codes else 0.0
 
     # Graduation eligibility checks
     eligible = True
@@ -443,10 +468,9 @@ def audit_cse(records, waivers, credits_earned, cgpa, credit_reduction=0):
         reasons.append(f"Major Elective CGPA ({major_elective_cgpa:.2f}) < {CSE_MAJOR_ELECTIVE_CGPA:.2f}")
 
     # Check for unauthorized retakes
-    for r in records:
-        if r.status == "UNAUTHORIZED-RETAKE":
-            eligible = False
-            reasons.append(f"Invalid course: Unauthorized retake of {r.course_code} ({r.grade} in {r.semester})")
+    for r in scan["unauthorized"]:
+        eligible = False
+        reasons.append(f"Invalid course: Unauthorized retake of {r.course_code} ({r.grade} in {r.semester})")
 
     if remaining:
         eligible = False
@@ -463,7 +487,7 @@ def audit_cse(records, waivers, credits_earned, cgpa, credit_reduction=0):
     }
     
     # ── Prerequisites ──
-    result["prereq_violations"] = check_prerequisite_violations("CSE", records, waivers)
+    result["prereq_violations"] = _check_prerequisites_by_semester("CSE", scan["by_semester"], waivers)
 
     return result
 
@@ -474,140 +498,153 @@ def audit_bba(records, waivers, credits_earned, cgpa, credit_reduction=0, concen
     concentration: one of ACT/FIN/MKT/MGT/HRM/MIS/SCM/ECO/INB (or None)
     Returns dict with: eligible, reasons, remaining_by_category, cgpa info
     """
-    passed = _get_passed_courses(records)
+    return evaluate_bba(scan_records(records, "BBA"), waivers, credits_earned, cgpa,
+                        credit_reduction, concentration)
+
+
+def evaluate_bba(scan, waivers, credits_earned, cgpa, credit_reduction=0, concentration=None):
+    """audit_bba() on the aggregates of scan_records(records, "BBA")."""
+    passed_mask = scan["passed_mask"]
+    remaining = _bba_shared_remaining(passed_mask, waivers)
+
+    # ── Concentration courses (18cr: 4 required + 2 elective) ──
+    conc_label = "Undeclared"
+    conc_all_codes = []
+    conc_mask = 0
+    if concentration and concentration.upper() in BBA_CONC_GROUPS:
+        conc_remaining, conc_all_codes, conc_mask, conc_label = \
+            _bba_concentration(concentration.upper(), passed_mask)
+        remaining.update(conc_remaining)
+
+    _add_free_electives(remaining, scan, conc_mask)
+
+    # School & BBA Core CGPA (combined 19 courses / 57 credits)
+    core_codes = list(BBA_ALL_CORE.keys())
+    core_cgpa = compute_major_cgpa(scan["gpa_records"], core_codes)
+
+    # Concentration/Major Area CGPA
+    if conc_all_codes:
+        concentration_cgpa = compute_major_cgpa(scan["gpa_records"], conc_all_codes)
+    else:
+        concentration_cgpa = core_cgpa  # fallback if no concentration specified
+
+    result = _bba_result(scan, remaining, bool(concentration), credits_earned, cgpa,
+                         BBA_TOTAL_CREDITS - credit_reduction, core_cgpa, concentration_cgpa, conc_label)
+
+    # ── Prerequisites ──
+    result["prereq_violations"] = _check_prerequisites_by_semester("BBA", scan["by_semester"], waivers)
+
+    return result
+
+
+def _bba_shared_remaining(passed_mask, waivers):
+    """Remaining School Core, BBA Core, GED and Internship courses (the same for every concentration)."""
     remaining = {}
-    reasons = []
-    total_required = BBA_TOTAL_CREDITS - credit_reduction
 
-    if not concentration:
-        reasons.append("Major/Concentration not yet declared")
-    
     # School Core (7 courses / 21 credits)
-    missing_school = _find_missing(BBA_SCHOOL_CORE, passed)
+    missing_school = _find_missing(BBA_GROUPS["school_core"], passed_mask)
     if missing_school:
         remaining["School Core"] = missing_school
 
     # BBA Core (12 courses / 36 credits)
-    missing_core = _find_missing(BBA_CORE, passed)
+    missing_core = _find_missing(BBA_GROUPS["core"], passed_mask)
     if missing_core:
         remaining["BBA Core"] = missing_core
 
     # GED fixed courses (ENG103, ENG105, PHI401)
-    missing_ged = _find_missing(BBA_GED, passed)
+    missing_ged = _find_missing(BBA_GROUPS["ged"], passed_mask)
     if missing_ged:
         remaining["GED"] = missing_ged
 
     # GED Choice: Language (BEN205/ENG115/CHN101 — pick 1)
-    missing_lang = _check_choice_group(BBA_GED_CHOICE_LANG, passed)
+    missing_lang = _check_choice_group(BBA_GROUPS["lang"], passed_mask)
     if missing_lang:
         remaining["GED Choice (Language)"] = missing_lang
 
     # GED Choice: History (HIS101/102/103/HIS205 — pick 2)
-    his_passed = [c for c in BBA_GED_CHOICE_HIS if c in passed]
-    his_needed = 2 - len(his_passed)
+    his_needed = 2 - _popcount(BBA_GROUPS["his"][0] & passed_mask)
     if his_needed > 0:
-        his_options = {c: cr for c, cr in BBA_GED_CHOICE_HIS.items() if c not in passed}
+        his_options = _find_missing(BBA_GROUPS["his"], passed_mask)
         remaining[f"GED Choice (History, pick {his_needed})"] = his_options
 
     # GED Choice: Political Science (POL101/POL104/PAD201 — pick 1)
-    missing_pol = _check_choice_group(BBA_GED_CHOICE_POL, passed)
+    missing_pol = _check_choice_group(BBA_GROUPS["pol"], passed_mask)
     if missing_pol:
         remaining["GED Choice (Political Science)"] = missing_pol
 
     # GED Choice: Social Science (SOC101/GEO205/ANT101 — pick 1)
-    missing_soc = _check_choice_group(BBA_GED_CHOICE_SOC, passed)
+    missing_soc = _check_choice_group(BBA_GROUPS["soc"], passed_mask)
     if missing_soc:
         remaining["GED Choice (Social Science)"] = missing_soc
 
     # GED Choice: Science (BIO103/ENV107/PBH101/PSY101/PHY107/CHE101 — pick 3)
-    sci_passed = [c for c in BBA_GED_CHOICE_SCI if c in passed]
-    sci_needed = 3 - len(sci_passed)
+    sci_needed = 3 - _popcount(BBA_GROUPS["sci"][0] & passed_mask)
     if sci_needed > 0:
-        sci_options = {c: cr for c, cr in BBA_GED_CHOICE_SCI.items() if c not in passed}
+        sci_options = _find_missing(BBA_GROUPS["sci"], passed_mask)
         remaining[f"GED Choice (Science, pick {sci_needed})"] = sci_options
 
     # GED Choice: Lab (pick 1 matching lab or 3cr alternative)
-    lab_passed = [c for c in BBA_GED_CHOICE_LAB if c in passed]
-    if len(lab_passed) == 0:
-        remaining["GED Choice (Lab)"] = dict(BBA_GED_CHOICE_LAB)
+    missing_lab = _check_choice_group(BBA_GROUPS["lab"], passed_mask)
+    if missing_lab:
+        remaining["GED Choice (Lab)"] = missing_lab
 
     # Waivable courses (ENG102 3cr, BUS112 3cr)
-    waivable_remaining = {}
-    for course, cr in BBA_GED_WAIVABLE.items():
-        if not waivers.get(course, False) and course not in passed:
-            waivable_remaining[course] = cr
+    waivable_remaining = {c: cr for c, cr in _find_missing(BBA_GROUPS["waivable"], passed_mask).items()
+                          if not waivers.get(c, False)}
     if waivable_remaining:
         remaining["GED Waivable"] = waivable_remaining
 
     # Internship
-    missing_intern = _find_missing(BBA_INTERNSHIP, passed)
+    missing_intern = _find_missing(BBA_GROUPS["internship"], passed_mask)
     if missing_intern:
         remaining["Internship"] = missing_intern
 
-    # ── Concentration courses (18cr: 4 required + 2 elective) ──
-    conc_label = "Undeclared"
-    conc_all_codes = []
-    if concentration and concentration.upper() in BBA_CONCENTRATIONS:
-        conc_key = concentration.upper()
-        conc_req, conc_elec, conc_label = BBA_CONCENTRATIONS[conc_key]
-
-        # Required concentration courses
-        missing_conc_req = _find_missing(conc_req, passed)
-        if missing_conc_req:
-            remaining[f"{conc_label} Required"] = missing_conc_req
-
-        # Elective concentration courses (need 2 from pool)
-        elec_passed = [c for c in conc_elec if c in passed]
-        elec_needed = 2 - len(elec_passed)
-        if elec_needed > 0:
-            elec_options = {c: cr for c, cr in conc_elec.items() if c not in passed}
-            remaining[f"{conc_label} Elective (pick {elec_needed})"] = elec_options
-
-        # All concentration course codes for CGPA computation
-        conc_all_codes = list(conc_req.keys()) + [c for c in conc_elec if c in passed]
-    else:
-        conc_all_codes = []
-
-    # Free Electives (3 courses / 9 credits)
-    conc_code_set = set(conc_all_codes)
-    all_required_codes = (set(BBA_SCHOOL_CORE.keys()) |
-                          set(BBA_CORE.keys()) |
-                          set(BBA_GED.keys()) |
-                          set(BBA_GED_CHOICE_LANG.keys()) |
-                          set(BBA_GED_CHOICE_HIS.keys()) |
-                          set(BBA_GED_CHOICE_POL.keys()) |
-                          set(BBA_GED_CHOICE_SOC.keys()) |
-                          set(BBA_GED_CHOICE_SCI.keys()) |
-                          set(BBA_GED_CHOICE_LAB.keys()) |
-                          set(BBA_GED_WAIVABLE.keys()) |
-                          set(BBA_INTERNSHIP.keys()) |
-                          conc_code_set)
-    counted_open = set()
-    free_elec_credits = 0
-    for r in records:
-        if (r.course_code not in all_required_codes and
-            r.course_code not in counted_open and
-            r.status in ("BEST", "WAIVED") and r.credits > 0 and
-            r.grade not in ("F", "I", "W")):
-            free_elec_credits += r.credits
-            counted_open.add(r.course_code)
+    return remaining
 
 
+def _bba_concentration(conc_key, passed_mask):
+    """
+    Remaining required and elective courses of one concentration.
+    Returns (remaining, conc_all_codes, conc_mask, label): the codes of the
+    concentration CGPA, and the mask of concentration courses that cannot
+    count as free electives.
+    """
+    conc_req, conc_elec, conc_label = BBA_CONC_GROUPS[conc_key]
+    remaining = {}
+
+    # Required concentration courses
+    missing_conc_req = _find_missing(conc_req, passed_mask)
+    if missing_conc_req:
+        remaining[f"{conc_label} Required"] = missing_conc_req
+
+    # Elective concentration courses (need 2 from pool)
+    elec_passed_mask = conc_elec[0] & passed_mask
+    elec_needed = 2 - _popcount(elec_passed_mask)
+    if elec_needed > 0:
+        elec_options = _find_missing(conc_elec, passed_mask)
+        remaining[f"{conc_label} Elective (pick {elec_needed})"] = elec_options
+
+    # All concentration course codes for CGPA computation
+    conc_all_codes = [c for c, _, _ in conc_req[1]] + \
+                     [c for c, _, bit in conc_elec[1] if elec_passed_mask & bit]
+    return remaining, conc_all_codes, conc_req[0] | elec_passed_mask, conc_label
 
 
+def _add_free_electives(remaining, scan, conc_mask):
+    """Add the Free Electives shortfall (3 courses / 9 credits) outside conc_mask to remaining."""
+    free_elec_credits = _open_elective_credits(scan["open_candidates"], conc_mask)
+
     if free_elec_credits < BBA_FREE_ELECTIVE_CREDITS:
         needed_cr = BBA_FREE_ELECTIVE_CREDITS - free_elec_credits
         remaining["Free Electives"] = {f"Any courses ({needed_cr} credits needed)": needed_cr}
 
-    # School & BBA Core CGPA (combined 19 courses / 57 credits)
-    core_codes = list(BBA_ALL_CORE.keys())
-    core_cgpa = compute_major_cgpa(records, core_codes)
 
-    # Concentration/Major Area CGPA
-    if conc_all_codes:
-        concentration_cgpa = compute_major_cgpa(records, conc_all_codes)
-    else:
-        concentration_cgpa = core_cgpa  # fallback if no concentration specified
+def _bba_result(scan, remaining, declared, credits_earned, cgpa, total_required,
+                core_cgpa, concentration_cgpa, conc_label):
+    """Eligibility checks and the audit_bba() result dict (without prereq_violations)."""
+    reasons = []
+    if not declared:
+        reasons.append("Major/Concentration not yet declared")
 
     # Eligibility checks
     eligible = True
@@ -629,17 +666,16 @@ def audit_bba(records, waivers, credits_earned, cgpa, credit_reduction=0, concen
         reasons.append(f"Concentration CGPA ({concentration_cgpa:.2f}) < {BBA_CONCENTRATION_CGPA:.2f}")
 
     # Check for unauthorized retakes
-    for r in records:
-        if r.status == "UNAUTHORIZED-RETAKE":
-            eligible = False
-            reasons.append(f"Invalid course: Unauthorized retake of {r.course_code} ({r.grade} in {r.semester})")
+    for r in scan["unauthorized"]:
+        eligible = False
+        reasons.append(f"Invalid course: Unauthorized retake of {r.course_code} ({r.grade} in {r.semester})")
 
     if remaining:
         eligible = False
         total_missing = sum(len(v) for v in remaining.values())
         reasons.append(f"{total_missing} required course(s) still missing")
 
-    result = {
+    return {
         "eligible": eligible,
         "reasons": reasons,
         "remaining": remaining,
@@ -648,16 +684,124 @@ def audit_bba(records, waivers, credits_earned, cgpa, credit_reduction=0, concen
         "concentration_label": conc_label,
         "total_credits_required": total_required,
     }
-    
-    # ── Prerequisites ──
-    result["prereq_violations"] = check_prerequisite_violations("BBA", records, waivers)
 
-    return result
+
+# ─────────────────────────────────────────────────────
+# ALL BBA CONCENTRATIONS IN ONE PASS
+# For undeclared students: the shared requirements, School & BBA Core CGPA
+# and prerequisite check are evaluated once, the nine concentration pools
+# against the same passed-mask, and every concentration CGPA in one pass
+# over the graded records.
+# ─────────────────────────────────────────────────────
+
+# Concentration courses the scheduler can treat as plain 3-credit slots: no
+# prerequisites, prerequisite of nothing, not a lab. Replacing them with
+# FILLER slots leaves the semester count unchanged and lets the nine
+# concentrations share cached schedules.
+_CONC_SLOT_CODES = {
+    code for conc_req, conc_elec, _ in BBA_CONC_GROUPS.values()
+    for code, cr, _ in conc_req[1] + conc_elec[1]
+    if cr == SLOT_CREDITS and not code.endswith("L") and code not in PREREQUISITES["BBA"]
+    and not any(code in reqs for reqs in PREREQUISITES["BBA"].values())
+}
+
+
+def _schedule_profile(remaining):
+    """remaining with _CONC_SLOT_CODES courses as FILLER placeholders (same semester count)."""
+    profile = {}
+    slot_credits = 0
+    for category, options in remaining.items():
+        if "Required" in category:
+            kept = {c: cr for c, cr in options.items() if c not in _CONC_SLOT_CODES}
+            slot_credits += sum(options.values()) - sum(kept.values())
+        elif "Elective (pick" in category and options.keys() <= _CONC_SLOT_CODES:
+            kept = {}
+            slot_credits += SLOT_CREDITS * pick_count(category)
+        else:
+            kept = options
+        if kept:
+            profile[category] = kept
+    if slot_credits:
+        profile["Concentration"] = {f"Any courses ({slot_credits} credits needed)": slot_credits}
+    return profile
+
+
+def audit_bba_all_concentrations(records, waivers, credits_earned, cgpa, credit_reduction=0):
+    """
+    audit_bba() for every concentration at once, with a ranking.
+    Returns dict with: results {concentration: audit_bba() result}, ranking.
+    """
+    return evaluate_bba_all_concentrations(scan_records(records, "BBA"), waivers, credits_earned,
+                                           cgpa, credit_reduction)
+
+
+def evaluate_bba_all_concentrations(scan, waivers, credits_earned, cgpa, credit_reduction=0):
+    """
+    audit_bba_all_concentrations() on the aggregates of scan_records(records, "BBA").
+    results[conc] equals evaluate_bba(..., concentration=conc) (the results
+    share one prereq_violations list). ranking has one row per concentration:
+    concentration, label, remaining_credits (credits of the courses still
+    required, a pick-n group counting n courses), concentration_cgpa,
+    meets_cgpa (≥ BBA_CONCENTRATION_CGPA), projected_semesters (as the
+    roadmap's estimate) and eligible; sorted by remaining credits, then
+    concentrations meeting the CGPA threshold, higher concentration CGPA,
+    fewer semesters.
+    """
+    passed_mask = scan["passed_mask"]
+    shared = _bba_shared_remaining(passed_mask, waivers)
+    total_required = BBA_TOTAL_CREDITS - credit_reduction
+    core_cgpa = compute_major_cgpa(scan["gpa_records"], list(BBA_ALL_CORE.keys()))
+    violations = _check_prerequisites_by_semester("BBA", scan["by_semester"], waivers)
+    credit_gap = max(total_required - credits_earned, 0)
+
+    parts = {conc: _bba_concentration(conc, passed_mask) for conc in BBA_CONC_GROUPS}
+    conc_cgpas = compute_major_cgpas(scan["gpa_records"],
+                                     {conc: codes for conc, (_, codes, _, _) in parts.items()})
+
+    results = {}
+    ranking = []
+    projections = {}
+    for conc, (conc_remaining, _, conc_mask, conc_label) in parts.items():
+        remaining = {**shared, **conc_remaining}
+        _add_free_electives(remaining, scan, conc_mask)
+        result = _bba_result(scan, remaining, True, credits_earned, cgpa, total_required,
+                             core_cgpa, conc_cgpas[conc], conc_label)
+        result["prereq_violations"] = violations
+        results[conc] = result
+
+        # Concentrations needing the same number of slots share one projection
+        profile = _schedule_profile(remaining)
+        key = tuple((category, tuple(options.items())) for category, options in profile.items()
+                    if category not in shared)
+        projection = projections.get(key)
+        if projection is None:
+            courses = schedule_courses("BBA", profile, SENIOR_CREDITS)
+            plan = plan_semesters("BBA", profile, credits_earned, credit_gap, exact=True)
+            projection = projections[key] = (sum(cr for _, cr in courses), max(1, plan["count"]))
+        ranking.append({
+            "concentration": conc,
+            "label": conc_label,
+            "remaining_credits": projection[0],
+            "concentration_cgpa": conc_cgpas[conc],
+            "meets_cgpa": conc_cgpas[conc] >= BBA_CONCENTRATION_CGPA,
+            "projected_semesters": 0 if result["eligible"] else projection[1],
+            "eligible": result["eligible"],
+        })
+
+    ranking.sort(key=lambda row: (row["remaining_credits"], not row["meets_cgpa"],
+                                  -row["concentration_cgpa"], row["projected_semesters"],
+                                  row["concentration"]))
+    return {"results": results, "ranking": ranking}
+
+
+ROADMAP_RETAKE_COURSES = 5  # retake budget of the roadmap's suggestions
 
 
 def build_graduation_roadmap(program, records, credits_earned, cgpa, major_cgpa, audit_result, standing):
     """
     Build an actionable graduation roadmap — what the student must do to graduate.
+    records is only scanned for retake suggestions, so any subset holding the
+    BEST/FAILED attempts (e.g. scan_records()["gpa_records"]) gives the same roadmap.
     Returns a dict with steps, estimates, and actionable info.
     """
     total_req = audit_result["total_credits_required"]
@@ -778,35 +922,27 @@ def build_graduation_roadmap(program, records, credits_earned, cgpa, major_cgpa,
     roadmap["estimated_courses_left"] = total_missing_courses
 
     # ── Estimate semesters remaining ──
-    # Assume average 15 credits/semester (5 courses)
-    credits_still_needed = max(roadmap["credit_gap"], total_missing_credits)
-    if credits_still_needed > 0:
-        roadmap["estimated_semesters"] = max(1, -(-credits_still_needed // 15))  # ceiling division
-    else:
-        roadmap["estimated_semesters"] = 1 if not eligible else 0
+    # Prerequisite-aware plan at up to 15 credits/semester (chains and the senior gate included)
+    plan = plan_semesters(program, remaining, credits_earned, roadmap["credit_gap"], exact=True)
+    roadmap["estimated_semesters"] = max(1, plan["count"])
+    roadmap["semester_plan"] = plan
 
     # ── Retake recommendations ──
     if cgpa < min_cgpa or major_cgpa < major_threshold:
-        # Find courses with low grades that could be retaken
-        low_grade_courses = []
-        seen = set()
-        for r in records:
-            if (r.status == "BEST" and r.grade in ("D", "D+", "C-") and
-                r.credits > 0 and r.course_code not in seen):
-                low_grade_courses.append((r.course_code, r.grade, r.credits))
-                seen.add(r.course_code)
-
-        if low_grade_courses:
-            # Sort by credits (retake high-credit courses for max GPA impact)
-            low_grade_courses.sort(key=lambda x: -x[2])
-            top_retakes = low_grade_courses[:5]
-            detail = ", ".join(f"{c} (current: {g}, {cr}cr)" for c, g, cr in top_retakes)
+        # Best ROADMAP_RETAKE_COURSES retakes for whichever CGPA is short
+        objective = "cgpa" if cgpa < min_cgpa else "major"
+        plan = plan_retakes(records, program, max_courses=ROADMAP_RETAKE_COURSES, objective=objective)
+        if plan["courses"]:
+            detail = ", ".join(f"{c} (current: {g}, {cr}cr)" for c, g, cr in plan["courses"])
             roadmap["steps"].append({
                 "category": "RETAKE SUGGESTIONS",
-                "action": f"Consider retaking {len(top_retakes)} course(s) to boost GPA",
+                "action": (f"Retake {len(plan['courses'])} course(s) with a {plan['target_grade']} or better: "
+                           f"CGPA {plan['cgpa']:.2f} -> {plan['projected_cgpa']:.2f}, "
+                           f"{major_label} {plan['major_cgpa']:.2f} -> {plan['projected_major_cgpa']:.2f}"),
                 "priority": "RECOMMENDED",
                 "detail": detail,
             })
+        roadmap["retake_plan"] = plan
 
     return roadmap
 
@@ -820,3 +956,13 @@ def run_audit(records, program, waivers, credits_earned, cgpa, credit_reduction=
     else:
         raise ValueError(f"Unknown program: {program}. Use 'CSE' or 'BBA'.")
 
+
+def evaluate_audit(scan, program, waivers, credits_earned, cgpa, credit_reduction=0, concentration=None):
+    """run_audit() on the aggregates of scan_records(records, program)."""
+    if program.upper() == "CSE":
+        return evaluate_cse(scan, waivers, credits_earned, cgpa, credit_reduction)
+    elif program.upper() == "BBA":
+        return evaluate_bba(scan, waivers, credits_earned, cgpa, credit_reduction, concentration)
+    else:
+        raise ValueError(f"Unknown program: {program}. Use 'CSE' or 'BBA'.")
+
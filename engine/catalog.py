@@ -0,0 +1,341 @@
+"""
+Course Catalog — compiled lookup tables
+Validates engine.course_db and engine.prerequisites once and freezes them into
+read-only lookups shared by every engine and CLI, so requirement groups,
+credits and prerequisites come from a single source. The tables are compiled
+on first access (module __getattr__), not at import, so a CLI that never
+touches them does not pay for them.
+
+build_catalog.py writes the derived tables to a snapshot (catalog.snapshot
+next to this module) that load_catalog() reads back with one marshal.loads,
+without importing course_db or prerequisites at all. The snapshot records the
+size/mtime and a CRC-32 of course_db.py, prerequisites.py and this file; like
+a .pyc it is trusted while the stat stamps match, and after they change only
+if the checksum still does. When it is missing, stale or unreadable the tables
+are compiled from source instead, so editing the curriculum never needs a
+rebuild to be correct.
+
+Compiled artefact:
+  COURSES        code → (id, name, credits, category flags)
+  COURSE_IDS     code → dense integer id (CODES is the inverse)
+  COURSE_BITS    code → 1 << id, for requirement bitmasks
+  GROUPS         group name → {code: credits} in curriculum order
+  GROUP_MASKS    group name → (mask, ((code, credits, bit), ...)) for audits
+  PREREQ_NODES   program → prerequisite DAG nodes; node 0 is the _SENIOR_ credit threshold
+  PREREQ_BITS    program → {code: 1 << node index} for courses in the DAG
+  PREREQ_MASKS   program → {code: mask of direct prerequisite node bits}
+  PREREQ_CLOSURE program → {code: mask of every transitive prerequisite course}
+"""
+
+import marshal
+import os
+import re
+from types import MappingProxyType
+
+SENIOR = "_SENIOR_"
+SENIOR_CREDITS = 100  # credits earned before a _SENIOR_ prerequisite is met
+SENIOR_BIT = 1        # _SENIOR_ is node 0 of every prerequisite DAG
+COURSE_CODE_FORMAT = re.compile(r'^[A-Z]{3}\d{3}[A-Z]?$')
+
+# ─── Requirement groups, in ALL_COURSES merge order (later names win) ───
+
+_TABLE_NAMES = (
+    "CSE_MAJOR_CORE", "CSE_CAPSTONE", "CSE_SEPS_CORE", "CSE_GED",
+    "CSE_GED_CHOICE_1", "CSE_GED_CHOICE_2", "CSE_GED_CHOICE_3",
+    "CSE_ELECTIVES_400", "OPEN_ELECTIVES", "WAIVER_COURSES",
+    "CSE_GED_WAIVABLE", "BBA_GED_WAIVABLE",
+    "BBA_SCHOOL_CORE", "BBA_CORE", "BBA_GED", "BBA_GED_CHOICE_LANG",
+    "BBA_GED_CHOICE_HIS", "BBA_GED_CHOICE_POL", "BBA_GED_CHOICE_SOC",
+    "BBA_GED_CHOICE_SCI", "BBA_GED_CHOICE_LAB", "BBA_INTERNSHIP",
+)
+
+
+def _source_tables():
+    """Yield (group name, {code: (name, credits)}) for every course_db table."""
+    from engine import course_db
+    for name in _TABLE_NAMES:
+        yield name, getattr(course_db, name)
+    for conc, pools in course_db.BBA_CONC_COURSES.items():
+        yield f"BBA_CONC_{conc}_REQUIRED", pools["required"]
+        yield f"BBA_CONC_{conc}_ELECTIVE", pools["elective"]
+
+
+def _validate(tables, prerequisites):
+    """Return a list of problems found in the source tables (empty when consistent)."""
+    from engine import course_db
+    problems = []
+    credits_seen = {}
+    for group, table in tables:
+        for code, (_, credits) in table.items():
+            if not COURSE_CODE_FORMAT.match(code):
+                problems.append(f"{group}: malformed course code {code!r}")
+            if code in credits_seen and credits_seen[code][1] != credits:
+                problems.append(f"{code}: {credits}cr in {group} but "
+                                f"{credits_seen[code][1]}cr in {credits_seen[code][0]}")
+            credits_seen.setdefault(code, (group, credits))
+
+    for conc, pools in course_db.BBA_CONC_COURSES.items():
+        if conc not in course_db.BBA_CONC_LABELS:
+            problems.append(f"BBA_CONC_{conc}: no label in BBA_CONC_LABELS")
+        for code in pools["required"].keys() & pools["elective"].keys():
+            problems.append(f"BBA_CONC_{conc}: {code} is both required and elective")
+
+    for program, prereq_map in prerequisites.items():
+        for target, reqs in prereq_map.items():
+            for code in [target] + [r for r in reqs if r != SENIOR]:
+                if code not in credits_seen:
+                    problems.append(f"PREREQUISITES_{program}: unknown course {code}")
+        # Depth-first cycle check
+        state = {}
+
+        def visit(code, path):
+            if state.get(code) == 1:
+                problems.append(f"PREREQUISITES_{program}: cycle {' -> '.join(path + [code])}")
+                return
+            if state.get(code) == 2:
+                return
+            state[code] = 1
+            for req in prereq_map.get(code, ()):
+                if req != SENIOR:
+                    visit(req, path + [code])
+            state[code] = 2
+
+        for target in prereq_map:
+            visit(target, [])
+    return problems
+
+
+def _build_tables():
+    """
+    Validate the source tables and derive every lookup as plain dicts and
+    tuples (the form a snapshot stores). Raises ValueError listing every problem.
+    """
+    from engine import course_db
+    from engine.prerequisites import PREREQUISITES_CSE, PREREQUISITES_BBA
+
+    tables = list(_source_tables())
+    prerequisites = {"CSE": PREREQUISITES_CSE, "BBA": PREREQUISITES_BBA}
+    problems = _validate(tables, prerequisites)
+    if problems:
+        raise ValueError("Invalid course catalog:\n  " + "\n  ".join(problems))
+
+    category_flags = {group: 1 << i for i, (group, _) in enumerate(tables)}
+    all_courses = {}
+    flags = {}
+    for group, table in tables:
+        all_courses.update(table)
+        for code in table:
+            flags[code] = flags.get(code, 0) | category_flags[group]
+
+    codes = tuple(all_courses)
+    course_ids = {code: i for i, code in enumerate(codes)}
+    course_bits = {code: 1 << i for i, code in enumerate(codes)}
+
+    # Prerequisite DAG per program, in its own compact bit space so the masks
+    # stay small ints. Node 0 is the _SENIOR_ credit-threshold node.
+    prereq_nodes, prereq_bits, prereq_masks, prereq_closure = {}, {}, {}, {}
+    for program, prereq_map in prerequisites.items():
+        nodes = [SENIOR]
+        for target, reqs in prereq_map.items():
+            for code in (target, *reqs):
+                if code not in nodes:
+                    nodes.append(code)
+        bits = {code: 1 << i for i, code in enumerate(nodes)}
+        masks = {}
+        for target, reqs in prereq_map.items():
+            mask = 0
+            for req in reqs:
+                mask |= bits[req]
+            masks[target] = mask
+
+        # Transitive closure over the (validated, acyclic) DAG. Senior standing
+        # is a credit threshold rather than a course, so it is not inherited.
+        closure = {}
+
+        def ancestors(code):
+            if code not in closure:
+                mask = masks.get(code, 0) & ~SENIOR_BIT
+                for req in prereq_map.get(code, ()):
+                    if req != SENIOR:
+                        mask |= ancestors(req)
+                closure[code] = mask
+            return closure[code]
+
+        for target in masks:
+            ancestors(target)
+        prereq_nodes[program] = tuple(nodes)
+        prereq_bits[program] = {c: b for c, b in bits.items() if c != SENIOR}
+        prereq_masks[program] = masks
+        prereq_closure[program] = {t: closure[t] for t in masks}
+
+    return {
+        "ALL_COURSES": all_courses,
+        "COURSES": {
+            code: (course_ids[code], name, credits, flags[code])
+            for code, (name, credits) in all_courses.items()
+        },
+        "CODES": codes,
+        "COURSE_IDS": course_ids,
+        "COURSE_BITS": course_bits,
+        "CATEGORY_FLAGS": category_flags,
+        "GROUPS": {
+            group: {code: credits for code, (_, credits) in table.items()}
+            for group, table in tables
+        },
+        "GROUP_MASKS": {group: _group_mask(table, course_bits) for group, table in tables},
+        "PREREQUISITES": {
+            program: {t: tuple(r) for t, r in prereq_map.items()}
+            for program, prereq_map in prerequisites.items()
+        },
+        "PREREQ_NODES": prereq_nodes,
+        "PREREQ_BITS": prereq_bits,
+        "PREREQ_MASKS": prereq_masks,
+        "PREREQ_CLOSURE": prereq_closure,
+        "CONC_LABELS": dict(course_db.BBA_CONC_LABELS),
+    }
+
+
+def _group_mask(table, course_bits):
+    """(mask, ((code, credits, bit), ...)) for a requirement group, in curriculum order."""
+    members = tuple((code, credits, course_bits[code]) for code, (_, credits) in table.items())
+    mask = 0
+    for _, _, bit in members:
+        mask |= bit
+    return mask, members
+
+
+# Tables holding one mapping per group / program; frozen one level deeper
+_NESTED = {"GROUPS", "PREREQUISITES", "PREREQ_BITS", "PREREQ_MASKS", "PREREQ_CLOSURE"}
+
+
+def _freeze(tables):
+    """Wrap the plain tables from _build_tables() in read-only mapping proxies."""
+    frozen = {}
+    for name, value in tables.items():
+        if isinstance(value, dict):
+            if name in _NESTED:
+                value = {key: MappingProxyType(inner) for key, inner in value.items()}
+            value = MappingProxyType(value)
+        frozen[name] = value
+    return frozen
+
+
+def compile_catalog():
+    """
+    Validate the source tables and build the frozen catalog.
+    Returns a dict of read-only lookups; raises ValueError listing every problem.
+    """
+    return _freeze(_build_tables())
+
+
+# ─── Snapshot ───
+
+SNAPSHOT_VERSION = 1
+_ENGINE_DIR = os.path.dirname(os.path.abspath(__file__))
+SNAPSHOT_PATH = os.path.join(_ENGINE_DIR, "catalog.snapshot")
+_SOURCES = tuple(os.path.join(_ENGINE_DIR, name) for name in ("course_db.py", "prerequisites.py", "catalog.py"))
+
+
+def _source_stamps():
+    return tuple((st.st_size, st.st_mtime_ns) for st in map(os.stat, _SOURCES))
+
+
+def source_checksum():
+    """CRC-32 of the catalog sources and SNAPSHOT_VERSION."""
+    import zlib  # only needed once the sources' stat stamps have changed
+    checksum = zlib.crc32(str(SNAPSHOT_VERSION).encode())
+    for path in _SOURCES:
+        with open(path, "rb") as f:
+            checksum = zlib.crc32(f.read(), checksum)
+    return checksum
+
+
+def write_snapshot(path=SNAPSHOT_PATH):
+    """Compile the catalog from source and marshal it to path. Returns the snapshot size in bytes."""
+    tables = _build_tables()
+    data = marshal.dumps((SNAPSHOT_VERSION, _source_stamps(), source_checksum(), tables))
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)  # readers never see a half-written snapshot
+    return len(data)
+
+
+def read_snapshot(path=SNAPSHOT_PATH):
+    """The plain tables stored in a current snapshot, or None when it is missing, stale or unreadable."""
+    try:
+        with open(path, "rb") as f:
+            version, stamps, checksum, tables = marshal.loads(f.read())
+        if version != SNAPSHOT_VERSION or not isinstance(tables, dict):
+            return None
+        if stamps != _source_stamps() and checksum != source_checksum():
+            return None
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    return tables
+
+
+def load_catalog(path=SNAPSHOT_PATH):
+    """The frozen catalog from a current snapshot, else compiled from source."""
+    tables = read_snapshot(path)
+    if tables is None:
+        return compile_catalog()
+    return _freeze(tables)
+
+
+_CATALOG = None
+
+_EXPORTS = {
+    "ALL_COURSES",     # code → (name, credits)
+    "COURSES",         # code → (id, name, credits, flags)
+    "CODES",           # id → code
+    "COURSE_IDS",
+    "COURSE_BITS",
+    "CATEGORY_FLAGS",  # group name → category flag
+    "GROUPS",          # group name → {code: credits}
+    "GROUP_MASKS",     # group name → (mask, ((code, credits, bit), ...))
+    "PREREQUISITES",   # program → {code: (prereq, ...)}
+    "PREREQ_NODES",    # program → (SENIOR, code, ...)
+    "PREREQ_BITS",     # program → {code: node bit}
+    "PREREQ_MASKS",    # program → {code: prereq mask}
+    "PREREQ_CLOSURE",  # program → {code: transitive prereq mask}
+    "CONC_LABELS",     # concentration → label
+}
+
+
+def _catalog():
+    """The catalog, loaded on first use and bound as module globals."""
+    global _CATALOG
+    if _CATALOG is None:
+        _CATALOG = load_catalog()
+        globals().update(_CATALOG)  # later lookups skip __getattr__
+    return _CATALOG
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return _catalog()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _EXPORTS)
+
+
+def in_group(code, group):
+    """True if the course belongs to the named requirement group."""
+    catalog = _catalog()
+    course = catalog["COURSES"].get(code)
+    return course is not None and bool(course[3] & catalog["CATEGORY_FLAGS"][group])
+
+
+def prereq_codes(program, mask):
+    """Decode a prerequisite-DAG mask into course codes, in DAG node order."""
+    nodes = _catalog()["PREREQ_NODES"][program]
+    codes = []
+    mask &= ~SENIOR_BIT
+    while mask:
+        low = mask & -mask
+        codes.append(nodes[low.bit_length() - 1])
+        mask ^= low
+    return codes
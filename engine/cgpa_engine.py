@@ -4,6 +4,8 @@ Computes CGPA from transcript records, handles waiver logic,
 and determines academic standing.
 """
 
+from engine.credit_engine import Transcript, GRADE_CODES, STATUS_IDS
+
 # Grade-to-GPA point mapping (NSU 4.0 scale)
 GRADE_POINTS = {
     "A": 4.0, "A-": 3.7,
@@ -35,6 +37,13 @@ def compute_cgpa(records):
 
     Returns (cgpa, total_quality_points, total_gpa_credits)
     """
+    if isinstance(records, Transcript):
+        total_quality_points, total_gpa_credits = _sum_quality_points_columns(records)
+        if total_gpa_credits == 0:
+            return 0.0, 0.0, 0
+        cgpa = total_quality_points / total_gpa_credits
+        return int(cgpa * 100) / 100.0, round(total_quality_points, 2), total_gpa_credits
+
     total_quality_points = 0.0
     total_gpa_credits = 0
 
@@ -70,6 +79,12 @@ def compute_major_cgpa(records, major_course_codes):
     Same rules as compute_cgpa but filtered to the given course codes.
     """
     major_codes = set(major_course_codes)
+    if isinstance(records, Transcript):
+        total_qp, total_cr = _sum_quality_points_columns(records, major_codes)
+        if total_cr == 0:
+            return 0.0
+        return int(total_qp / total_cr * 100) / 100.0
+
     total_qp = 0.0
     total_cr = 0
 
@@ -94,6 +109,62 @@ def compute_major_cgpa(records, major_course_codes):
     return int(major_cgpa * 100) / 100.0
 
 
+def compute_major_cgpas(records, code_groups):
+    """
+    compute_major_cgpa() for several course-code groups in one pass.
+    code_groups: {name: course codes}. Returns {name: cgpa}; each group's
+    quality points are summed in record order, so every value equals
+    compute_major_cgpa(records, codes).
+    """
+    if isinstance(records, Transcript):
+        return {name: compute_major_cgpa(records, codes) for name, codes in code_groups.items()}
+
+    groups_of = {}
+    for name, codes in code_groups.items():
+        for code in set(codes):
+            groups_of.setdefault(code, []).append(name)
+    totals = {name: [0.0, 0] for name in code_groups}
+
+    for r in records:
+        names = groups_of.get(r.course_code)
+        if names is None or r.status not in ("BEST", "FAILED") or r.credits == 0:
+            continue
+        points = grade_to_points(r.grade)
+        if points is None:
+            continue
+        for name in names:
+            total = totals[name]
+            total[0] += points * r.credits
+            total[1] += r.credits
+
+    return {name: int(qp / cr * 100) / 100.0 if cr else 0.0 for name, (qp, cr) in totals.items()}
+
+
+def _sum_quality_points_columns(transcript, course_codes=None):
+    """
+    Sum quality points and GPA credits over a columnar Transcript, in record
+    order (same float result as the record loop). Optionally restricted to course_codes.
+    Returns (total_quality_points, total_gpa_credits)
+    """
+    counted_status = (STATUS_IDS["BEST"], STATUS_IDS["FAILED"])
+    points_by_id = [grade_to_points(g) for g in GRADE_CODES]
+
+    total_qp = 0.0
+    total_cr = 0
+    for code, cr, gid, sid in zip(transcript.codes, transcript.credits,
+                                  transcript.grade_ids, transcript.status_ids):
+        if sid not in counted_status or cr == 0:
+            continue
+        if course_codes is not None and code not in course_codes:
+            continue
+        points = points_by_id[gid]
+        if points is None:
+            continue
+        total_qp += points * cr
+        total_cr += cr
+    return total_qp, total_cr
+
+
 def determine_standing(cgpa):
     """Determine academic standing based on overall CGPA."""
     if cgpa < 2.0:
@@ -101,49 +172,169 @@ def determine_standing(cgpa):
     return "NORMAL"
 
 
-def calculate_probation_history(records):
+def probation_label(consecutive_p):
+    """Map a count of consecutive sub-2.0 semesters to its standing label."""
+    if consecutive_p == 0:
+        return "NORMAL"
+    elif consecutive_p == 1:
+        return "PROBATION (P1)"
+    elif consecutive_p == 2:
+        return "PROBATION (P2)"
+    else:
+        return "DISMISSAL"
+
+
+def _snapshot_cgpa(best, qp10, gpa_credits):
     """
-    Calculate the probation phase (P1, P2, etc.) based on consecutive semesters < 2.0 CGPA.
-    NSU Policy: 2 consecutive semesters allowed; dismissal in the 3rd if still < 2.0.
+    Truncated CGPA for the running totals of iter_probation_timeline().
+    qp10 is the exact quality-point total in tenths of a point, so the NSU
+    truncation can be done in integers. Only when the exact value lands on a
+    hundredth boundary (e.g. 2.30) can float rounding change the truncated
+    digit, so those snapshots are re-summed in transcript order exactly as
+    compute_cgpa() would.
+    """
+    if gpa_credits == 0:
+        return 0.0
+    if (qp10 * 10) % gpa_credits:
+        return (qp10 * 10 // gpa_credits) / 100.0
+
+    total_quality_points = 0.0
+    for _, _, r, grade in sorted(best.values(), key=lambda b: b[1]):
+        points = grade_to_points(grade)
+        if points is None or r.credits == 0:
+            continue
+        total_quality_points += points * r.credits
+    cgpa = total_quality_points / gpa_credits
+    return int(cgpa * 100) / 100.0
+
+
+def iter_probation_timeline(records, current_semester=None):
+    """
+    Walk the transcript once, semester by semester in chronological order, and
+    yield the cumulative standing after each semester.
+
+    Equivalent to running resolve_retakes() + compute_cgpa() on every prefix of
+    the transcript, but keeps a running best attempt per course plus running
+    quality points / GPA credits instead of re-copying and re-resolving.
+    Records whose semester is not on the academic timeline are skipped;
+    current_semester is passed through to the Incomplete -> F rule.
+
+    Yields dicts with: semester, records (attempts taken that semester),
+    cgpa, gpa_credits, consecutive_p, standing
     """
-    from engine.credit_engine import SEMESTERS, resolve_retakes
-    import copy
+    from engine.credit_engine import semester_ordinal
+
+    by_sem = {}
+    sem_ordinals = {}
+    for i, r in enumerate(records):
+        ordinal = semester_ordinal(r.semester)
+        if ordinal >= 0:
+            by_sem.setdefault(r.semester, []).append((i, r))
+            sem_ordinals[r.semester] = ordinal
+    return _iter_timeline(by_sem, sem_ordinals, current_semester)
 
-    sem_map = {sem: i for i, sem in enumerate(SEMESTERS)}
-    
-    # Filter and sort unique semesters present in the transcript
-    transcript_sems = sorted(list(set(r.semester for r in records if r.semester in sem_map)), 
-                            key=lambda s: sem_map[s])
-    
-    if not transcript_sems:
-        return "NORMAL", 0
 
+def _iter_timeline(by_sem, sem_ordinals, current_semester=None):
+    """
+    iter_probation_timeline() over records already grouped by semester:
+    by_sem maps semester -> [(transcript index, record), ...] and sem_ordinals
+    maps semester -> ordinal (on-timeline semesters only).
+    """
+    from engine.credit_engine import PASSING_GRADES, CAPSTONES, _current_ordinal, _grade_rank
+
+    current_index = _current_ordinal(current_semester)
+    b_minus_rank = _grade_rank("B-")
+
+    best = {}            # course_code -> (rank, index, record, effective grade)
+    passed_b_minus = set()  # courses whose later attempts are unauthorized retakes
+    qp10 = 0             # quality points of counted attempts, in tenths
+    gpa_credits = 0
     consecutive_p = 0
-    for current_sem in transcript_sems:
-        cutoff_idx = sem_map[current_sem]
-        # Get attempts up to this semester
-        subset = [copy.copy(r) for r in records if r.semester in sem_map and sem_map[r.semester] <= cutoff_idx]
-        
-        # Resolve retakes based on knowledge UP TO this semester
-        resolved_subset = resolve_retakes(subset)
-        
-        # Compute CGPA for this snapshot
-        snap_cgpa, _, _ = compute_cgpa(resolved_subset)
-        
+
+    for current_sem in sorted(by_sem, key=lambda s: sem_ordinals[s]):
+        sem_records = by_sem[current_sem]
+        for i, r in sem_records:
+            code = r.course_code
+            grade = r.grade
+
+            # Same sequential policies as resolve_retakes()
+            if grade == "I" and current_index - sem_ordinals[current_sem] > 1:
+                grade = "F"
+            if grade == "T" and code in CAPSTONES:
+                continue  # REJECTED-TRANSFER
+            if code in passed_b_minus:
+                continue  # UNAUTHORIZED-RETAKE
+            rank = _grade_rank(grade)
+            if grade in PASSING_GRADES and rank >= b_minus_rank:
+                passed_b_minus.add(code)
+            if r.status in ("UNAUTHORIZED-RETAKE", "REJECTED-TRANSFER"):
+                continue
+
+            prev = best.get(code)
+            if prev is not None and rank <= prev[0]:
+                continue
+
+            # Swap the course's counted attempt
+            if prev is not None:
+                old_points = grade_to_points(prev[3])
+                if old_points is not None and prev[2].credits != 0:
+                    qp10 -= round(old_points * 10) * prev[2].credits
+                    gpa_credits -= prev[2].credits
+            points = grade_to_points(grade)
+            if points is not None and r.credits != 0:
+                qp10 += round(points * 10) * r.credits
+                gpa_credits += r.credits
+            best[code] = (rank, i, r, grade)
+
+        snap_cgpa = _snapshot_cgpa(best, qp10, gpa_credits)
         if snap_cgpa < 2.0:
             consecutive_p += 1
         else:
             consecutive_p = 0
 
-    # Map count to label
-    if consecutive_p == 0:
-        return "NORMAL", 0
-    elif consecutive_p == 1:
-        return "PROBATION (P1)", 1
-    elif consecutive_p == 2:
-        return "PROBATION (P2)", 2
-    else:
-        return "DISMISSAL", consecutive_p
+        yield {
+            "semester": current_sem,
+            "records": [r for _, r in sem_records],
+            "cgpa": snap_cgpa,
+            "gpa_credits": gpa_credits,
+            "consecutive_p": consecutive_p,
+            "standing": probation_label(consecutive_p),
+        }
+
+
+def calculate_probation_history(records, current_semester=None):
+    """
+    Calculate the probation phase (P1, P2, etc.) based on consecutive semesters < 2.0 CGPA.
+    NSU Policy: 2 consecutive semesters allowed; dismissal in the 3rd if still < 2.0.
+    """
+    return _final_standing(iter_probation_timeline(records, current_semester))
+
+
+def probation_by_semester(by_semester, current_semester=None):
+    """
+    calculate_probation_history() over records already grouped by semester,
+    as scan_records() collects them: {semester: [(transcript index, record), ...]}.
+    Semesters off the academic timeline are skipped.
+    """
+    from engine.credit_engine import semester_ordinal
+
+    timeline_by_sem = {}
+    sem_ordinals = {}
+    for sem, pairs in by_semester.items():
+        ordinal = semester_ordinal(sem)
+        if ordinal >= 0:
+            timeline_by_sem[sem] = pairs
+            sem_ordinals[sem] = ordinal
+    return _final_standing(_iter_timeline(timeline_by_sem, sem_ordinals, current_semester))
+
+
+def _final_standing(timeline):
+    """(standing label, consecutive probation count) after the last semester of a timeline."""
+    consecutive_p = 0
+    for snap in timeline:
+        consecutive_p = snap["consecutive_p"]
+
+    return probation_label(consecutive_p), consecutive_p
 
 
 def check_waivers_cse(records):
@@ -216,13 +407,21 @@ def process_cgpa(records, program="CSE", user_waivers=None):
     """
     cgpa, qp, gc = compute_cgpa(records)
     standing, p_count = calculate_probation_history(records)
+    return build_cgpa_data(program, cgpa, qp, gc, standing, p_count, records, user_waivers)
+
 
+def build_cgpa_data(program, cgpa, qp, gc, standing, p_count, waiver_records, user_waivers=None):
+    """
+    The process_cgpa() result dict from its computed parts. Waivers come from
+    user_waivers when given, else from waiver_records (any records holding
+    the ENG102 / BUS112 attempts).
+    """
     if user_waivers is not None:
         waivers, credit_reduction = check_waivers_from_input(program, user_waivers)
     elif program.upper() == "CSE":
-        waivers, credit_reduction = check_waivers_cse(records)
+        waivers, credit_reduction = check_waivers_cse(waiver_records)
     else:
-        waivers, credit_reduction = check_waivers_bba(records)
+        waivers, credit_reduction = check_waivers_bba(waiver_records)
 
     return {
         "cgpa": cgpa,
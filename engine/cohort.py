@@ -0,0 +1,339 @@
+"""
+Cohort Engine — vectorised Level 1 / Level 2 totals (requires NumPy)
+Batch forms of calculate_credits(), compute_cgpa() and compute_major_cgpa()
+for a whole cohort held in flat NumPy columns: every student's rows are a
+contiguous slice [offsets[i], offsets[i + 1]), and each total is a masked
+column reduced per student with np.add.reduceat. batch_probation_timeline()
+gives iter_probation_timeline()'s semester-by-semester CGPA and standing as
+(student × semester) matrices.
+
+CGPA truncation is done in integers on quality points counted in tenths
+(every grade point is a multiple of 0.1), as iter_probation_timeline() does.
+Only when the exact CGPA lands on a hundredth boundary can float rounding
+change the truncated digit; those students are re-summed in record order
+exactly as compute_cgpa() adds them, so results match the per-student engine.
+"""
+
+import numpy as np
+
+from engine.credit_engine import (parse_transcript, parse_rows, resolve_retakes, Transcript,
+                                  GRADE_CODES, STATUS_CODES, PASSING_GRADES)
+from engine.cgpa_engine import grade_to_points, probation_label
+
+
+def build_cohort(transcripts):
+    """
+    Concatenate resolved columnar Transcripts into one cohort.
+    Returns dict with: offsets (int64[n+1]), credits, grade_ids, status_ids,
+    sem_ordinals, code_ids (int32, index into codes) and codes.
+    """
+    codes, code_index = [], {}
+    offsets = np.zeros(len(transcripts) + 1, dtype=np.int64)
+    parts = {"credits": [], "grade_ids": [], "status_ids": [], "sem_ordinals": []}
+    code_ids = []
+    for i, t in enumerate(transcripts):
+        offsets[i + 1] = offsets[i] + len(t)
+        for name, column in t.to_numpy().items():
+            parts[name].append(column)
+        for code in t.codes:
+            cid = code_index.get(code)
+            if cid is None:
+                cid = code_index[code] = len(codes)
+                codes.append(code)
+            code_ids.append(cid)
+    cohort = {name: (np.concatenate(cols) if cols else np.zeros(0, dtype=np.int16))
+              for name, cols in parts.items()}
+    cohort["offsets"] = offsets
+    cohort["code_ids"] = np.array(code_ids, dtype=np.int32)
+    cohort["codes"] = codes
+    return cohort
+
+
+def load_cohort(paths):
+    """build_cohort() from transcript CSV paths (parsed and retake-resolved)."""
+    return build_cohort([Transcript.from_records(resolve_retakes(parse_transcript(p))) for p in paths])
+
+
+def cohort_from_corpus(corpus):
+    """build_cohort() from an engine.corpus packed corpus, in student order."""
+    return build_cohort([Transcript.from_records(resolve_retakes(parse_rows(corpus.rows(i))))
+                         for i in range(len(corpus))])
+
+
+# ─── Segment Reductions ─────────────────────────────────
+
+def _segment_sum(values, offsets):
+    """Per-student int64 sums of values over the row ranges in offsets (0 for empty students)."""
+    starts = offsets[:-1]
+    sums = np.zeros(len(starts), dtype=np.int64)
+    # Students starting at len(values) have no rows; reduceat needs in-range indexes
+    n = int(np.searchsorted(starts, len(values)))
+    if n:
+        sums[:n] = np.add.reduceat(values, starts[:n], dtype=np.int64)
+        sums[:n][starts[:n] == offsets[1:n + 1]] = 0
+    return sums
+
+
+def _row_classes(cohort):
+    """
+    status_id * len(GRADE_CODES) + grade_id for every row, so one small lookup
+    table answers any (status, grade) rule. Cached on the cohort.
+    """
+    classes = cohort.get("_row_classes")
+    if classes is None:
+        classes = cohort["status_ids"].astype(np.int16) * len(GRADE_CODES) + cohort["grade_ids"]
+        cohort["_row_classes"] = classes
+    return classes
+
+
+def _class_table(fn, dtype):
+    """fn(status, grade) for every row class (see _row_classes)."""
+    return np.array([fn(s, g) for s in STATUS_CODES for g in GRADE_CODES], dtype=dtype)
+
+
+def _positive_credits(cohort):
+    """Credits column with non-positive values zeroed (they never count as attempted/earned)."""
+    credits = cohort["credits"]
+    return credits if len(credits) == 0 or credits.min() >= 0 else np.maximum(credits, 0)
+
+
+def batch_calculate_credits(cohort):
+    """calculate_credits() for every student. Returns (credits_attempted, credits_earned) int64 arrays."""
+    classes = _row_classes(cohort)
+    credits = _positive_credits(cohort)
+    attempted_rows = _class_table(lambda s, g: g not in ("W", "T"), np.int16)[classes]
+    earned_rows = _class_table(lambda s, g: s in ("BEST", "WAIVED") and g in PASSING_GRADES,
+                               np.int16)[classes]
+    offsets = cohort["offsets"]
+    return (_segment_sum(attempted_rows * credits, offsets),
+            _segment_sum(earned_rows * credits, offsets))
+
+
+def _truncated_cgpa(cohort, row_mask=None):
+    """
+    compute_cgpa() over the rows it counts (BEST/FAILED, GPA grades), optionally
+    restricted to row_mask. Returns (cgpa, quality_points, gpa_credits) arrays.
+    """
+    offsets = cohort["offsets"]
+    classes = _row_classes(cohort)
+    credits = cohort["credits"].astype(np.int32)
+
+    def counted(s, g):
+        return s in ("BEST", "FAILED") and grade_to_points(g) is not None
+
+    counted_rows = _class_table(counted, np.int32)[classes]
+    if row_mask is not None:
+        counted_rows *= row_mask
+    points10 = _class_table(lambda s, g: round(grade_to_points(g) * 10) if counted(s, g) else 0,
+                            np.int32)[classes]
+    qp10 = _segment_sum(points10 * counted_rows * credits, offsets)
+    gpa_credits = _segment_sum(counted_rows * credits, offsets)
+
+    has_credits = gpa_credits > 0
+    safe_credits = np.where(has_credits, gpa_credits, 1)
+    cgpa = np.where(has_credits, (qp10 * 10 // safe_credits) / 100.0, 0.0)
+
+    # Exact hundredth boundaries: redo compute_cgpa()'s float sum in record order,
+    # one row position at a time across all those students (adding 0.0 for rows
+    # it skips leaves the running total unchanged).
+    boundary = np.flatnonzero(has_credits & ((qp10 * 10) % safe_credits == 0))
+    if len(boundary):
+        points = _class_table(lambda s, g: grade_to_points(g) if counted(s, g) else 0.0,
+                              np.float64)
+        starts = offsets[boundary]
+        lengths = offsets[boundary + 1] - starts
+        total_qp = np.zeros(len(boundary))
+        for j in range(int(lengths.max())):
+            live = lengths > j
+            rows = starts[live] + j
+            total_qp[live] += points[classes[rows]] * (counted_rows[rows] * credits[rows])
+        cgpa[boundary] = np.floor(total_qp / gpa_credits[boundary] * 100) / 100.0
+
+    return cgpa, qp10 / 10.0, gpa_credits
+
+
+def batch_compute_cgpa(cohort):
+    """compute_cgpa() for every student. Returns (cgpa, quality_points, gpa_credits) arrays."""
+    return _truncated_cgpa(cohort)
+
+
+def batch_compute_major_cgpa(cohort, major_course_codes):
+    """compute_major_cgpa() for every student over the given course codes. Returns a cgpa array."""
+    major = set(major_course_codes)
+    in_major = np.array([code in major for code in cohort["codes"]], dtype=np.int32)
+    row_mask = in_major[cohort["code_ids"]] if len(in_major) else np.zeros(0, dtype=np.int32)
+    return _truncated_cgpa(cohort, row_mask)[0]
+
+
+# ─── Probation Timeline ─────────────────────────────────
+
+def batch_probation_timeline(cohort, current_semester=None):
+    """
+    iter_probation_timeline() for every student at once, as (student × semester)
+    matrices over the cohort's semester axis (every on-timeline semester any
+    student attended, in order).
+
+    Each (student, course) group of counted attempts is walked in timeline
+    order; an attempt that beats the group's running best grade swaps in its
+    quality points and GPA credits, so per-semester deltas summed with a
+    cumulative sum give the running totals after every semester. Consecutive
+    probation is the run length of sub-2.0 snapshots within a student.
+
+    The cohort must be built from retake-resolved transcripts (build_cohort()),
+    whose statuses already mark the attempts the timeline skips.
+
+    Returns dict with: semesters (labels), semester_ordinals, cgpa (float64,
+    NaN where the student has no record that semester), consecutive_p and
+    standing (int8, -1 where no record; standing indexes standing_labels),
+    standing_labels, final_consecutive_p and final_standing (per student, as
+    calculate_probation_history()).
+    """
+    from engine.credit_engine import CAPSTONES, Semester, _current_ordinal, _grade_rank
+
+    offsets = cohort["offsets"]
+    n_students = len(offsets) - 1
+    n_codes = max(len(cohort["codes"]), 1)
+    sem_ordinals = cohort["sem_ordinals"].astype(np.int64)
+    student_ids = np.repeat(np.arange(n_students), np.diff(offsets))
+    labels = [probation_label(k) for k in range(4)]
+
+    # Semester axis, and one snapshot per (student, semester) with any on-timeline record
+    on_timeline = sem_ordinals >= 0
+    axis = np.flatnonzero(np.bincount(sem_ordinals[on_timeline], minlength=1))
+    n_sems = len(axis)
+    column = np.zeros(int(axis[-1]) + 1 if n_sems else 1, dtype=np.int64)
+    column[axis] = np.arange(n_sems)
+    row_cells = student_ids * n_sems + column[np.where(on_timeline, sem_ordinals, 0)]
+    attended = np.zeros(n_students * n_sems, dtype=bool)
+    attended[row_cells[on_timeline]] = True
+    snap_cells = np.flatnonzero(attended)
+    snap_students = snap_cells // max(n_sems, 1)
+    snap_columns = snap_cells - snap_students * n_sems
+    snap_ordinals = axis[snap_columns]
+
+    # Effective grade (Incomplete expires to F) → rank, points (tenths) and float points
+    grade_ids = cohort["grade_ids"].astype(np.int64)
+    expired = ((grade_ids == GRADE_CODES.index("I"))
+               & (_current_ordinal(current_semester) - sem_ordinals > 1))
+    grade_ids[expired] = GRADE_CODES.index("F")
+    rank_table = np.array([_grade_rank(g) for g in GRADE_CODES], dtype=np.int64)
+    rank_table += 1 - rank_table.min()  # ≥ 1
+    gpa_table = np.array([grade_to_points(g) is not None for g in GRADE_CODES])
+    points10_table = np.array([round(grade_to_points(g) * 10) if grade_to_points(g) is not None else 0
+                               for g in GRADE_CODES], dtype=np.int64)
+    points_table = np.array([grade_to_points(g) or 0.0 for g in GRADE_CODES])
+
+    # Counted attempts: on the timeline, not a rejected transfer or unauthorized retake
+    skipped = np.array([s in ("UNAUTHORIZED-RETAKE", "REJECTED-TRANSFER") for s in STATUS_CODES])
+    capstone = np.array([code in CAPSTONES for code in cohort["codes"]], dtype=bool)
+    keep = on_timeline & ~skipped[cohort["status_ids"]]
+    if len(capstone):
+        keep &= ~((grade_ids == GRADE_CODES.index("T")) & capstone[cohort["code_ids"]])
+    rows = np.flatnonzero(keep)
+
+    # Timeline order within each (student, course): semester, then transcript order
+    group = student_ids[rows] * n_codes + cohort["code_ids"][rows]
+    order = np.argsort(group * max(n_sems, 1) + column[sem_ordinals[rows]], kind="stable")
+    rows, group = rows[order], group[order]
+    first = np.ones(len(rows), dtype=bool)
+    first[1:] = group[1:] != group[:-1]
+
+    # An attempt becomes the counted one when it beats every earlier attempt in its group
+    rank = rank_table[grade_ids[rows]]
+    span = int(rank_table.max()) + 1
+    group_no = np.cumsum(first)
+    running = np.maximum.accumulate(group_no * span + rank)
+    improves = first.copy()
+    improves[1:] |= rank[1:] > running[:-1] - group_no[1:] * span
+    best_rows = rows[improves]
+    best_first = first[improves]
+
+    credits = cohort["credits"].astype(np.int64)
+    counts = gpa_table[grade_ids[best_rows]] & (credits[best_rows] != 0)
+    qp10 = np.where(counts, points10_table[grade_ids[best_rows]] * credits[best_rows], 0)
+    gpa_cr = np.where(counts, credits[best_rows], 0)
+    deltas = []
+    for value in (qp10, gpa_cr):
+        delta = value.copy()
+        delta[1:] -= np.where(best_first[1:], 0, value[:-1])
+        deltas.append(delta)
+
+    # Per-snapshot deltas → running totals within each student
+    snap_of_cell = np.cumsum(attended) - 1
+    event_snaps = snap_of_cell[row_cells[best_rows]]
+    student_first = np.ones(len(snap_cells), dtype=bool)
+    student_first[1:] = snap_students[1:] != snap_students[:-1]
+    starts = np.flatnonzero(student_first)
+    seg = np.cumsum(student_first) - 1
+    running_totals = []
+    for delta in deltas:
+        totals = np.zeros(len(snap_cells), dtype=np.int64)
+        np.add.at(totals, event_snaps, delta)
+        totals = np.cumsum(totals)
+        totals -= np.where(starts > 0, totals[starts - 1], 0)[seg]
+        running_totals.append(totals)
+    snap_qp10, snap_cr = running_totals
+
+    has_credits = snap_cr != 0
+    safe_cr = np.where(has_credits, snap_cr, 1)
+    cgpa = np.where(has_credits, (snap_qp10 * 10 // safe_cr) / 100.0, 0.0)
+
+    # Exact hundredth boundaries: _snapshot_cgpa()'s float sum over the counted
+    # attempts in transcript order, one row position at a time (an attempt counts
+    # at a snapshot from its semester until the group's next improvement).
+    boundary = np.flatnonzero(has_credits & ((snap_qp10 * 10) % safe_cr == 0))
+    if len(boundary):
+        never = np.iinfo(np.int16).max
+        valid_from = np.full(len(credits), never, dtype=np.int16)
+        valid_until = np.full(len(credits), never, dtype=np.int16)
+        valid_from[best_rows] = sem_ordinals[best_rows]
+        nxt = np.full(len(best_rows), never, dtype=np.int16)
+        nxt[:-1] = np.where(best_first[1:], never, sem_ordinals[best_rows[1:]])
+        valid_until[best_rows] = nxt
+        values = np.where(gpa_table[grade_ids] & (credits != 0),
+                          points_table[grade_ids] * credits, 0.0)
+        # Longest transcripts first, so the snapshots still walking are a prefix
+        b_students = snap_students[boundary]
+        lengths = offsets[b_students + 1] - offsets[b_students]
+        by_length = np.argsort(-lengths, kind="stable")
+        boundary, b_students, lengths = boundary[by_length], b_students[by_length], lengths[by_length]
+        b_starts = offsets[b_students]
+        b_ordinals = snap_ordinals[boundary].astype(np.int16)
+        live_counts = np.searchsorted(-lengths, -np.arange(int(lengths[0])))  # lengths > j
+        total_qp = np.zeros(len(boundary))
+        for j, k in enumerate(live_counts):
+            r = b_starts[:k] + j
+            o = b_ordinals[:k]
+            total_qp[:k] += np.where((valid_from[r] <= o) & (o < valid_until[r]), values[r], 0.0)
+        cgpa[boundary] = np.floor(total_qp / snap_cr[boundary] * 100) / 100.0
+
+    # Consecutive probation: run length of sub-2.0 snapshots within each student
+    idx = np.arange(len(snap_cells))
+    probation = cgpa < 2.0
+    reset = np.where(probation, -1, idx)
+    reset[starts] = np.where(probation[starts], starts - 1, starts)
+    consecutive = idx - np.maximum.accumulate(reset) if len(idx) else idx
+
+    cgpa_matrix = np.full((n_students, n_sems), np.nan)
+    consecutive_matrix = np.full((n_students, n_sems), -1, dtype=np.int8)
+    standing_matrix = np.full((n_students, n_sems), -1, dtype=np.int8)
+    cells = (snap_students, snap_columns)
+    cgpa_matrix[cells] = cgpa
+    consecutive_matrix[cells] = np.minimum(consecutive, 127)
+    standing_matrix[cells] = np.minimum(consecutive, 3)
+
+    final_consecutive = np.zeros(n_students, dtype=np.int64)
+    if len(idx):
+        last = np.append(starts[1:], len(idx)) - 1
+        final_consecutive[snap_students[last]] = consecutive[last]
+
+    return {
+        "semesters": [str(Semester.from_ordinal(int(o))) for o in axis],
+        "semester_ordinals": axis,
+        "cgpa": cgpa_matrix,
+        "consecutive_p": consecutive_matrix,
+        "standing": standing_matrix,
+        "standing_labels": labels,
+        "final_consecutive_p": final_consecutive,
+        "final_standing": np.minimum(final_consecutive, 3).astype(np.int8),
+    }
@@ -0,0 +1,143 @@
+"""
+Combined Exports — streaming reader for multi-student transcript CSVs
+The registrar exports one CSV for a whole cohort, with a student_id column
+next to the usual course_code, course_name, credits, grade and semester
+columns (optionally program and concentration too). iter_students() turns such
+a file into one group of rows per student, ready for audit_transcript().
+
+  - Grouped input (presorted=True): each student's rows are contiguous, in
+    any student order (e.g. sorted by id, lexically or numerically). Rows are
+    grouped as they stream past, so memory is bounded by the largest single
+    transcript plus the set of student_ids seen.
+  - Unsorted input: an external merge sort. Runs of at most run_rows rows are
+    sorted by student_id in memory and spilled to temporary files, then merged;
+    memory is bounded by the run size plus one transcript. Rows of a student
+    keep their order in the export.
+"""
+
+import csv
+import heapq
+import itertools
+import os
+import tempfile
+from operator import itemgetter
+
+COURSE_COLUMNS = ("course_code", "course_name", "credits", "grade", "semester")
+OPTIONAL_COLUMNS = ("program", "concentration")
+DEFAULT_RUN_ROWS = 200000
+MERGE_FANIN = 64  # runs merged at once; more runs are merged in passes
+
+
+def _column_indexes(header, path):
+    """Map header names (case-insensitive) to column indexes; student_id and the course columns are required."""
+    names = [cell.strip().lower() for cell in header]
+    missing = [c for c in ("student_id",) + COURSE_COLUMNS if c not in names]
+    if missing:
+        raise ValueError(f"{path}: not a combined transcript export (missing column(s): {', '.join(missing)})")
+    return {name: names.index(name) for name in ("student_id",) + COURSE_COLUMNS + OPTIONAL_COLUMNS
+            if name in names}
+
+
+def _read_rows(path):
+    """
+    Yield (student_id, program, concentration, code, name, credits, grade, semester)
+    for every course row, cells stripped. Short rows and rows without a
+    student_id are skipped.
+    """
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        index = _column_indexes(header, path)
+        picks = [index["student_id"], index.get("program"), index.get("concentration")]
+        picks += [index[c] for c in COURSE_COLUMNS]
+        width = max(i for i in picks if i is not None) + 1
+        for row in reader:
+            if len(row) < width or not row[picks[0]].strip():
+                continue
+            yield tuple(row[i].strip() if i is not None else "" for i in picks)
+
+
+def _group(rows, check_grouped=False, path=None):
+    """
+    Group consecutive rows by student_id. With check_grouped a student_id
+    whose rows reappear after another student's raises ValueError.
+    Yields (student_id, program, concentration, [(code, name, credits, grade, semester), ...]).
+    """
+    finished = set()
+    for student_id, group in itertools.groupby(rows, key=itemgetter(0)):
+        if check_grouped:
+            if student_id in finished:
+                raise ValueError(f"{path}: rows of student_id '{student_id}' are not contiguous")
+            finished.add(student_id)
+        course_rows = []
+        program = concentration = ""
+        for row in group:
+            program = program or row[1]
+            concentration = concentration or row[2]
+            course_rows.append(row[3:])
+        yield student_id, program.upper() or None, concentration.upper() or None, course_rows
+
+
+def _write_run(rows, directory):
+    fd, path = tempfile.mkstemp(suffix=".run.csv", dir=directory)
+    with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+        csv.writer(f).writerows(rows)
+    return path
+
+
+def _read_run(path):
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        for row in csv.reader(f):
+            yield tuple(row)
+
+
+def _merge_runs(runs, directory):
+    """heapq.merge the sorted run files into one sorted stream (stable: earlier runs win ties)."""
+    while len(runs) > MERGE_FANIN:
+        batch, runs = runs[:MERGE_FANIN], runs[MERGE_FANIN:]
+        # Merge the earliest runs into one
+        merged = _write_run(heapq.merge(*map(_read_run, batch), key=itemgetter(0)), directory)
+        for path in batch:
+            os.remove(path)
+        runs.insert(0, merged)  # holds the earliest rows, so it stays first for ties
+    return heapq.merge(*map(_read_run, runs), key=itemgetter(0))
+
+
+def _externally_sorted(rows, run_rows, tmp_dir):
+    """rows sorted by student_id (stable), spilling runs of run_rows rows to disk when needed."""
+    rows = iter(rows)
+    run = list(itertools.islice(rows, run_rows))
+    run.sort(key=itemgetter(0))
+    following = list(itertools.islice(rows, 1))
+    if not following:
+        yield from run  # the whole export fits in one run: no spill
+        return
+
+    with tempfile.TemporaryDirectory(prefix="nsu_combined_", dir=tmp_dir) as directory:
+        runs = [_write_run(run, directory)]
+        run = following
+        while run:
+            run.extend(itertools.islice(rows, run_rows - len(run)))
+            run.sort(key=itemgetter(0))
+            runs.append(_write_run(run, directory))
+            run = list(itertools.islice(rows, 1))
+        # Runs are in export order and each sort is stable, so ties keep export order
+        yield from _merge_runs(runs, directory)
+
+
+def iter_students(path, presorted=False, run_rows=DEFAULT_RUN_ROWS, tmp_dir=None):
+    """
+    Stream a combined export one student at a time.
+    Yields (student_id, program, concentration, rows) — program and
+    concentration are None unless the export has those columns; rows are
+    (code, name, credits, grade, semester) tuples as audit_transcript() accepts.
+    With presorted each student's rows must already be contiguous (ValueError
+    when a student_id reappears); without it an external sort groups the rows
+    (see module docstring).
+    """
+    rows = _read_rows(path)
+    if presorted:
+        return _group(rows, check_grouped=True, path=path)
+    return _group(_externally_sorted(rows, max(1, run_rows), tmp_dir))
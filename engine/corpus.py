@@ -0,0 +1,224 @@
+"""
+Packed Corpus — columnar, memory-mappable transcript store
+Packs many transcript CSVs into one binary file so analytics runs skip CSV
+parsing and normalisation. Every course attempt is a row across fixed-width
+columns; a student is a contiguous slice of rows.
+
+File layout (little-endian, every section 8-byte aligned):
+  header    magic "NSUCORP1", format version, n_students, n_rows, meta length
+  meta      JSON: per-student name / program / concentration, and the code,
+            course-name, grade and non-timeline semester tables
+  offsets   uint32[n_students + 1]  row range of student i is offsets[i]:offsets[i+1]
+  course_id uint16[n_rows]          index into meta "codes"
+  name_id   uint16[n_rows]          index into meta "names"
+  credits   uint8[n_rows]           normalised credits (catalog credits for known courses)
+  grade_id  uint8[n_rows]           index into meta "grades"
+  semester  int16[n_rows]           Semester.ordinal; negative values -k index meta
+                                    "special_semesters"[k - 1] (e.g. "waiver")
+
+Rows hold the normalised, parse-order attempts of each transcript (before
+retake resolution). open_corpus() maps the file and exposes the columns as
+zero-copy memoryviews — or NumPy arrays when NumPy is installed — without
+building per-row Python objects.
+"""
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+
+from engine.credit_engine import parse_transcript, Semester, semester_ordinal
+
+MAGIC = b"NSUCORP1"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<8sIIII")
+COLUMNS = (  # (name, array typecode, NumPy dtype)
+    ("course_id", "H", "<u2"),
+    ("name_id", "H", "<u2"),
+    ("credits", "B", "u1"),
+    ("grade_id", "B", "u1"),
+    ("semester", "h", "<i2"),
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _pad(n):
+    return -n % 8
+
+
+def _interner(table):
+    """Return lookup(value) → index into table, appending unseen values."""
+    index = {}
+
+    def lookup(value):
+        i = index.get(value)
+        if i is None:
+            i = index[value] = len(table)
+            table.append(value)
+        return i
+    return lookup
+
+
+def pack_corpus(jobs, out_path):
+    """
+    Parse every transcript in jobs [(path, program, concentration)] and write
+    the packed corpus to out_path. Returns dict with: students, rows, bytes.
+    """
+    return pack_students(
+        ((path.replace("\\", "/").rsplit("/", 1)[-1], program, concentration, _record_rows(path))
+         for path, program, concentration in jobs),
+        out_path)
+
+
+def _record_rows(path):
+    return [(r.course_code, r.course_name, r.credits, r.grade, r.semester)
+            for r in parse_transcript(path)]
+
+
+def pack_students(students, out_path):
+    """
+    Write a packed corpus from already-parsed students: an iterable of
+    (name, program, concentration, rows), rows being normalised
+    (code, name, credits, grade, semester) tuples in parse order.
+    Returns dict with: students, rows, bytes.
+    """
+    codes, names, grades, specials = [], [], [], []
+    code_id, name_id, grade_id, special_id = (_interner(codes), _interner(names),
+                                              _interner(grades), _interner(specials))
+    meta_students = []
+    offsets = array("I", [0])
+    columns = {name: array(typecode) for name, typecode, _ in COLUMNS}
+    col_code, col_name, col_credits, col_grade, col_sem = (columns[name] for name, _, _ in COLUMNS)
+
+    for student_name, program, concentration, rows in students:
+        for code, course_name, credits, grade, semester in rows:
+            col_code.append(code_id(code))
+            col_name.append(name_id(course_name))
+            col_credits.append(credits)
+            col_grade.append(grade_id(grade))
+            ordinal = semester_ordinal(semester)
+            col_sem.append(ordinal if ordinal >= 0 else -1 - special_id(semester))
+        offsets.append(len(col_code))
+        meta_students.append([student_name, program, concentration])
+
+    meta = json.dumps({
+        "students": meta_students, "codes": codes, "names": names,
+        "grades": grades, "special_semesters": specials,
+    }, separators=(",", ":")).encode("utf-8")
+
+    sections = [offsets] + [columns[name] for name, _, _ in COLUMNS]
+    if sys.byteorder != "little":
+        for section in sections:
+            section.byteswap()
+    written = 0
+    with open(out_path, "wb") as f:
+        for blob in [_HEADER.pack(MAGIC, FORMAT_VERSION, len(meta_students), len(col_code), len(meta)),
+                     meta] + [section.tobytes() for section in sections]:
+            f.write(blob)
+            f.write(b"\0" * _pad(len(blob)))
+            written += len(blob) + _pad(len(blob))
+    return {"students": len(meta_students), "rows": len(col_code), "bytes": written}
+
+
+class PackedCorpus:
+    """
+    A memory-mapped packed corpus. Columns (offsets, course_id, name_id, credits,
+    grade_id, semester) are zero-copy memoryviews, or NumPy arrays when NumPy is
+    installed and use_numpy is not False. Close it (or use it as a context
+    manager) to release the mapping.
+    """
+
+    def __init__(self, path, use_numpy=None):
+        if use_numpy is None:
+            use_numpy = np is not None
+        elif use_numpy and np is None:
+            raise ImportError("NumPy is not installed")
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, n_students, n_rows, meta_len = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._mm.close()
+            raise ValueError(f"{path}: not a packed corpus (format {FORMAT_VERSION})")
+        pos = _HEADER.size + _pad(_HEADER.size)
+        meta = json.loads(self._mm[pos:pos + meta_len])
+        pos += meta_len + _pad(meta_len)
+
+        self.students = [tuple(s) for s in meta["students"]]  # (name, program, concentration)
+        self.codes = meta["codes"]
+        self.names = meta["names"]
+        self.grades = meta["grades"]
+        self.special_semesters = meta["special_semesters"]
+        self.n_rows = n_rows
+
+        view = memoryview(self._mm)
+        self._views = [view]
+        layout = [("offsets", "I", "<u4", n_students + 1)] + [c + (n_rows,) for c in COLUMNS]
+        for name, typecode, dtype, count in layout:
+            size = struct.calcsize(typecode) * count
+            if use_numpy:
+                column = np.frombuffer(self._mm, dtype=dtype, count=count, offset=pos)
+            elif sys.byteorder == "little":
+                column = view[pos:pos + size].cast(typecode)
+                self._views.append(column)
+            else:
+                column = array(typecode, view[pos:pos + size].tobytes())
+                column.byteswap()
+            setattr(self, name, column)
+            pos += size + _pad(size)
+
+    def __len__(self):
+        return len(self.students)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Release the mapping. Column views (and NumPy arrays over them) must not be used afterwards."""
+        for name in ("offsets",) + tuple(c[0] for c in COLUMNS):
+            self.__dict__.pop(name, None)
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        try:
+            self._mm.close()
+        except BufferError:
+            pass  # a caller still holds a NumPy view; the mapping is freed with it
+
+    def iter_students(self):
+        """Yield (index, name, program, concentration, start, stop) — the student's row range."""
+        offsets = self.offsets
+        for i, (name, program, concentration) in enumerate(self.students):
+            yield i, name, program, concentration, int(offsets[i]), int(offsets[i + 1])
+
+    def semester_name(self, ordinal):
+        """Semester string for a value of the semester column."""
+        if ordinal < 0:
+            return self.special_semesters[-1 - ordinal]
+        return str(Semester.from_ordinal(ordinal))
+
+    def rows(self, i):
+        """
+        Raw transcript rows (code, name, credits, grade, semester) of student i, as
+        engine.pipeline.audit_transcript() accepts.
+        """
+        start, stop = int(self.offsets[i]), int(self.offsets[i + 1])
+        codes, names, grades = self.codes, self.names, self.grades
+        return [
+            (codes[self.course_id[j]], names[self.name_id[j]], str(self.credits[j]),
+             grades[self.grade_id[j]], self.semester_name(int(self.semester[j])))
+            for j in range(start, stop)
+        ]
+
+
+def open_corpus(path, use_numpy=None):
+    """Memory-map a packed corpus written by pack_corpus()."""
+    return PackedCorpus(path, use_numpy)
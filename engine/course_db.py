@@ -39,9 +39,9 @@ CSE_SEPS_CORE = {
     "CSE115L": ("Programming Language I Lab", 1),
     "MAT116": ("Pre-Calculus", 3),
     "MAT120": ("Calculus I", 3),
-    "MAT125": ("Linear Algebra", 3),
     "MAT130": ("Calculus II", 3),
     "MAT250": ("Calculus III", 3),
+    "MAT125": ("Linear Algebra", 3),
     "MAT350": ("Complex Variables", 3),
     "MAT361": ("Discrete Mathematics II", 3),
     "PHY107": ("Physics I", 3),
@@ -195,9 +195,19 @@ BBA_CONC_COURSES = {
                      "ECO348": ("Mathematical Economics", 3), "ECO328": ("Econometrics", 3)},
         "elective": {"ECO244": ("Economic Development", 3), "ECO301": ("Monetary Economics", 3),
                      "ECO304": ("International Economics", 3), "ECO317": ("Public Economics", 3),
-                     "ECO354": ("Advanced Microeconomics", 3), "ECO410": ("Development Economics", 3),
-                     "ECO415": ("Public Finance", 3), "ECO441": ("Labor Economics", 3),
-                     "ECO450": ("Game Theory", 3), "ECO460": ("International Trade", 3)},
+                     "ECO329": ("Applied Econometrics", 3), "ECO343": ("Industrial Organization", 3),
+                     "ECO354": ("Advanced Microeconomics", 3), "ECO360": ("Urban Economics", 3),
+                     "ECO372": ("Health Economics", 3), "ECO380": ("Agricultural Economics", 3),
+                     "ECO406": ("History of Economic Thought", 3), "ECO410": ("Development Economics", 3),
+                     "ECO414": ("Environmental Economics", 3), "ECO415": ("Public Finance", 3),
+                     "ECO417": ("Natural Resource Economics", 3), "ECO430": ("Financial Economics", 3),
+                     "ECO436": ("Economics of Money and Banking", 3), "ECO441": ("Labor Economics", 3),
+                     "ECO443": ("Economics of Education", 3), "ECO450": ("Game Theory", 3),
+                     "ECO451": ("Behavioral Economics", 3), "ECO460": ("International Trade", 3),
+                     "ECO465": ("International Finance", 3), "ECO472": ("Energy Economics", 3),
+                     "ECO474": ("Economics of Regulation", 3), "ECO475": ("Applied Time Series Analysis", 3),
+                     "ECO484": ("Economic Forecasting", 3), "ECO485": ("Project Appraisal", 3),
+                     "ECO486": ("Research Methods in Economics", 3), "ECO492": ("Special Topics in Economics", 3)},
     },
     "INB": {
         "required": {"INB400": ("International Trade and Finance", 3), "INB490": ("Cross-Cultural Management", 3),
@@ -211,6 +221,18 @@ BBA_CONC_COURSES = {
 
 BBA_CONC_NAMES = list(BBA_CONC_COURSES.keys())  # ["ACT", "FIN", ...]
 
+BBA_CONC_LABELS = {
+    "ACT": "Accounting",
+    "FIN": "Finance",
+    "MKT": "Marketing",
+    "MGT": "Management",
+    "HRM": "Human Resource Management",
+    "MIS": "Management Information Systems",
+    "SCM": "Supply Chain Management",
+    "ECO": "Economics",
+    "INB": "International Business",
+}
+
 # Pre-university / Foundation Courses (Waivers)
 WAIVER_COURSES = {
     "ENG102": ("Introduction to Composition", 3),
@@ -218,22 +240,8 @@ WAIVER_COURSES = {
     "BUS112": ("Intro to Business Mathematics", 3)
 }
 
-ALL_COURSES = {}
-
-# Populate ALL_COURSES
-dicts_to_merge = [
-    CSE_MAJOR_CORE, CSE_CAPSTONE, CSE_SEPS_CORE, CSE_GED,
-    CSE_GED_CHOICE_1, CSE_GED_CHOICE_2, CSE_GED_CHOICE_3,
-    CSE_ELECTIVES_400, OPEN_ELECTIVES, WAIVER_COURSES,
-    BBA_SCHOOL_CORE, BBA_CORE, BBA_GED, BBA_GED_CHOICE_LANG,
-    BBA_GED_CHOICE_HIS, BBA_GED_CHOICE_POL, BBA_GED_CHOICE_SOC,
-    BBA_GED_CHOICE_SCI, BBA_GED_CHOICE_LAB, BBA_INTERNSHIP
-]
-
-for d in dicts_to_merge:
-    ALL_COURSES.update(d)
-
-for conc in BBA_CONC_COURSES.values():
-    ALL_COURSES.update(conc['required'])
-    ALL_COURSES.update(conc['elective'])
+# Waivable per program (English + Math admission tests)
+CSE_GED_WAIVABLE = {c: WAIVER_COURSES[c] for c in ("ENG102", "MAT112")}
+BBA_GED_WAIVABLE = {c: WAIVER_COURSES[c] for c in ("ENG102", "BUS112")}
 
+# ALL_COURSES and every derived lookup are compiled in engine.catalog
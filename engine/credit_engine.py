@@ -5,19 +5,13 @@ and assigns status labels to each course attempt.
 """
 
 import csv
+import os
 import re
+import sys
+from array import array
 from collections import defaultdict
-from engine.course_db import ALL_COURSES
-
-# ─── Academic Timeline ──────────────────────────────────
-SEMESTERS = [
-    "Spring2019", "Summer2019", "Fall2019",
-    "Spring2020", "Summer2020", "Fall2020",
-    "Spring2021", "Summer2021", "Fall2021",
-    "Spring2022", "Summer2022", "Fall2022",
-    "Spring2023", "Summer2023", "Fall2023",
-    "Spring2024", "Summer2024", "Fall2024",
-]
+from functools import lru_cache, total_ordering
+from engine import catalog
 
 # Passing grades (D or better, plus T for transfer)
 PASSING_GRADES = {"A", "A-", "B+", "B", "B-", "C+", "C", "C-", "D+", "D", "T"}
@@ -27,41 +21,179 @@ GRADE_ORDER = {
     "C+": 7, "C": 6, "C-": 5, "D+": 4, "D": 3,
     "F": 1, "I": 0, "W": -1, "T": 13
 }
+# Courses that can never be satisfied by a T (transfer) grade
+CAPSTONES = {"CSE499A", "CSE499B", "BUS498"}
+
+
+# ─── Normalisation ──────────────────────────────────────
+# The same raw strings repeat thousands of times across a corpus, so each
+# distinct one is normalised once and served from a bounded LRU afterwards.
+SEMESTER_CACHE_SIZE = 512
+COURSE_CODE_CACHE_SIZE = 4096
+
+_SEMESTER_RE = re.compile(r'(Spring|Summer|Fall|Spr|Sum|Fal)[\s\'-]*(\d{2,4})', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+_CODE_PARTS_RE = re.compile(r'([A-Z]+)(\d+)([A-Z]*)')
+_TERM_NAMES = {"Spr": "Spring", "Sum": "Summer", "Fal": "Fall"}
+
+
+@lru_cache(maxsize=SEMESTER_CACHE_SIZE)
+def normalize_semester(raw):
+    """
+    Canonicalise a raw semester string and locate it on the timeline.
+    Handles 'Spring2020', 'Spr 20', 'Fall-2021', 'Summer 22'; strings that do not
+    parse at all are kept as-is (stripped).
+    Returns (semester, ordinal) — ordinal is Semester.ordinal, or -1 if the string
+    is not a recognisable 'TermYYYY' semester (e.g. 'waiver').
+    """
+    raw_sem = raw.strip()
+    sem_match = _SEMESTER_RE.match(raw_sem)
+    if sem_match:
+        term = sem_match.group(1).capitalize()
+        term = _TERM_NAMES.get(term, term)
+        year_str = sem_match.group(2)
+        if len(year_str) == 2:
+            year_str = "20" + year_str  # assume 20xx
+        semester = sys.intern(f"{term}{year_str}")
+        if len(year_str) == 4:
+            return semester, int(year_str) * 3 + _TERM_INDEX[term]
+        return semester, -1
+    return sys.intern(raw_sem), -1
+
+
+@lru_cache(maxsize=COURSE_CODE_CACHE_SIZE)
+def normalize_course_code(raw):
+    """
+    Canonicalise a raw course code (upper-case, no whitespace) and build its
+    sort key, e.g. 'cse 115l' -> ('CSE115L', ('CSE', 115, 'L')).
+    Returns (course_code, sort_key)
+    """
+    code = sys.intern(_WHITESPACE_RE.sub('', raw.strip().upper()))
+    match = _CODE_PARTS_RE.match(code)
+    if match:
+        prefix, num, suffix = match.groups()
+        return code, (prefix, int(num), suffix)
+    return code, (code, 0, "")  # Fallback
+
+
+def semester_ordinal(semester):
+    """Timeline ordinal of a (canonical) semester string, -1 if it has none."""
+    return normalize_semester(semester)[1]
+
+
+# ─── Academic Timeline ──────────────────────────────────
+TERMS = ("Spring", "Summer", "Fall")
+_TERM_INDEX = {term: i for i, term in enumerate(TERMS)}
+
+
+@total_ordering
+class Semester:
+    """
+    A term on the academic timeline. Ordered by an arithmetic ordinal
+    (year * 3 + term index), so it works for any year without a lookup table.
+    """
+
+    __slots__ = ("term", "year", "ordinal")
+
+    def __init__(self, term, year):
+        if term not in _TERM_INDEX:
+            raise ValueError(f"Unknown term: {term!r}")
+        self.term = term
+        self.year = int(year)
+        self.ordinal = self.year * 3 + _TERM_INDEX[term]
+
+    @classmethod
+    def parse(cls, text):
+        """Parse any spelling normalize_semester() accepts, e.g. 'Spr 25' or 'Fall2024'."""
+        ordinal = semester_ordinal(text)
+        if ordinal < 0:
+            raise ValueError(f"Not a semester: {text!r}")
+        return cls.from_ordinal(ordinal)
+
+    @classmethod
+    def from_ordinal(cls, ordinal):
+        year, term_index = divmod(ordinal, 3)
+        return cls(TERMS[term_index], year)
+
+    def __add__(self, n):
+        return Semester.from_ordinal(self.ordinal + n)
+
+    def __sub__(self, other):
+        """Semester - Semester -> number of terms between; Semester - int -> Semester."""
+        if isinstance(other, Semester):
+            return self.ordinal - other.ordinal
+        return Semester.from_ordinal(self.ordinal - other)
+
+    def __eq__(self, other):
+        return isinstance(other, Semester) and self.ordinal == other.ordinal
+
+    def __lt__(self, other):
+        return self.ordinal < other.ordinal
+
+    def __hash__(self):
+        return hash(self.ordinal)
+
+    def __str__(self):
+        return f"{self.term}{self.year}"
+
+    def __repr__(self):
+        return f"<Semester {self}>"
+
+
+def semester_range(first, last):
+    """All semester strings from first to last inclusive."""
+    first, last = Semester.parse(first), Semester.parse(last)
+    return [str(Semester.from_ordinal(o)) for o in range(first.ordinal, last.ordinal + 1)]
+
+
+# Window covered by the generated corpus (the generators draw terms from it)
+SEMESTERS = semester_range("Spring2019", "Fall2024")
+
+# Reference "now" for time-based rules such as Incomplete -> F expiry.
+# Defaults to the term after SEMESTERS; override with NSU_CURRENT_SEMESTER
+# or set_current_semester().
+if os.environ.get("NSU_CURRENT_SEMESTER"):
+    CURRENT_SEMESTER = Semester.parse(os.environ["NSU_CURRENT_SEMESTER"])
+else:
+    CURRENT_SEMESTER = Semester.parse(SEMESTERS[-1]) + 1
+
+
+def set_current_semester(semester):
+    """Change the default current semester (a Semester or any parseable string)."""
+    global CURRENT_SEMESTER
+    CURRENT_SEMESTER = semester if isinstance(semester, Semester) else Semester.parse(semester)
+
+
+def _current_ordinal(current_semester=None):
+    """Ordinal of current_semester, falling back to CURRENT_SEMESTER."""
+    if current_semester is None:
+        return CURRENT_SEMESTER.ordinal
+    if not isinstance(current_semester, Semester):
+        current_semester = Semester.parse(current_semester)
+    return current_semester.ordinal
 
 
 class CourseRecord:
     """Represents a single course attempt from the transcript."""
 
+    # Tens of thousands of records are built per corpus run: no per-instance __dict__,
+    # and the highly repetitive strings are interned so every copy shares one object.
+    __slots__ = ("course_code", "course_name", "credits", "grade", "semester", "status")
+
     def __init__(self, course_code, course_name, credits, grade, semester):
-        # 1. String Sanitization
-        raw_code = course_code.strip().upper()
-        # Remove all spaces from course code (e.g., 'CSE 215 ' -> 'CSE215')
-        self.course_code = re.sub(r'\s+', '', raw_code)
+        # 1. String Sanitization ('CSE 215 ' -> 'CSE215')
+        self.course_code = normalize_course_code(course_code)[0]
         # 2. String Sanitization
-        self.course_name = course_name.strip()
-        
-        # 3. Format Semester Strings
-        # Ensure format like 'Spring2020', gracefully handle 'Spr 20', 'Fall-2021', 'Summer 22'
-        raw_sem = semester.strip()
-        sem_match = re.match(r'(Spring|Summer|Fall|Spr|Sum|Fal)[\s\'-]*(\d{2,4})', raw_sem, re.IGNORECASE)
-        if sem_match:
-            term = sem_match.group(1).capitalize()
-            # Expand 'Spr' -> 'Spring', 'Sum' -> 'Summer', 'Fal' -> 'Fall'
-            if term == 'Spr': term = 'Spring'
-            elif term == 'Sum': term = 'Summer'
-            elif term == 'Fal': term = 'Fall'
-            
-            year_str = sem_match.group(2)
-            if len(year_str) == 2:
-                year_str = "20" + year_str # assume 20xx
-            self.semester = f"{term}{year_str}"
-        else:
-            self.semester = raw_sem # Keep raw if it completely fails regex
+        self.course_name = sys.intern(course_name.strip())
+
+        # 3. Format Semester Strings ('Spr 20' -> 'Spring2020')
+        self.semester = normalize_semester(semester)[0]
 
         # 4. Credit Mismatches
         parsed_credits = int(float(credits.strip()))
-        if self.course_code in ALL_COURSES:
-            expected_credits = ALL_COURSES[self.course_code][1]
+        all_courses = catalog.ALL_COURSES  # compiled on the first record
+        if self.course_code in all_courses:
+            expected_credits = all_courses[self.course_code][1]
             if parsed_credits != expected_credits:
                 # Discrepancy detected (e.g. CSE115 as 4 credits). 
                 # We enforce the correct curriculum map credits.
@@ -71,7 +203,7 @@ class CourseRecord:
         else:
             self.credits = parsed_credits
 
-        self.grade = grade.strip().upper()
+        self.grade = sys.intern(grade.strip().upper())
         self.status = ""  # Will be set by the engine
 
     def is_passing(self):
@@ -91,23 +223,36 @@ class CourseRecord:
 
 
 def parse_transcript(filepath):
-    """Parse a transcript CSV file into a list of CourseRecord objects."""
+    """
+    Parse a transcript CSV file into a list of CourseRecord objects.
+    filepath may also point into a .zip / .tar(.gz) archive, e.g.
+    "drop.zip/student_0001_CSE.csv" (see engine.archive).
+    """
+    try:
+        f = open(filepath, "r", encoding="utf-8-sig")
+    except (FileNotFoundError, NotADirectoryError):
+        from engine.archive import open_member
+        f = open_member(filepath)
+    with f:
+        return parse_rows(csv.reader(f))
+
+
+def parse_rows(rows):
+    """Build CourseRecord objects from raw transcript rows (code, name, credits, grade, semester)."""
     records = []
-    with open(filepath, "r", encoding="utf-8-sig") as f:
-        reader = csv.reader(f)
-        for row in reader:
-            if not row or len(row) < 5:
-                continue
-            # Skip header row if present
-            if row[0].strip().lower() == "course_code":
-                continue
-            records.append(CourseRecord(
-                course_code=row[0],
-                course_name=row[1],
-                credits=row[2],
-                grade=row[3],
-                semester=row[4]
-            ))
+    for row in rows:
+        if not row or len(row) < 5:
+            continue
+        # Skip header row if present
+        if row[0].strip().lower() == "course_code":
+            continue
+        records.append(CourseRecord(
+            course_code=row[0],
+            course_name=row[1],
+            credits=row[2],
+            grade=row[3],
+            semester=row[4]
+        ))
     return records
 
 
@@ -118,7 +263,7 @@ def _grade_rank(grade):
     return GRADE_ORDER.get(grade, -2)
 
 
-def resolve_retakes(records):
+def resolve_retakes(records, current_semester=None):
     """
     Group records by course_code, pick the BEST attempt for each course,
     and assign status labels to every record.
@@ -131,27 +276,31 @@ def resolve_retakes(records):
       WITHDRAWN           — grade is W
       FAILED              — grade is F or I and no better attempt exists
       REJECTED-TRANSFER   — T grade on a non-transferable core course
+
+    current_semester (Semester or string) defaults to CURRENT_SEMESTER and
+    drives the Incomplete -> F expiry.
     """
     groups = defaultdict(list)
     for r in records:
         groups[r.course_code].append(r)
 
-    sem_map = {sem: i for i, sem in enumerate(SEMESTERS)}
-    CURRENT_SEMESTER_INDEX = len(SEMESTERS) # E.g., assume current is right after Fall2024
-    CAPSTONES = {"CSE499A", "CSE499B", "BUS498"}
+    current_index = _current_ordinal(current_semester)
 
     for code, attempts in groups.items():
         # First, sort chronologically to process sequential policies
-        attempts.sort(key=lambda a: sem_map.get(a.semester, -1))
+        # (semesters off the timeline have ordinal -1 and sort first)
+        attempts.sort(key=lambda a: semester_ordinal(a.semester))
         
         passed_with_b_minus = False
 
         for rec in attempts:
             # 1. Incomplete Timer Expired
             if rec.grade == "I":
-                sem_idx = sem_map.get(rec.semester, CURRENT_SEMESTER_INDEX)
+                sem_idx = semester_ordinal(rec.semester)
+                if sem_idx < 0:
+                    sem_idx = current_index
                 # If older than 1 semester, convert I to F
-                if CURRENT_SEMESTER_INDEX - sem_idx > 1:
+                if current_index - sem_idx > 1:
                     rec.grade = "F"
 
             # 2. Transfer Constraints (No T grades for Capstones)
@@ -224,6 +373,9 @@ def calculate_credits(records):
       T (transfer) credits count as earned.
       0-credit courses never count toward credit total.
     """
+    if isinstance(records, Transcript):
+        return _calculate_credits_columns(records)
+
     credits_attempted = 0
     credits_earned = 0
 
@@ -240,6 +392,120 @@ def calculate_credits(records):
     return credits_attempted, credits_earned
 
 
+def _calculate_credits_columns(transcript):
+    """calculate_credits() over a columnar Transcript (same rules, no record objects)."""
+    w_id, t_id = GRADE_IDS["W"], GRADE_IDS["T"]
+    counted_status = (STATUS_IDS["BEST"], STATUS_IDS["WAIVED"])
+    passing = [g in PASSING_GRADES for g in GRADE_CODES]
+
+    credits_attempted = 0
+    credits_earned = 0
+    for cr, gid, sid in zip(transcript.credits, transcript.grade_ids, transcript.status_ids):
+        if cr > 0 and gid != w_id and gid != t_id:
+            credits_attempted += cr
+        if sid in counted_status and cr > 0 and passing[gid]:
+            credits_earned += cr
+    return credits_attempted, credits_earned
+
+
+# ─── Columnar Transcript ────────────────────────────────
+
+# Small-integer ids for the grade and status columns. Any other value (e.g.
+# a malformed grade) gets the reserved last id, OTHER, so the tables never
+# change at run time; the Transcript keeps the original string aside.
+OTHER = "?"
+GRADE_CODES = ["A", "A-", "B+", "B", "B-", "C+", "C", "C-", "D+", "D", "F", "I", "W", "T", OTHER]
+STATUS_CODES = ["", "BEST", "WAIVED", "FAILED", "WITHDRAWN",
+                "RETAKE-IGNORED", "UNAUTHORIZED-RETAKE", "REJECTED-TRANSFER", OTHER]
+GRADE_IDS = {g: i for i, g in enumerate(GRADE_CODES[:-1])}
+STATUS_IDS = {s: i for i, s in enumerate(STATUS_CODES[:-1])}
+OTHER_GRADE_ID = len(GRADE_CODES) - 1
+OTHER_STATUS_ID = len(STATUS_CODES) - 1
+
+
+class Transcript:
+    """
+    Struct-of-arrays form of a transcript: one column per field instead of one
+    CourseRecord per attempt. Build it from (resolved) records with from_records().
+
+    Columns:
+      codes, names, semesters — interned strings (lists)
+      credits                 — array('h')
+      grade_ids               — array('b'), indexes into GRADE_CODES
+      status_ids              — array('b'), indexes into STATUS_CODES
+      sem_ordinals            — array('h'), Semester ordinal (-1 if off the timeline)
+      others                  — {(row, "grade" | "status"): value} for OTHER ids
+
+    calculate_credits(), compute_cgpa() and compute_major_cgpa() accept a
+    Transcript directly.
+    """
+
+    __slots__ = ("codes", "names", "semesters", "credits", "grade_ids", "status_ids", "sem_ordinals",
+                 "others")
+
+    def __init__(self):
+        self.codes = []
+        self.names = []
+        self.semesters = []
+        self.credits = array("h")
+        self.grade_ids = array("b")
+        self.status_ids = array("b")
+        self.sem_ordinals = array("h")
+        self.others = {}
+
+    @classmethod
+    def from_records(cls, records):
+        """Build the columns from a list of CourseRecord objects."""
+        t = cls()
+        for i, r in enumerate(records):
+            t.codes.append(r.course_code)
+            t.names.append(r.course_name)
+            t.semesters.append(r.semester)
+            t.credits.append(r.credits)
+            gid = GRADE_IDS.get(r.grade)
+            if gid is None:
+                gid = OTHER_GRADE_ID
+                t.others[i, "grade"] = r.grade
+            sid = STATUS_IDS.get(r.status)
+            if sid is None:
+                sid = OTHER_STATUS_ID
+                t.others[i, "status"] = r.status
+            t.grade_ids.append(gid)
+            t.status_ids.append(sid)
+            t.sem_ordinals.append(semester_ordinal(r.semester))
+        return t
+
+    def __len__(self):
+        return len(self.codes)
+
+    def to_records(self):
+        """Materialise CourseRecord objects again (e.g. for the report printers)."""
+        records = []
+        for i in range(len(self.codes)):
+            r = CourseRecord.__new__(CourseRecord)
+            r.course_code = self.codes[i]
+            r.course_name = self.names[i]
+            r.credits = self.credits[i]
+            r.grade = GRADE_CODES[self.grade_ids[i]]
+            r.semester = self.semesters[i]
+            r.status = STATUS_CODES[self.status_ids[i]]
+            if self.others:
+                r.grade = self.others.get((i, "grade"), r.grade)
+                r.status = self.others.get((i, "status"), r.status)
+            records.append(r)
+        return records
+
+    def to_numpy(self):
+        """Return the numeric columns as NumPy arrays (requires numpy)."""
+        import numpy as np
+        return {
+            "credits": np.frombuffer(self.credits, dtype=np.int16),
+            "grade_ids": np.frombuffer(self.grade_ids, dtype=np.int8),
+            "status_ids": np.frombuffer(self.status_ids, dtype=np.int8),
+            "sem_ordinals": np.frombuffer(self.sem_ordinals, dtype=np.int16),
+        }
+
+
 def process_transcript(filepath):
     """
     Full Level 1 pipeline: parse → resolve retakes → sort → calculate credits.
@@ -247,22 +513,19 @@ def process_transcript(filepath):
     """
     records = parse_transcript(filepath)
     records = resolve_retakes(records)
-    
-    # Sort records: Primarily Numerical Ascending by Course Code, Secondarily Chronological (semester)
-    sem_map = {sem: i for i, sem in enumerate(SEMESTERS)}
-    
-    def sort_key(r):
-        code = r.course_code
-        sem_idx = sem_map.get(r.semester, -1)
-        
-        # Split code into prefix, number, and suffix (e.g., 'CSE115L' -> 'CSE', 115, 'L')
-        match = re.match(r'([A-Z]+)(\d+)([A-Z]*)', code)
-        if match:
-            prefix, num, suffix = match.groups()
-            return (prefix, int(num), suffix, sem_idx)
-        return (code, 0, "", sem_idx)  # Fallback
-    
-    records.sort(key=sort_key)
-    
+    sort_records(records)
     credits_attempted, credits_earned = calculate_credits(records)
     return records, credits_attempted, credits_earned
+
+
+def sort_records(records):
+    """
+    Sort records in place: primarily numerical ascending by course code,
+    secondarily chronological (semester).
+    """
+    # Canonical codes/semesters normalise to themselves, so both lookups are cache hits.
+    def sort_key(r):
+        return normalize_course_code(r.course_code)[1] + (normalize_semester(r.semester)[1],)
+
+    records.sort(key=sort_key)
+    return records
@@ -0,0 +1,105 @@
+"""
+Fused Audit Pipeline
+Single entry point for a complete audit: parse → resolve retakes → one fused
+scan over the records (engine.audit_engine.scan_records) → Level 2 standing,
+Level 3 audit and graduation roadmap evaluated from the scan's aggregates.
+
+Returns the same dicts audit.py renders, so the CLI, batch mode and library
+callers all share one code path.
+"""
+
+import os
+
+from engine.credit_engine import parse_transcript, parse_rows, resolve_retakes, sort_records
+from engine.cgpa_engine import build_cgpa_data, probation_by_semester
+from engine.audit_engine import (scan_records, evaluate_audit, build_graduation_roadmap,
+                                 evaluate_bba_all_concentrations)
+
+
+def load_records(path_or_rows):
+    """
+    Parse a transcript into resolved, sorted CourseRecord objects.
+    Accepts a CSV path or an iterable of raw rows (code, name, credits, grade, semester).
+    """
+    if isinstance(path_or_rows, (str, os.PathLike)):
+        records = parse_transcript(path_or_rows)
+    else:
+        records = parse_rows(path_or_rows)
+    resolve_retakes(records)
+    return sort_records(records)
+
+
+def cgpa_from_scan(scan, program, user_waivers=None, current_semester=None):
+    """process_cgpa() built from the aggregates of scan_records()."""
+    gpa_credits = scan["gpa_credits"]
+    if gpa_credits == 0:
+        cgpa, qp = 0.0, 0.0
+    else:
+        # Strict NSU Truncation, as compute_cgpa()
+        cgpa = int(scan["quality_points"] / gpa_credits * 100) / 100.0
+        qp = round(scan["quality_points"], 2)
+
+    standing, p_count = probation_by_semester(scan["by_semester"], current_semester)
+    return build_cgpa_data(program, cgpa, qp, gpa_credits, standing, p_count,
+                           scan["waiver_records"], user_waivers)
+
+
+def audit_transcript(path_or_rows, program, concentration=None, user_waivers=None,
+                     all_concentrations=False):
+    """
+    Run Level 1 → Level 2 → Level 3 → roadmap on a single transcript with one
+    scan over its records.
+    Returns dict with: records, credits_attempted, credits_earned, cgpa_data,
+    audit_result, unrecognized. If the transcript contains unknown course codes,
+    cgpa_data and audit_result are None and unrecognized lists the codes.
+    With all_concentrations=True a BBA result also holds "concentrations",
+    every concentration audited and ranked from the same scan
+    (engine.audit_engine.evaluate_bba_all_concentrations).
+    """
+    records = load_records(path_or_rows)
+    scan = scan_records(records, program)
+
+    result = {
+        "records": records,
+        "credits_attempted": scan["credits_attempted"],
+        "credits_earned": scan["credits_earned"],
+        "cgpa_data": None,
+        "audit_result": None,
+        "unrecognized": scan["unrecognized"],
+    }
+    if result["unrecognized"]:
+        return result
+
+    credits_earned = scan["credits_earned"]
+    cgpa_data = cgpa_from_scan(scan, program, user_waivers)
+    audit_result = evaluate_audit(
+        scan,
+        program,
+        cgpa_data["waivers"],
+        credits_earned,
+        cgpa_data["cgpa"],
+        cgpa_data.get("credit_reduction", 0),
+        concentration=concentration,
+    )
+
+    if program.upper() == "CSE":
+        major_cgpa_for_roadmap = audit_result.get("major_core_cgpa", 0.0)
+    else:
+        major_cgpa_for_roadmap = audit_result.get("core_cgpa", 0.0)
+
+    audit_result["roadmap"] = build_graduation_roadmap(
+        program, scan["gpa_records"], credits_earned,
+        cgpa_data["cgpa"],
+        major_cgpa_for_roadmap,
+        audit_result,
+        cgpa_data["standing"],
+    )
+
+    if all_concentrations and program.upper() == "BBA":
+        result["concentrations"] = evaluate_bba_all_concentrations(
+            scan, cgpa_data["waivers"], credits_earned, cgpa_data["cgpa"],
+            cgpa_data.get("credit_reduction", 0))
+
+    result["cgpa_data"] = cgpa_data
+    result["audit_result"] = audit_result
+    return result
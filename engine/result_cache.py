@@ -0,0 +1,180 @@
+"""
+Audit Result Cache
+On-disk cache of engine.pipeline.audit_transcript() results, so re-auditing a
+corpus after a handful of edits only re-runs the transcripts that changed.
+
+Entries are keyed by a SHA-256 over:
+  - the normalised transcript rows (cells stripped; blank, short and header
+    rows dropped — exactly what parse_rows() would ignore),
+  - program and concentration,
+  - the effective current semester, credit_engine.CURRENT_SEMESTER (set by
+    NSU_CURRENT_SEMESTER or set_current_semester(); it changes when I grades
+    expire), and
+  - engine_version(), a hash of the engine/ sources, catalog tables included.
+
+Each entry is one pickle file under <dir>/<key[:2]>/. A hit refreshes the
+entry's mtime; trim() evicts least-recently-used entries until the cache fits
+its size cap. Only a miss imports engine.pipeline (and with it
+engine.audit_engine) — hits are served from the pickle alone.
+"""
+
+import csv
+import hashlib
+import os
+import pickle
+
+from engine import credit_engine
+
+DEFAULT_CACHE_DIR = ".audit_cache"
+DEFAULT_MAX_MB = 64
+CACHE_FORMAT = 1  # bump when the shape of a cached result changes
+
+_ENGINE_DIR = os.path.dirname(os.path.abspath(__file__))
+_engine_version = None
+
+
+def engine_version():
+    """Hash of every engine/*.py source; any engine or catalog edit invalidates the cache."""
+    global _engine_version
+    if _engine_version is None:
+        h = hashlib.sha256()
+        for name in sorted(os.listdir(_ENGINE_DIR)):
+            if name.endswith(".py"):
+                h.update(name.encode())
+                with open(os.path.join(_ENGINE_DIR, name), "rb") as f:
+                    h.update(f.read())
+        _engine_version = h.hexdigest()
+    return _engine_version
+
+
+def read_rows(filepath):
+    """
+    Read a transcript CSV into normalised rows: a tuple of the 5 stripped cells
+    for every course row. Header, blank and short rows are dropped, as parse_rows() does.
+    """
+    rows = []
+    try:
+        f = open(filepath, "r", encoding="utf-8-sig")
+    except (FileNotFoundError, NotADirectoryError):
+        from engine.archive import open_member  # a transcript inside a .zip / .tar(.gz)
+        f = open_member(filepath)
+    with f:
+        for row in csv.reader(f):
+            if len(row) < 5:
+                continue
+            cells = (row[0].strip(), row[1].strip(), row[2].strip(), row[3].strip(), row[4].strip())
+            if cells[0].lower() == "course_code":
+                continue
+            rows.append(cells)
+    return rows
+
+
+def cache_key(rows, program, concentration=None):
+    """Hex key for normalised rows audited under program / concentration by this engine."""
+    h = hashlib.sha256()
+    h.update(f"{CACHE_FORMAT}\0{engine_version()}\0{program.upper()}\0"
+             f"{concentration or ''}\0{credit_engine.CURRENT_SEMESTER.ordinal}\0".encode())
+    for row in rows:
+        h.update("\x1f".join(row).encode())
+        h.update(b"\x1e")
+    return h.hexdigest()
+
+
+class ResultCache:
+    """A directory of pickled audit results with an LRU size cap (max_bytes)."""
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_MB * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".pickle")
+
+    def get(self, key):
+        """The cached result for key, or None. A hit marks the entry most recently used."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                result = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Truncated or unreadable entry: drop it and treat as a miss
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return result
+
+    def put(self, key, result):
+        """Store result under key. Written to a temp file first so readers never see a partial entry."""
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+    def audit(self, filepath, program, concentration=None):
+        """
+        audit_transcript() of a CSV file (or of already-read rows, as read_rows()
+        returns), served from the cache when an identical transcript was already
+        audited the same way.
+        Returns (result, hit).
+        """
+        rows = read_rows(filepath) if isinstance(filepath, (str, os.PathLike)) else filepath
+        key = cache_key(rows, program, concentration)
+        result = self.get(key)
+        if result is not None:
+            return result, True
+        from engine.pipeline import audit_transcript
+        result = audit_transcript(rows, program, concentration)
+        self.put(key, result)
+        return result, False
+
+    def _entries(self):
+        """[(mtime, size, path)] for every entry in the cache."""
+        entries = []
+        if not os.path.isdir(self.directory):
+            return entries
+        for sub in os.scandir(self.directory):
+            if not sub.is_dir():
+                continue
+            for entry in os.scandir(sub.path):
+                if entry.name.endswith(".pickle"):
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+        return entries
+
+    def trim(self):
+        """Evict least-recently-used entries until the cache fits max_bytes. Returns the number evicted."""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            evicted += 1
+        return evicted
+
+    def usage(self):
+        """Return dict with: entries, bytes, max_bytes."""
+        entries = self._entries()
+        return {
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+        }
@@ -0,0 +1,176 @@
+"""
+Audit Result Store
+SQLite sink for batch audits: one summary row per transcript (CGPA, standing,
+probation count, credits, eligibility) plus its eligibility reasons and the
+courses still missing, indexed for cohort queries such as "every CSE student
+missing CSE499B". Elective placeholders ("Any CSE 4xx (3 needed)") have a
+NULL course_code and their text in requirement, so course-code queries only
+see real courses.
+
+Rows are buffered and bulk-inserted with executemany(), one transaction per
+flush. Re-auditing a transcript replaces its earlier rows.
+"""
+
+import sqlite3
+import time
+
+from engine.catalog import COURSE_CODE_FORMAT
+
+SCHEMA_VERSION = 1  # PRAGMA user_version; 0: placeholders stored as course codes
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS students (
+    id                INTEGER PRIMARY KEY,
+    transcript        TEXT NOT NULL UNIQUE,
+    program           TEXT NOT NULL,
+    concentration     TEXT,
+    cgpa              REAL NOT NULL,
+    standing          TEXT NOT NULL,
+    probation_count   INTEGER NOT NULL,
+    credits_earned    INTEGER NOT NULL,
+    credits_attempted INTEGER NOT NULL,
+    eligible          INTEGER NOT NULL,
+    audited_at        TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS reasons (
+    student_id INTEGER NOT NULL REFERENCES students(id) ON DELETE CASCADE,
+    reason     TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS missing_courses (
+    student_id  INTEGER NOT NULL REFERENCES students(id) ON DELETE CASCADE,
+    category    TEXT NOT NULL,
+    course_code TEXT,
+    requirement TEXT,
+    credits     INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_students_program ON students(program);
+CREATE INDEX IF NOT EXISTS idx_students_concentration ON students(concentration);
+CREATE INDEX IF NOT EXISTS idx_students_standing ON students(standing);
+CREATE INDEX IF NOT EXISTS idx_reasons_student ON reasons(student_id);
+CREATE INDEX IF NOT EXISTS idx_missing_course ON missing_courses(course_code, student_id);
+CREATE INDEX IF NOT EXISTS idx_missing_student ON missing_courses(student_id);
+"""
+
+
+def summarise_result(filepath, program, concentration, result):
+    """
+    Flatten a run_pipeline() result into the plain tuples the store inserts.
+    Returns (student_row, reasons, missing) — or None for an aborted (fake) transcript.
+    """
+    cgpa_data = result["cgpa_data"]
+    audit_result = result["audit_result"]
+    if cgpa_data is None or audit_result is None:
+        return None
+    student = (
+        filepath, program, concentration,
+        cgpa_data["cgpa"], cgpa_data["standing"], cgpa_data["probation_count"],
+        result["credits_earned"], result["credits_attempted"],
+        int(audit_result["eligible"]),
+    )
+    missing = [
+        (category, code, None, cr) if COURSE_CODE_FORMAT.match(code) else (category, None, code, cr)
+        for category, courses in audit_result.get("remaining", {}).items()
+        for code, cr in courses.items()
+    ]
+    return student, list(audit_result["reasons"]), missing
+
+
+class ResultStore:
+    """Buffered writer for audit summaries into an SQLite database."""
+
+    def __init__(self, path, batch_size=500):
+        self.path = path
+        self.batch_size = batch_size
+        self.pending = []
+        self.transcripts = set()  # distinct transcripts written by this store
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self._migrate()
+        self.conn.executescript(SCHEMA)
+        self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    @property
+    def stored(self):
+        """Distinct transcripts stored so far (a re-audited transcript counts once)."""
+        return len(self.transcripts)
+
+    def _migrate(self):
+        """Move placeholders of a version-0 missing_courses table from course_code to requirement."""
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'missing_courses'").fetchone()
+        if version >= SCHEMA_VERSION or not exists:
+            return
+        rows = self.conn.execute(
+            "SELECT student_id, category, course_code, credits FROM missing_courses").fetchall()
+        with self.conn:  # one transaction (executescript() would commit halfway)
+            self.conn.execute("BEGIN")
+            self.conn.execute("DROP TABLE missing_courses")  # and its indexes
+            for statement in SCHEMA.split(";"):
+                if statement.strip():
+                    self.conn.execute(statement)
+            self.conn.executemany(
+                "INSERT INTO missing_courses (student_id, category, course_code, requirement, credits)"
+                " VALUES (?, ?, ?, ?, ?)",
+                [(sid, category, code, None, cr) if COURSE_CODE_FORMAT.match(code)
+                 else (sid, category, None, code, cr) for sid, category, code, cr in rows])
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def add(self, summary):
+        """Queue one summarise_result() tuple; flushes every batch_size summaries."""
+        if summary is None:
+            return
+        self.pending.append(summary)
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write every queued summary in a single transaction."""
+        if not self.pending:
+            return
+        # A transcript queued twice keeps only its latest audit
+        pending = list({summary[0][0]: summary for summary in self.pending}.values())
+        audited_at = time.strftime("%Y-%m-%dT%H:%M:%S")
+        students = [student + (audited_at,) for student, _, _ in pending]
+        with self.conn:
+            self.conn.executemany(
+                "DELETE FROM students WHERE transcript = ?",
+                [(student[0],) for student in students])
+            self.conn.executemany(
+                "INSERT INTO students (transcript, program, concentration, cgpa, standing,"
+                " probation_count, credits_earned, credits_attempted, eligible, audited_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", students)
+            placeholders = ",".join("?" * len(students))
+            ids = dict(self.conn.execute(
+                f"SELECT transcript, id FROM students WHERE transcript IN ({placeholders})",
+                [student[0] for student in students]))
+            reasons = []
+            missing = []
+            for student, student_reasons, student_missing in pending:
+                sid = ids[student[0]]
+                reasons.extend((sid, reason) for reason in student_reasons)
+                missing.extend((sid,) + row for row in student_missing)
+            self.conn.executemany("INSERT INTO reasons (student_id, reason) VALUES (?, ?)", reasons)
+            self.conn.executemany(
+                "INSERT INTO missing_courses (student_id, category, course_code, requirement, credits)"
+                " VALUES (?, ?, ?, ?, ?)", missing)
+        self.transcripts.update(student[0] for student in students)
+        self.pending = []
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+
+def students_missing(conn, course_code, program=None):
+    """[(transcript, program, concentration, cgpa, standing)] of students still missing course_code."""
+    sql = ("SELECT s.transcript, s.program, s.concentration, s.cgpa, s.standing"
+           " FROM missing_courses m JOIN students s ON s.id = m.student_id"
+           " WHERE m.course_code = ?")
+    params = [course_code.upper()]
+    if program:
+        sql += " AND s.program = ?"
+        params.append(program.upper())
+    return conn.execute(sql + " ORDER BY s.transcript", params).fetchall()
@@ -0,0 +1,170 @@
+"""
+Retake Planner — the retake set that raises CGPA the most within a budget
+Under the retake policy in resolve_retakes() only the best attempt of a course
+counts, so retaking a course replaces its grade points without adding GPA
+credits: every candidate raises the quality points by credits × (points of the
+assumed grade − current points) over a fixed denominator. Picking the best set
+under a course and/or credit budget is therefore an exact 0/1 knapsack, solved
+here by dynamic programming over (courses used, credits used).
+
+Candidates are the counting attempts (BEST or FAILED, credit-bearing, graded)
+below B-: a course already passed with B- or better cannot be retaken
+(UNAUTHORIZED-RETAKE). Objectives:
+  cgpa   — maximise overall CGPA (ties: higher major/core CGPA, fewer credits)
+  major  — maximise major/core CGPA (ties: higher overall CGPA, fewer credits)
+  both   — maximise the sum of the two CGPAs
+"""
+
+from engine.catalog import GROUPS
+from engine.credit_engine import GRADE_ORDER
+from engine.cgpa_engine import GRADE_POINTS
+
+DEFAULT_TARGET_GRADE = "B"
+OBJECTIVES = ("cgpa", "major", "both")
+RETAKE_LIMIT_RANK = GRADE_ORDER["B-"]  # passed with B- or better: no retake
+
+# Grade points in tenths, so gains and knapsack values are exact integers
+_POINTS10 = {grade: round(points * 10) for grade, points in GRADE_POINTS.items()}
+
+# Tie-break layers of a packed knapsack score: primary, secondary, -credits
+_SHIFT = 64
+
+
+def major_codes_for(program):
+    """Course codes of the major/core CGPA: CSE Major Core, or BBA School + BBA Core."""
+    if program.upper() == "CSE":
+        return set(GROUPS["CSE_MAJOR_CORE"])
+    return set(GROUPS["BBA_SCHOOL_CORE"]) | set(GROUPS["BBA_CORE"])
+
+
+def _truncate(quality_points, credits):
+    """CGPA with NSU truncation, as compute_cgpa()."""
+    if credits == 0:
+        return 0.0
+    return int(quality_points / credits * 100) / 100.0
+
+
+def retake_candidates(records, target_grade=DEFAULT_TARGET_GRADE, major_codes=()):
+    """
+    Scan resolved records once (each course has at most one BEST/FAILED attempt).
+    Returns (candidates, totals): candidates are (code, grade, credits, gain10,
+    is_major) for every course a retake at target_grade would improve, in
+    record order; gain10 is the quality-point gain in tenths. totals holds the
+    current quality_points / gpa_credits overall and for major_codes.
+    """
+    target10 = _POINTS10[target_grade]
+    qp = major_qp = 0.0
+    gpa_credits = major_credits = 0
+    candidates = []
+    for r in records:
+        if r.status not in ("BEST", "FAILED") or r.credits == 0:
+            continue
+        points = GRADE_POINTS.get(r.grade)
+        if points is None:  # W / T carry no grade points
+            continue
+        is_major = r.course_code in major_codes
+        qp += points * r.credits
+        gpa_credits += r.credits
+        if is_major:
+            major_qp += points * r.credits
+            major_credits += r.credits
+        gain10 = (target10 - _POINTS10[r.grade]) * r.credits
+        if gain10 > 0 and GRADE_ORDER.get(r.grade, 0) < RETAKE_LIMIT_RANK:
+            candidates.append((r.course_code, r.grade, r.credits, gain10, is_major))
+    totals = {"quality_points": qp, "gpa_credits": gpa_credits,
+              "major_quality_points": major_qp, "major_gpa_credits": major_credits}
+    return candidates, totals
+
+
+def _scores(candidates, objective, gpa_credits, major_credits):
+    """Packed lexicographic knapsack value of each candidate (higher is better)."""
+    scores = []
+    for _, _, credits, gain10, is_major in candidates:
+        major_gain = gain10 if is_major else 0
+        if objective == "cgpa":
+            primary, secondary = gain10, major_gain
+        elif objective == "major":
+            primary, secondary = major_gain, gain10
+        else:
+            # Δcgpa + Δmajor over the common denominator gpa_credits × major_credits
+            primary = gain10 * (major_credits or 1) + major_gain * gpa_credits
+            secondary = 0
+        scores.append((primary << 2 * _SHIFT) + (secondary << _SHIFT) - credits)
+    return scores
+
+
+def _knapsack(weights, scores, max_courses, max_credits):
+    """
+    Exact 0/1 knapsack with a course cap (None: uncapped) and a credit cap.
+    Returns the bitmask of chosen items; dp[k][c] is the best (score, mask)
+    using at most k courses and c credits. Without a course cap the course
+    dimension is dropped and a single row is updated in place.
+    """
+    rows = 1 if max_courses is None else max_courses + 1
+    dp = [[(0, 0)] * (max_credits + 1) for _ in range(rows)]
+    for i, (weight, score) in enumerate(zip(weights, scores)):
+        if score <= 0 or weight > max_credits:
+            continue
+        bit = 1 << i
+        if max_courses is None:
+            layers = ((dp[0], dp[0]),)
+        else:
+            layers = ((dp[k], dp[k - 1]) for k in range(max_courses, 0, -1))
+        for row, prev in layers:
+            for c in range(max_credits, weight - 1, -1):
+                base_score, base_mask = prev[c - weight]
+                if base_score + score > row[c][0]:
+                    row[c] = (base_score + score, base_mask | bit)
+    return dp[-1][max_credits][1]
+
+
+def plan_retakes(records, program="CSE", max_courses=None, max_credits=None,
+                 target_grade=DEFAULT_TARGET_GRADE, objective="cgpa", major_codes=None):
+    """
+    Best set of retakes under a budget of max_courses courses and/or
+    max_credits credits (None: no limit), assuming every retake earns
+    target_grade. records are resolved CourseRecords (the BEST/FAILED
+    attempts are enough, e.g. scan_records()["gpa_records"]); major_codes
+    defaults to major_codes_for(program).
+
+    Returns a dict with: objective, target_grade, courses [(code, grade,
+    credits)] in record order, credits, cgpa / major_cgpa (now) and
+    projected_cgpa / projected_major_cgpa (after the plan), truncated as
+    compute_cgpa().
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective '{objective}' (expected one of {', '.join(OBJECTIVES)})")
+    if target_grade not in _POINTS10:
+        raise ValueError(f"Unknown target grade '{target_grade}'")
+    if major_codes is None:
+        major_codes = major_codes_for(program)
+    candidates, totals = retake_candidates(records, target_grade, major_codes)
+
+    weights = [credits for _, _, credits, _, _ in candidates]
+    scores = _scores(candidates, objective, totals["gpa_credits"], totals["major_gpa_credits"])
+    course_cap = None if max_courses is None else max(0, min(max_courses, len(candidates)))
+    if max_credits is None:
+        # No credit limit: a single credit column with every weight 0
+        mask = _knapsack([0] * len(weights), scores, course_cap, 0)
+    else:
+        mask = _knapsack(weights, scores, course_cap, max(0, max_credits))
+
+    chosen = [c for i, c in enumerate(candidates) if mask >> i & 1]
+    target_points = GRADE_POINTS[target_grade]
+    qp, major_qp = totals["quality_points"], totals["major_quality_points"]
+    for _, grade, credits, _, is_major in chosen:
+        delta = (target_points - GRADE_POINTS[grade]) * credits
+        qp += delta
+        if is_major:
+            major_qp += delta
+
+    return {
+        "objective": objective,
+        "target_grade": target_grade,
+        "courses": [(code, grade, credits) for code, grade, credits, _, _ in chosen],
+        "credits": sum(credits for _, _, credits, _, _ in chosen),
+        "cgpa": _truncate(totals["quality_points"], totals["gpa_credits"]),
+        "major_cgpa": _truncate(totals["major_quality_points"], totals["major_gpa_credits"]),
+        "projected_cgpa": _truncate(qp, totals["gpa_credits"]),
+        "projected_major_cgpa": _truncate(major_qp, totals["major_gpa_credits"]),
+    }
@@ -0,0 +1,341 @@
+"""
+Graduation Scheduler — fewest semesters to finish the remaining courses
+Turns the remaining requirements of run_audit() into concrete courses and lays
+them out term by term under a per-term credit cap, respecting the program's
+prerequisite DAG (PREREQUISITES_CSE / PREREQUISITES_BBA) and the _SENIOR_
+gate (SENIOR_CREDITS earned before the term). A prerequisite that is not
+itself remaining counts as met (passed or waived), and a lab is taken in the
+same term as its course when both remain.
+
+  - Choice groups ("pick n") contribute the n options with the shortest
+    prerequisite chains; "Any ..." placeholders and any credit gap left after
+    the listed courses become 3-credit elective slots.
+  - layered (default): critical-path list scheduling; each term takes the
+    available courses with the longest chain of dependants first, then fills
+    the credits left with the courses nothing depends on.
+  - exact: branch and bound over maximal term loads, deepening from the
+    lower bound max(credits / cap, longest chain incl. the senior gate) up to
+    the layered count, within a node budget; "optimal" says whether the
+    count is proven minimal.
+
+Schedules are cached per (program, remaining courses, credits short of the
+senior gate, cap, mode), so identical deficiency profiles across a cohort are
+solved once.
+"""
+
+import re
+from functools import lru_cache
+
+from engine import catalog
+from engine.catalog import SENIOR, SENIOR_CREDITS
+
+DEFAULT_TERM_CREDITS = 15
+SLOT_CREDITS = 3              # credits of one elective slot
+SCHEDULE_CACHE_SIZE = 4096
+SEARCH_NODE_LIMIT = 20000     # branch-and-bound nodes per schedule
+
+FILLER = "Any course"
+_PICK_RE = re.compile(r'pick (\d+)')
+
+
+class _SearchLimit(Exception):
+    """Branch and bound ran out of nodes."""
+
+
+# ─── Remaining requirements → courses ───────────────────
+
+def pick_count(category):
+    """n of a "... (pick n)" requirement category, or None for any other category."""
+    pick = _PICK_RE.search(category)
+    return int(pick.group(1)) if pick else None
+
+
+def _slots(label, credits):
+    """credits as SLOT_CREDITS-credit slots (the last one may be smaller)."""
+    full, rest = divmod(credits, SLOT_CREDITS)
+    return [(label, SLOT_CREDITS)] * full + ([(label, rest)] if rest else [])
+
+
+def _needs_senior(code, prereqs, remaining):
+    """Whether code waits for the _SENIOR_ gate, directly or through a remaining prerequisite."""
+    reqs = prereqs.get(code, ())
+    return SENIOR in reqs or any(r in remaining and _needs_senior(r, prereqs, remaining) for r in reqs)
+
+
+def _chain_length(code, prereqs, required, memo):
+    """Courses in the longest remaining prerequisite chain ending at code."""
+    if code not in memo:
+        memo[code] = 0  # guards against cycles; the catalog rejects them anyway
+        memo[code] = 1 + max((_chain_length(r, prereqs, required, memo)
+                              for r in prereqs.get(code, ()) if r in required), default=0)
+    return memo[code]
+
+
+def schedule_courses(program, remaining, credits_earned=0, credit_gap=0):
+    """
+    Concrete (code, credits) courses left to take from the remaining dict of
+    run_audit(), by code with the slots last. Placeholders become FILLER /
+    "Any CSE 4xx" slots, and FILLER slots are added until the courses cover
+    credit_gap and enough credits can be earned before any _SENIOR_ course.
+    """
+    prereqs = catalog.PREREQUISITES.get(program.upper(), {})
+    courses, slots, choices = [], [], []
+    for category, options in remaining.items():
+        pick = pick_count(category)
+        if pick is not None or "Choice" in category:
+            choices.append((1 if pick is None else pick, options))
+            continue
+        for code, credits in options.items():
+            if code.startswith("Any "):
+                label = code.split(" (")[0]
+                slots += _slots(FILLER if label == "Any courses" else label, credits)
+            else:
+                courses.append((code, credits))
+
+    required, memo = {code for code, _ in courses}, {}
+    for n, options in choices:
+        ranked = sorted(options.items(), key=lambda kv: _chain_length(kv[0], prereqs, required, memo))
+        courses += ranked[:n]
+
+    # Courses that need no _SENIOR_ course first must reach the senior gate
+    total = sum(credits for _, credits in courses) + sum(credits for _, credits in slots)
+    short = max(credit_gap - total, 0)
+    required = {code for code, _ in courses}
+    gated = [code for code in prereqs if code in required and _needs_senior(code, prereqs, required)]
+    if gated:
+        open_credits = total - sum(credits for code, credits in courses if code in gated)
+        short = max(short, SENIOR_CREDITS - credits_earned - open_credits)
+    if short > 0:
+        slots += [(FILLER, SLOT_CREDITS)] * -(-short // SLOT_CREDITS)
+    return sorted(courses) + sorted(slots)
+
+
+# ─── Scheduling ─────────────────────────────────────────
+
+def _units(program, courses):
+    """
+    Group sorted courses into scheduling units, a lab with its course since
+    both are taken in the same term. Returns (units, credits, preds, gated):
+    member course indexes, credits, direct prerequisite masks and senior
+    flags per unit.
+    """
+    units, credits, unit_of = [], [], {}
+    for i, (code, course_credits) in enumerate(courses):
+        u = unit_of.get(code[:-1]) if code.endswith("L") else None
+        if u is not None:  # sorted courses put a lab right after its course
+            units[u].append(i)
+            credits[u] += course_credits
+            unit_of[code] = u
+            continue
+        unit_of[code] = len(units)
+        units.append([i])
+        credits.append(course_credits)
+
+    preds, gated = [0] * len(units), [False] * len(units)
+    for code, reqs in catalog.PREREQUISITES.get(program, {}).items():
+        u = unit_of.get(code)
+        if u is not None:
+            for r in reqs:
+                if r == SENIOR:
+                    gated[u] = True
+                elif r in unit_of:
+                    preds[u] |= 1 << unit_of[r]
+    return units, credits, preds, gated
+
+
+def _bits(mask):
+    """Indexes of the set bits of mask."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _fill(ready, credits, space):
+    """The units of ready (by decreasing credits) with the most credits that fit in space."""
+    taken, load = [], 0
+    for i in ready:  # first fit decreasing is usually exact
+        if load + credits[i] <= space:
+            taken.append(i)
+            load += credits[i]
+    if load == space or len(taken) == len(ready):
+        return taken
+    by_credits = {}
+    for i in ready:
+        by_credits.setdefault(credits[i], []).append(i)
+    best = {0: ()}  # load → ((credits, units taken), ...), larger courses first
+    for value, units in sorted(by_credits.items(), reverse=True):
+        if value:
+            for load, taken in list(best.items()):
+                for k in range(1, min(len(units), (space - load) // value) + 1):
+                    best.setdefault(load + k * value, taken + ((value, k),))
+    counts = dict(best[max(best)])
+    counts[0] = len(by_credits.get(0, ()))
+    return [i for value, units in by_credits.items() for i in units[:counts.get(value, 0)]]
+
+
+def _layered(credits, preds, gated, tail, order, senior_needed, cap):
+    """
+    List schedule: a list of terms, each a list of unit indexes. Each term
+    takes the ready units on a prerequisite chain in order while they fit,
+    then the ready leaves that fill the most of the remaining credits.
+    """
+    left = (1 << len(credits)) - 1
+    pending, earned, terms = order, 0, []
+    while pending:
+        term, leaves, load = [], [], 0
+        for i in pending:
+            if preds[i] & left or (gated[i] and earned < senior_needed):
+                continue
+            if tail[i] > 1:
+                if load + credits[i] <= cap:
+                    term.append(i)
+                    load += credits[i]
+            else:
+                leaves.append(i)
+        term += _fill(leaves, credits, cap - load)
+        if not term:  # unreachable: schedule_courses() pads the senior gate
+            break
+        terms.append(sorted(term))
+        for i in term:
+            left ^= 1 << i
+            earned += credits[i]
+        pending = [i for i in pending if left >> i & 1]
+    return terms
+
+
+def _branch_and_bound(credits, preds, gated, twin, tail, order, senior_needed, cap, lower, upper, node_limit):
+    """
+    Fewest terms below upper, deepening from lower: a list of terms, or None
+    when upper is already minimal. Raises _SearchLimit after node_limit nodes.
+    Only maximal term loads are branched on: taking a course earlier never
+    delays a dependant or the senior gate, so some optimum uses them.
+    """
+    full = (1 << len(credits)) - 1
+    total = sum(credits)
+    failed = {}  # done mask → most terms left known not to suffice
+    nodes = [0]
+
+    def loads(ready, k, done, chosen, load):
+        """Maximal subsets of ready[k:] that fit on top of load, greedy order first."""
+        nodes[0] += 1
+        if nodes[0] > node_limit:
+            raise _SearchLimit()
+        if k == len(ready):
+            for i in ready:
+                if (not chosen >> i & 1 and load + credits[i] <= cap
+                        and (twin[i] < 0 or (done | chosen) >> twin[i] & 1)):
+                    return
+            yield chosen, load
+            return
+        i = ready[k]
+        if load + credits[i] <= cap and (twin[i] < 0 or (done | chosen) >> twin[i] & 1):
+            yield from loads(ready, k + 1, done, chosen | 1 << i, load + credits[i])
+        yield from loads(ready, k + 1, done, chosen, load)
+
+    def finish(done, earned, terms_left):
+        if done == full:
+            return []
+        if failed.get(done, -1) >= terms_left:
+            return None
+        todo = [i for i in order if not done >> i & 1]
+        gate_terms = -(-max(senior_needed - earned, 0) // cap)
+        if (total - earned > terms_left * cap
+                or max(tail[i] + (gate_terms if gated[i] else 0) for i in todo) > terms_left):
+            failed[done] = terms_left
+            return None
+        ready = [i for i in todo if not preds[i] & ~done and (not gated[i] or earned >= senior_needed)]
+        for chosen, load in loads(ready, 0, done, 0, 0):
+            rest = finish(done | chosen, earned + load, terms_left - 1)
+            if rest is not None:
+                return [sorted(_bits(chosen))] + rest
+        failed[done] = terms_left
+        return None
+
+    for terms in range(lower, upper):
+        plan = finish(0, 0, terms)
+        if plan is not None:
+            return plan
+    return None
+
+
+@lru_cache(maxsize=SCHEDULE_CACHE_SIZE)
+def _solve(program, courses, senior_needed, cap, exact, node_limit):
+    """(terms as tuples of (code, credits), lower bound, proven optimal) for sorted courses."""
+    units, credits, preds, gated = _units(program, courses)
+    cap = max([cap] + credits)  # a unit above the cap is taken on its own
+    n = len(units)
+
+    # tail: units in the longest chain starting at a unit; earliest: first term it can be taken in.
+    # Only units in a remaining prerequisite chain differ from 1.
+    dependants = {}
+    for i in range(n):
+        if preds[i]:
+            for p in _bits(preds[i]):
+                dependants.setdefault(p, []).append(i)
+    tail, earliest = [1] * n, [1] * n
+    senior_term = 1 + -(-senior_needed // cap)
+
+    def tail_of(i):
+        if tail[i] == 1 and i in dependants:
+            tail[i] = 1 + max(map(tail_of, dependants[i]))
+        return tail[i]
+
+    def earliest_of(i):
+        if earliest[i] == 1 and (preds[i] or gated[i]):
+            earliest[i] = max([senior_term if gated[i] else 1] + [earliest_of(p) + 1 for p in _bits(preds[i])])
+        return earliest[i]
+
+    chains = [i for i in range(n) if preds[i] or gated[i] or i in dependants]
+    for i in chains:
+        tail_of(i)
+        earliest_of(i)
+    lower = max([-(-sum(credits) // cap)] + [earliest[i] for i in chains]) if n else 0
+
+    # Units off every chain with equal credits are interchangeable: taking them in
+    # index order (twin: the previous such unit) spares branch and bound the permutations
+    twin, last = [-1] * n, {}
+    for i in range(n):
+        if not (preds[i] or gated[i] or i in dependants):
+            twin[i] = last.get(credits[i], -1)
+            last[credits[i]] = i
+
+    # Critical path first: longest chain of dependants, then more credits
+    order = sorted(range(n), key=lambda i: (-tail[i], -credits[i], i))
+    terms = _layered(credits, preds, gated, tail, order, senior_needed, cap)
+    optimal = len(terms) <= lower
+    if exact and not optimal:
+        try:
+            better = _branch_and_bound(credits, preds, gated, twin, tail, order, senior_needed, cap,
+                                       lower, len(terms), node_limit)
+            terms = better or terms
+            optimal = True
+        except _SearchLimit:
+            pass
+    return tuple(tuple(courses[c] for i in term for c in units[i]) for term in terms), lower, optimal
+
+
+def plan_semesters(program, remaining, credits_earned=0, credit_gap=0,
+                   max_credits=DEFAULT_TERM_CREDITS, exact=False, node_limit=SEARCH_NODE_LIMIT):
+    """
+    Semester-by-semester plan for the remaining dict of run_audit(), taking at
+    most max_credits credits a term. credits_earned drives the _SENIOR_ gate;
+    credit_gap is the credit shortfall (total required − earned) the plan
+    must also cover. exact=True searches for a proven minimum (branch and
+    bound, up to node_limit nodes) instead of the layered schedule alone.
+
+    Returns a dict with: semesters [[(code, credits), ...], ...], count,
+    credits, max_credits, lower_bound and optimal (count is proven minimal).
+    """
+    program = program.upper()
+    courses = tuple(schedule_courses(program, remaining, credits_earned, credit_gap))
+    senior_needed = max(SENIOR_CREDITS - credits_earned, 0)
+    terms, lower, optimal = _solve(program, courses, senior_needed, max_credits, exact, node_limit)
+    return {
+        "semesters": [list(term) for term in terms],
+        "count": len(terms),
+        "credits": sum(credits for _, credits in courses),
+        "max_credits": max_credits,
+        "lower_bound": lower,
+        "optimal": optimal,
+    }
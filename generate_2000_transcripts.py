@@ -1,34 +1,38 @@
 #!/usr/bin/env python3
 """
-NSU Audit Core — 2000 Unique Student Transcript Generator
-Generates 2000 individual transcript CSV files in a 'transcripts/' directory,
-each representing a different student with varied academic profiles.
+NSU Audit Core — Unique Student Transcript Generator
+Generates individual transcript CSV files (2000 by default) in a
+'transcripts/' directory, each representing a different student with varied
+academic profiles. Every student is generated from its own seed, derived from
+(--seed, student id), so the corpus is identical for any --workers count.
+
+Usage:
+    python generate_2000_transcripts.py [--count 2000] [--workers N] [--seed 2024]
+                                        [--out DIR | --pack FILE | --combined FILE] [--clean]
 """
 
+import argparse
 import csv
+import glob
+import hashlib
+import multiprocessing
 import os
 import random
 import sys
-from engine.credit_engine import SEMESTERS
-from engine.prerequisites import PREREQUISITES_CSE, PREREQUISITES_BBA
+import time
+from engine.credit_engine import SEMESTERS, semester_ordinal, parse_rows
+from engine.corpus import pack_students
 
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 except Exception:
     pass
 
-from engine.course_db import *
-for d in [CSE_MAJOR_CORE, CSE_CAPSTONE, CSE_SEPS_CORE, CSE_GED, CSE_GED_CHOICE_1, CSE_GED_CHOICE_2,
-          CSE_GED_CHOICE_3, CSE_ELECTIVES_400, OPEN_ELECTIVES, BBA_SCHOOL_CORE, BBA_CORE, BBA_GED,
-          BBA_GED_CHOICE_LANG, BBA_GED_CHOICE_HIS, BBA_GED_CHOICE_POL, BBA_GED_CHOICE_SOC,
-          BBA_GED_CHOICE_SCI, BBA_GED_CHOICE_LAB, BBA_INTERNSHIP]:
-    ALL_COURSES.update(d)
-for conc_data in BBA_CONC_COURSES.values():
-    ALL_COURSES.update(conc_data["required"])
-    ALL_COURSES.update(conc_data["elective"])
-ALL_COURSES["ENG102"] = ("Introduction to Composition", 3)
-ALL_COURSES["MAT112"] = ("College Algebra", 0)
-ALL_COURSES["BUS112"] = ("Intro to Business Mathematics", 3)
+from engine.course_db import *  # requirement tables (read-only)
+from engine.catalog import ALL_COURSES, PREREQUISITES
+
+PREREQUISITES_CSE = PREREQUISITES["CSE"]
+PREREQUISITES_BBA = PREREQUISITES["BBA"]
 
 # SEMESTERS imported from engine.credit_engine
 
@@ -111,14 +115,11 @@ def grade_for_profile(profile, grade_counts=None):
 
 def sort_rows(rows):
     """Sort transcript rows chronologically by semester, and randomly scatter within semester."""
-    # Create a mapping for quick lookup
-    sem_map = {sem: i for i, sem in enumerate(SEMESTERS)}
-    
     # Randomly shuffle rows first so that stable sorting scrambles courses within the same semester
     random.shuffle(rows)
     
-    # If a semester is not in the list (e.g. transfer), give it index -1
-    return sorted(rows, key=lambda r: sem_map.get(r[4], -1))
+    # Semesters off the timeline (e.g. transfer) have ordinal -1 and sort first
+    return sorted(rows, key=lambda r: semester_ordinal(r[4]))
 
 
 def pick_semesters(n, start_idx=None):
@@ -519,41 +520,85 @@ def generate_dept_change_student(student_id, current_program, previous_program):
     return sort_rows(rows), concentration
 
 
-def generate_all():
-    random.seed(2024)
-    output_dir = os.path.join(os.path.dirname(__file__) or ".", "transcripts")
-    os.makedirs(output_dir, exist_ok=True)
-
-    # Clean old transcripts
-    import glob
-    for old_file in glob.glob(os.path.join(output_dir, "*.csv")):
-        try:
-            os.remove(old_file)
-        except PermissionError:
-            pass # Skip locked files
-
-    # Profile distribution across 2000 students
-    profile_weights = {
-        "top_student": 200,
-        "good_student": 350,
-        "struggling": 200,
-        "early_stage": 150,
-        "mid_stage": 200,
-        "nearly_done": 250,
-        "retake_heavy": 150,
-        "transfer_student": 100,
-        "withdrawn_heavy": 100,
-        "probation": 200,
-        "dept_change": 100,
-    }
+# ─── Corpus Generation ───────────────────────────────────
+
+DEFAULT_SEED = 2024
+DEFAULT_COUNT = 2000
+CHUNK_SIZE = 256  # students per worker task
+
+# Profile mix, per 2000 students (scaled to --count)
+PROFILE_WEIGHTS = {
+    "top_student": 200,
+    "good_student": 350,
+    "struggling": 200,
+    "early_stage": 150,
+    "mid_stage": 200,
+    "nearly_done": 250,
+    "retake_heavy": 150,
+    "transfer_student": 100,
+    "withdrawn_heavy": 100,
+    "probation": 200,
+    "dept_change": 100,
+}
+
+
+def student_seed(base_seed, student_id):
+    """
+    RNG seed of one student, derived only from (base seed, student id), so a
+    student's transcript is the same whatever the worker count or order.
+    """
+    digest = hashlib.blake2b(f"{base_seed}:{student_id}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def assign_profiles(count, base_seed=DEFAULT_SEED):
+    """
+    Profiles of students 1..count: PROFILE_WEIGHTS scaled to count (largest
+    remainder), shuffled with the base seed.
+    """
+    total = sum(PROFILE_WEIGHTS.values())
+    quotas = {p: count * w // total for p, w in PROFILE_WEIGHTS.items()}
+    by_remainder = sorted(PROFILE_WEIGHTS, key=lambda p: -(count * PROFILE_WEIGHTS[p] % total))
+    for profile in by_remainder[:count - sum(quotas.values())]:
+        quotas[profile] += 1
 
     students = []
-    for profile, count in profile_weights.items():
-        students.extend([profile] * count)
-    random.shuffle(students)
+    for profile, quota in quotas.items():
+        students.extend([profile] * quota)
+    random.Random(base_seed).shuffle(students)
+    return students
+
+
+def generate_student(student_id, profile, base_seed=DEFAULT_SEED, width=4):
+    """
+    Generate one student from its own seed.
+    Returns (filename stem, program, concentration, rows).
+    """
+    random.seed(student_seed(base_seed, student_id))
+    program = random.choices(["CSE", "BBA"], weights=[65, 35], k=1)[0]
+    concentration = None
+    ex_major = None
+
+    if profile == "dept_change":
+        ex_major = "BBA" if program == "CSE" else "CSE"
+        rows, concentration = generate_dept_change_student(student_id, program, ex_major)
+    elif program == "CSE":
+        rows = generate_cse_student(profile, student_id)
+    else:
+        rows, concentration = generate_bba_student(profile, student_id)
+
+    # Encode concentration and department change in the name
+    parts = [f"student_{student_id:0{width}d}", program]
+    if concentration:
+        parts.append(concentration)
+    if ex_major:
+        parts.append(f"ex_{ex_major}")
+    parts.append(profile)
+    return "_".join(parts), program, concentration, rows
+
 
-    # Stats tracking
-    stats = {
+def new_stats():
+    return {
         "total": 0, "cse": 0, "bba": 0,
         "eligible_count": 0,
         "probation_count": 0,
@@ -563,68 +608,137 @@ def generate_all():
         "w_rows": 0, "f_rows": 0, "t_rows": 0, "i_rows": 0,
     }
 
-    for i, profile in enumerate(students):
-        student_id = i + 1
-        program = random.choices(["CSE", "BBA"], weights=[65, 35], k=1)[0]
-        concentration = None
-        ex_major = None
-
-        if profile == "dept_change":
-            ex_major = "BBA" if program == "CSE" else "CSE"
-            rows, concentration = generate_dept_change_student(student_id, program, ex_major)
-        elif program == "CSE":
-            rows = generate_cse_student(profile, student_id)
-            stats["cse"] += 1
+
+def count_student(stats, profile, program, rows):
+    """Add one generated student to stats."""
+    stats["cse" if program == "CSE" else "bba"] += 1
+    stats["profile_counts"][profile] += 1
+    stats["total"] += 1
+
+    course_attempts = {}
+    for row in rows:
+        code, name, cr, grade, sem = row
+        stats["total_rows"] += 1
+        if grade == "W": stats["w_rows"] += 1
+        if grade == "F": stats["f_rows"] += 1
+        if grade == "T": stats["t_rows"] += 1
+        if grade == "I": stats["i_rows"] += 1
+        course_attempts.setdefault(code, []).append(grade)
+
+    for code, attempts in course_attempts.items():
+        if len(attempts) > 1:
+            stats["retake_rows"] += len(attempts)
+
+
+def merge_stats(stats, other):
+    for key, value in other.items():
+        if key == "profile_counts":
+            for profile, count in value.items():
+                stats[key][profile] += count
         else:
-            rows, concentration = generate_bba_student(profile, student_id)
-            stats["bba"] += 1
-
-        if profile == "dept_change":
-            if program == "CSE": stats["cse"] += 1
-            else: stats["bba"] += 1
-
-        stats["profile_counts"][profile] += 1
-        stats["total"] += 1
-
-        # Count stats
-        course_attempts = {}
-        for row in rows:
-            code, name, cr, grade, sem = row
-            stats["total_rows"] += 1
-            if grade == "W": stats["w_rows"] += 1
-            if grade == "F": stats["f_rows"] += 1
-            if grade == "T": stats["t_rows"] += 1
-            if grade == "I": stats["i_rows"] += 1
-            course_attempts.setdefault(code, []).append(grade)
-
-        for code, attempts in course_attempts.items():
-            if len(attempts) > 1:
-                stats["retake_rows"] += len(attempts)
-
-        # Write CSV — encode concentration and department change in filenames
-        parts = [f"student_{student_id:04d}", program]
-        if concentration:
-            parts.append(concentration)
-        if ex_major:
-            parts.append(f"ex_{ex_major}")
-        parts.append(profile)
-        
-        filename = "_".join(parts) + ".csv"
-        filepath = os.path.join(output_dir, filename)
-        with open(filepath, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(["course_code", "course_name", "credits", "grade", "semester"])
-            for row in rows:
-                writer.writerow(row)
+            stats[key] += value
 
-    return stats, output_dir
 
+def write_transcript(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["course_code", "course_name", "credits", "grade", "semester"])
+        writer.writerows(rows)
 
-def print_summary(stats, output_dir):
+
+def _generate_chunk(job):
+    """
+    Worker: generate a chunk of students. With out_dir each transcript is written
+    there and only the stats come back; otherwise the students come back too, as
+    (stem, program, concentration, rows), for the parent to write in order.
+    With normalise the rows are parsed here (as parse_rows() does) for packing.
+    """
+    chunk, base_seed, width, out_dir, normalise = job
+    stats = new_stats()
+    students = []
+    for student_id, profile in chunk:
+        stem, program, concentration, rows = generate_student(student_id, profile, base_seed, width)
+        count_student(stats, profile, program, rows)
+        if out_dir is not None:
+            write_transcript(os.path.join(out_dir, stem + ".csv"), rows)
+            continue
+        if normalise:
+            rows = [(r.course_code, r.course_name, r.credits, r.grade, r.semester)
+                    for r in parse_rows(rows)]
+        students.append((stem, program, concentration, rows))
+    return stats, students
+
+
+def generate_all(count=DEFAULT_COUNT, workers=1, seed=DEFAULT_SEED, out_dir=None, pack=None,
+                 combined=None, clean=False):
+    """
+    Generate count students and write them as one CSV per student in out_dir
+    (default: transcripts/ next to this script), as a packed corpus file (pack,
+    see engine.corpus), or as one combined CSV with a leading student_id column
+    (combined). Students are generated in chunks across workers processes; the
+    output is the same for any worker count.
+    Returns (stats, output path).
+    """
+    if pack is None and combined is None and out_dir is None:
+        out_dir = os.path.join(os.path.dirname(__file__) or ".", "transcripts")
+    if out_dir is not None:
+        os.makedirs(out_dir, exist_ok=True)
+        if clean:
+            for old_file in glob.glob(os.path.join(out_dir, "*.csv")):
+                try:
+                    os.remove(old_file)
+                except PermissionError:
+                    pass  # Skip locked files
+
+    width = max(4, len(str(count)))
+    profiles = assign_profiles(count, seed)
+    ids = list(enumerate(profiles, start=1))
+    jobs = [(ids[i:i + CHUNK_SIZE], seed, width, out_dir, pack is not None)
+            for i in range(0, count, CHUNK_SIZE)]
+
+    if workers <= 1:
+        results = map(_generate_chunk, jobs)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(processes=workers)
+        results = pool.imap(_generate_chunk, jobs)
+
+    stats = new_stats()
+
+    def students():
+        for chunk_stats, chunk in results:
+            merge_stats(stats, chunk_stats)
+            yield from chunk
+
+    try:
+        if pack is not None:
+            pack_students(((stem + ".csv", program, concentration, rows)
+                           for stem, program, concentration, rows in students()), pack)
+            output = pack
+        elif combined is not None:
+            with open(combined, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["student_id", "course_code", "course_name", "credits", "grade", "semester"])
+                for stem, _, _, rows in students():
+                    writer.writerows([stem] + row for row in rows)
+            output = combined
+        else:
+            for _ in students():
+                pass
+            output = out_dir
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    return stats, output
+
+
+def print_summary(stats, output, elapsed=None, workers=1):
     print("=" * 60)
-    print("  NSU 2000 UNIQUE TRANSCRIPT GENERATOR - SUMMARY")
+    print(f"  NSU {stats['total']} UNIQUE TRANSCRIPT GENERATOR - SUMMARY")
     print("=" * 60)
-    print(f"  Output directory     : {output_dir}")
+    print(f"  Output               : {output}")
     print(f"  Total transcripts    : {stats['total']}")
     print(f"  CSE students         : {stats['cse']}")
     print(f"  BBA students         : {stats['bba']}")
@@ -634,14 +748,41 @@ def print_summary(stats, output_dir):
     print(f"  F (Failed) rows      : {stats['f_rows']}")
     print(f"  T (Transfer) rows    : {stats['t_rows']}")
     print(f"  I (Incomplete) rows  : {stats['i_rows']}")
+    if elapsed is not None:
+        print(f"  Workers              : {workers}")
+        print(f"  Wall time            : {elapsed:.2f}s ({stats['total'] / elapsed if elapsed > 0 else 0.0:.0f} students/sec)")
     print()
     print("  Profile Distribution:")
     for profile, count in stats["profile_counts"].items():
-        bar = "#" * (count // 10)
+        bar = "#" * (count * 200 // max(stats["total"], 1))
         print(f"    {profile:20s}: {count:4d}  {bar}")
     print("=" * 60)
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic NSU student transcripts")
+    parser.add_argument("--count", "-n", type=int, default=DEFAULT_COUNT,
+                        help=f"Number of students (default: {DEFAULT_COUNT})")
+    parser.add_argument("--workers", "-w", type=int, default=1,
+                        help="Generator processes (default: 1; output does not depend on it)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED,
+                        help=f"Base seed; each student is seeded from (seed, student id) (default: {DEFAULT_SEED})")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--out", "-o", metavar="DIR",
+                        help="Write one CSV per student into DIR (default: transcripts/)")
+    output.add_argument("--pack", metavar="FILE",
+                        help="Write a single packed corpus file instead (see corpus.py)")
+    output.add_argument("--combined", metavar="FILE",
+                        help="Write a single CSV with a leading student_id column instead")
+    parser.add_argument("--clean", action="store_true",
+                        help="Delete existing *.csv files in the output directory first")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    stats, output = generate_all(max(0, args.count), max(1, args.workers), args.seed,
+                                 args.out, args.pack, args.combined, args.clean)
+    print_summary(stats, output, time.perf_counter() - start, max(1, args.workers))
+
+
 if __name__ == "__main__":
-    stats, output_dir = generate_all()
-    print_summary(stats, output_dir)
+    main()
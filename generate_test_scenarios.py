@@ -4,15 +4,7 @@ import random
 from engine.course_db import *
 from engine.credit_engine import SEMESTERS
 
-# Ensure ALL_COURSES is fully populated
-for d in [CSE_MAJOR_CORE, CSE_CAPSTONE, CSE_SEPS_CORE, CSE_GED, CSE_GED_CHOICE_1, CSE_GED_CHOICE_2,
-          CSE_GED_CHOICE_3, CSE_ELECTIVES_400, OPEN_ELECTIVES, BBA_SCHOOL_CORE, BBA_CORE, BBA_GED,
-          BBA_GED_CHOICE_LANG, BBA_GED_CHOICE_HIS, BBA_GED_CHOICE_POL, BBA_GED_CHOICE_SOC,
-          BBA_GED_CHOICE_SCI, BBA_GED_CHOICE_LAB, BBA_INTERNSHIP, WAIVER_COURSES]:
-    ALL_COURSES.update(d)
-for conc_data in BBA_CONC_COURSES.values():
-    ALL_COURSES.update(conc_data["required"])
-    ALL_COURSES.update(conc_data["elective"])
+from engine.catalog import ALL_COURSES
 
 OUTPUT_DIR = "test_scenarios"
 os.makedirs(OUTPUT_DIR, exist_ok=True)
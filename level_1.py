@@ -10,19 +10,24 @@ Usage:
 import sys
 import os
 from engine.credit_engine import process_transcript
+from engine.archive import transcript_exists
 
 # ─── Color helpers ───────────────────────────────────────
-try:
-    from colorama import init as colorama_init, Fore, Style
-    colorama_init(autoreset=True)
-    GREEN = Fore.GREEN
-    RED = Fore.RED
-    YELLOW = Fore.YELLOW
-    CYAN = Fore.CYAN
-    BOLD = Style.BRIGHT
-    RESET = Style.RESET_ALL
-except ImportError:
-    GREEN = RED = YELLOW = CYAN = BOLD = RESET = ""
+# colorama is only loaded for a terminal; piped or redirected output is plain
+GREEN = RED = YELLOW = CYAN = BOLD = DIM = RESET = ""
+if sys.stdout.isatty():
+    try:
+        from colorama import init as colorama_init, Fore, Style
+        colorama_init(autoreset=True)
+        GREEN = Fore.GREEN
+        RED = Fore.RED
+        YELLOW = Fore.YELLOW
+        CYAN = Fore.CYAN
+        BOLD = Style.BRIGHT
+        DIM = Style.DIM
+        RESET = Style.RESET_ALL
+    except ImportError:
+        pass
 
 def header_bar(title, width=50):
     return f"\n{'=' * width}\n  {title}\n{'=' * width}"
@@ -36,14 +41,14 @@ def main():
         sys.exit(1)
 
     filepath = sys.argv[1]
-    if not os.path.exists(filepath):
+    if not transcript_exists(filepath):
         print(f"File not found: {filepath}")
         sys.exit(1)
 
     # Level 1 Processing
     records, attempted, earned = process_transcript(filepath)
 
-    from engine.course_db import ALL_COURSES
+    from engine.catalog import ALL_COURSES
     unrecognized = set(r.course_code for r in records if r.course_code not in ALL_COURSES)
     if unrecognized:
         print(header_bar("LEVEL 1 — CREDIT TALLY REPORT"))
@@ -56,38 +61,18 @@ def main():
         sys.exit(1)
 
     # Calculate Dismissal Point
-    from engine.credit_engine import SEMESTERS, resolve_retakes
-    from engine.cgpa_engine import compute_cgpa
-    import copy
-    
-    sem_map = {sem: i for i, sem in enumerate(SEMESTERS)}
-    transcript_sems = sorted(
-        list(set(r.semester for r in records if r.semester in sem_map)), 
-        key=lambda s: sem_map[s]
-    )
-
-    consecutive_p = 0
+    from engine.cgpa_engine import iter_probation_timeline
+
     dismissal_sem = None
     cutoff_records = []
-    
-    for current_sem in transcript_sems:
-        if dismissal_sem:
-            break
-            
-        cutoff_idx = sem_map[current_sem]
-        subset = [copy.copy(r) for r in records if r.semester in sem_map and sem_map[r.semester] <= cutoff_idx]
-        resolved_subset = resolve_retakes(subset)
-        snap_cgpa, _, _ = compute_cgpa(resolved_subset)
-        
+
+    for snap in iter_probation_timeline(records):
         # Add these records to our safe cutoff
-        cutoff_records.extend([r for r in records if r.semester == current_sem])
-        
-        if snap_cgpa < 2.0:
-            consecutive_p += 1
-            if consecutive_p >= 3:
-                dismissal_sem = current_sem
-        else:
-            consecutive_p = 0
+        cutoff_records.extend(snap["records"])
+
+        if snap["consecutive_p"] >= 3:
+            dismissal_sem = snap["semester"]
+            break
 
     # If dismissed, recalculate earned credits up to the cutoff
     if dismissal_sem:
@@ -106,7 +91,7 @@ def main():
     for r in records:
         status_color = GREEN if r.status in ("BEST", "WAIVED") else ""
         if r.status in ("RETAKE-IGNORED", "UNAUTHORIZED-RETAKE", "WITHDRAWN"):
-            status_color = Style.DIM if r.status == "RETAKE-IGNORED" else YELLOW
+            status_color = DIM if r.status == "RETAKE-IGNORED" else YELLOW
         elif r.status in ("FAILED", "REJECTED-TRANSFER"): 
             status_color = RED
 
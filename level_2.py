@@ -19,20 +19,24 @@ except Exception:
     pass
 
 from engine.credit_engine import process_transcript
+from engine.archive import transcript_exists
 from engine.cgpa_engine import process_cgpa, GRADE_POINTS, compute_major_cgpa
 
 # ─── Color helpers ───────────────────────────────────────
-try:
-    from colorama import init as colorama_init, Fore, Style
-    colorama_init(autoreset=True)
-    GREEN = Fore.GREEN
-    RED = Fore.RED
-    YELLOW = Fore.YELLOW
-    CYAN = Fore.CYAN
-    BOLD = Style.BRIGHT
-    RESET = Style.RESET_ALL
-except ImportError:
-    GREEN = RED = YELLOW = CYAN = BOLD = RESET = ""
+# colorama is only loaded for a terminal; piped or redirected output is plain
+GREEN = RED = YELLOW = CYAN = BOLD = RESET = ""
+if sys.stdout.isatty():
+    try:
+        from colorama import init as colorama_init, Fore, Style
+        colorama_init(autoreset=True)
+        GREEN = Fore.GREEN
+        RED = Fore.RED
+        YELLOW = Fore.YELLOW
+        CYAN = Fore.CYAN
+        BOLD = Style.BRIGHT
+        RESET = Style.RESET_ALL
+    except ImportError:
+        pass
 
 
 def color(text, clr):
@@ -96,48 +100,34 @@ def print_level2_report(filepath, program, records, credits_attempted, credits_e
 
     # Semester-by-semester breakdown (replacing the flat list)
     print(section_bar("SEMESTER-BY-SEMESTER PROGRESSION"))
-    from engine.credit_engine import SEMESTERS, resolve_retakes
-    from engine.cgpa_engine import compute_cgpa
-    import copy
-
-    sem_map = {sem: i for i, sem in enumerate(SEMESTERS)}
-    transcript_sems = sorted(
-        list(set(r.semester for r in records if r.semester in sem_map)), 
-        key=lambda s: sem_map[s]
-    )
+    from engine.cgpa_engine import iter_probation_timeline
 
-    consecutive_p = 0
     dismissed = False
 
-    for current_sem in transcript_sems:
+    for snap in iter_probation_timeline(records):
         if dismissed:
             break
 
-        # Get records up to and including strictly this semester ONLY
-        cutoff_idx = sem_map[current_sem]
-        subset = [copy.copy(r) for r in records if r.semester in sem_map and sem_map[r.semester] <= cutoff_idx]
-        
-        # Calculate standing and cumulative CGPA specifically for this snapshot
-        resolved_subset = resolve_retakes(subset)
-        snap_cgpa, _, snap_credits = compute_cgpa(resolved_subset)
-        
-        if snap_cgpa < 2.0:
-            consecutive_p += 1
-            if consecutive_p == 1:
-                snap_standing = color("PROBATION (P1)", YELLOW)
-            elif consecutive_p == 2:
-                snap_standing = color("PROBATION (P2)", RED)
-            else:
-                snap_standing = color("DISMISSAL", RED)
-                dismissed = True
-        else:
-            consecutive_p = 0
+        current_sem = snap["semester"]
+        snap_cgpa = snap["cgpa"]
+        snap_credits = snap["gpa_credits"]
+
+        # Standing for this cumulative snapshot
+        consecutive_p = snap["consecutive_p"]
+        if consecutive_p == 0:
             snap_standing = color("NORMAL", GREEN)
+        elif consecutive_p == 1:
+            snap_standing = color("PROBATION (P1)", YELLOW)
+        elif consecutive_p == 2:
+            snap_standing = color("PROBATION (P2)", RED)
+        else:
+            snap_standing = color("DISMISSAL", RED)
+            dismissed = True
 
         print(header_bar(f"SEMESTER: {current_sem}", width=60))
         
-        # Determine courses specifically taken THIS semester
-        sem_records = [r for r in records if r.semester == current_sem]
+        # Courses specifically taken THIS semester
+        sem_records = snap["records"]
         
         headers = ["Code", "Course Name", "Cr", "Grade", "GP", "QP"]
         raw_rows = []
@@ -300,7 +290,7 @@ Examples:
                         help="Program: CSE or BBA")
     args = parser.parse_args()
 
-    if not os.path.isfile(args.transcript):
+    if not transcript_exists(args.transcript):
         print(color(f"Error: File '{args.transcript}' not found.", RED))
         sys.exit(1)
 
@@ -309,7 +299,7 @@ Examples:
     # Level 1: Credit tallying (prerequisite)
     records, credits_attempted, credits_earned = process_transcript(args.transcript)
 
-    from engine.course_db import ALL_COURSES
+    from engine.catalog import ALL_COURSES
     unrecognized = set(r.course_code for r in records if r.course_code not in ALL_COURSES)
     if unrecognized:
         print(header_bar(f"LEVEL 2 — CGPA & STANDING REPORT ({program})"))
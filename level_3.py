@@ -20,21 +20,25 @@ except Exception:
     pass
 
 from engine.credit_engine import process_transcript
+from engine.archive import transcript_exists
 from engine.cgpa_engine import process_cgpa
 from engine.audit_engine import run_audit, build_graduation_roadmap
 
 # ─── Color helpers ───────────────────────────────────────
-try:
-    from colorama import init as colorama_init, Fore, Style
-    colorama_init(autoreset=True)
-    GREEN = Fore.GREEN
-    RED = Fore.RED
-    YELLOW = Fore.YELLOW
-    CYAN = Fore.CYAN
-    BOLD = Style.BRIGHT
-    RESET = Style.RESET_ALL
-except ImportError:
-    GREEN = RED = YELLOW = CYAN = BOLD = RESET = ""
+# colorama is only loaded for a terminal; piped or redirected output is plain
+GREEN = RED = YELLOW = CYAN = BOLD = RESET = ""
+if sys.stdout.isatty():
+    try:
+        from colorama import init as colorama_init, Fore, Style
+        colorama_init(autoreset=True)
+        GREEN = Fore.GREEN
+        RED = Fore.RED
+        YELLOW = Fore.YELLOW
+        CYAN = Fore.CYAN
+        BOLD = Style.BRIGHT
+        RESET = Style.RESET_ALL
+    except ImportError:
+        pass
 
 
 def color(text, clr):
@@ -128,7 +132,10 @@ def print_level3_report(filepath, program, records, credits_attempted, credits_e
         print(f"  {color('CAUTION:', RED)} Found {len(violations)} violation(s):\n")
         for v in violations:
             print(f"    {color('!', RED)} {v['course']} (taken in {v['semester']})")
-            print(f"       Missing: {color(', '.join(v['missing']), YELLOW)}")
+            if v["missing"]:
+                print(f"       Missing: {color(', '.join(v['missing']), YELLOW)}")
+            if v.get("transitive"):
+                print(f"       Also not yet passed (earlier in chain): {color(', '.join(v['transitive']), YELLOW)}")
 
     print("=" * 50)
 
@@ -170,12 +177,13 @@ def print_graduation_roadmap(roadmap):
     gap = roadmap["credit_gap"]
     est_sem = roadmap["estimated_semesters"]
     est_courses = roadmap["estimated_courses_left"]
+    plan = roadmap["semester_plan"]
     print(f"\n  {color('Summary:', BOLD)}")
     if gap > 0:
         print(f"    Credits still needed  : {color(str(gap), RED)}")
     if est_courses > 0:
         print(f"    Courses to complete   : {est_courses}")
-    print(f"    Estimated semesters   : ~{est_sem} (at 15 credits/semester)")
+    print(f"    Estimated semesters   : {est_sem} (prerequisite-aware, up to {plan['max_credits']} credits/semester)")
 
     priority_colors = {
         "CRITICAL": RED,
@@ -213,6 +221,12 @@ def print_graduation_roadmap(roadmap):
             else:
                 print(f"       {color(detail, YELLOW)}")
 
+    if plan["semesters"]:
+        print(f"\n  {color('Semester Plan:', BOLD)}")
+        for n, term in enumerate(plan["semesters"], 1):
+            load = sum(credits for _, credits in term)
+            print(f"    {n:>2}. {load:>2}cr  {', '.join(code for code, _ in term)}")
+
     print()
     print("=" * 50)
 
@@ -239,7 +253,7 @@ Examples:
                         help="BBA concentration/major area (required for BBA)")
     args = parser.parse_args()
 
-    if not os.path.isfile(args.transcript):
+    if not transcript_exists(args.transcript):
         print(color(f"Error: File '{args.transcript}' not found.", RED))
         sys.exit(1)
 
@@ -259,7 +273,7 @@ Examples:
     # Level 1: Credit tallying
     records, credits_attempted, credits_earned = process_transcript(args.transcript)
 
-    from engine.course_db import ALL_COURSES
+    from engine.catalog import ALL_COURSES
     unrecognized = set(r.course_code for r in records if r.course_code not in ALL_COURSES)
     if unrecognized:
         print(header_bar(f"LEVEL 3 — AUDIT REPORT ({program})"))